@@ -0,0 +1,93 @@
+"""
+Cold load against a load from the on-disk cache.
+
+Writes a large YAML file, then times a complete load (read, parse, merge,
+validate) and a load served from the cache by a fresh ConfigORM, as a new
+process would do.
+
+Usage:
+    python -m benchmarks.bench_cache --sections 200 --fields 20
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+import yaml
+from pydantic import create_model
+
+from py_configorm.core import ConfigORM, ConfigSchema
+from py_configorm.sources.yaml_source import YAMLSource
+
+
+def make_schema(sections: int, fields: int):
+    # Defined at module level, cached configurations must be picklable.
+    #
+    global Section, BenchConfig
+
+    types = (int, str, float, bool, List[str])
+    Section = create_model(
+        "Section",
+        __module__=__name__,
+        **{f"Field{f}": (types[f % len(types)], ...) for f in range(fields)},
+    )
+    BenchConfig = create_model(
+        "BenchConfig",
+        __base__=ConfigSchema,
+        __module__=__name__,
+        **{f"Section{s}": (Section, ...) for s in range(sections)},
+    )
+    return BenchConfig
+
+
+def make_data(sections: int, fields: int):
+    values = (1, "value", 1.5, True, ["a", "b", "c"])
+    return {
+        f"Section{s}": {f"Field{f}": values[f % len(values)] for f in range(fields)}
+        for s in range(sections)
+    }
+
+
+def run(sections: int, fields: int, repeat: int) -> dict:
+    schema = make_schema(sections, fields)
+    directory = Path(tempfile.mkdtemp())
+    path = directory / "config.yaml"
+    path.write_text(yaml.safe_dump(make_data(sections, fields)))
+    cache = directory / "config.cache"
+
+    cold, cached = float("inf"), float("inf")
+    for _ in range(repeat):
+        cache.unlink(missing_ok=True)
+        start = time.perf_counter()
+        ConfigORM(schema=schema, sources=[YAMLSource(filepath=path)], cache=cache).load()
+        cold = min(cold, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        ConfigORM(schema=schema, sources=[YAMLSource(filepath=path)], cache=cache).load()
+        cached = min(cached, time.perf_counter() - start)
+
+    return {
+        "sections": sections,
+        "fields": fields,
+        "file_bytes": path.stat().st_size,
+        "cache_bytes": cache.stat().st_size,
+        "cold_s": cold,
+        "cached_s": cached,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, default=200)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.sections, args.fields, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
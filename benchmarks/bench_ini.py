@@ -0,0 +1,105 @@
+"""
+INISource on large files: whole, selective and schema-typed loads, and saves.
+
+Writes an INI file of `--sections` sections of `--options` options each, and
+a schema declaring `--selected` of the sections, then times:
+
+- `load`: a whole load of the file, and with a schema decoding the options.
+- `orm_whole` / `orm_selective`: a ConfigORM load without and with
+  `selective=True`, which only parses the selected sections.
+- `save_one` / `save_changes_one` against `configparser_write`: saving the
+  data with one option changed with `save` (which compares every section)
+  and `save_changes` (which only parses the changed section, as
+  `ConfigORM.save` does), against writing the whole file with configparser.
+
+Usage:
+    python -m benchmarks.bench_ini --sections 5000 --options 20 --selected 5
+"""
+
+import argparse
+import configparser
+import itertools
+import json
+import tempfile
+from pathlib import Path
+
+from pydantic import create_model
+
+from benchmarks.bench_suite import best
+from benchmarks.generate import TYPES, VALUES
+from py_configorm.core import ConfigORM, ConfigSchema
+from py_configorm.sources.ini_source import INISource
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, default=5000)
+    parser.add_argument("--options", type=int, default=20)
+    parser.add_argument("--selected", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    values = {f"k{j}": str(VALUES[j % len(VALUES)]).lower() for j in range(args.options)}
+    section = create_model(
+        "Section", **{f"k{j}": (TYPES[j % len(TYPES)], ...) for j in range(args.options)}
+    )
+    schema = create_model(
+        "Selected",
+        __base__=ConfigSchema,
+        **{f"s{i}": (section, ...) for i in range(args.selected)},
+    )
+
+    directory = Path(tempfile.mkdtemp())
+    path = directory / "config.ini"
+    try:
+        writer = configparser.ConfigParser()
+        writer.read_dict({f"s{i}": values for i in range(args.sections)})
+        with open(path, "w") as f:
+            writer.write(f)
+
+        source = INISource(filepath=path, readonly=False)
+        data = source.load()
+        changes = itertools.count()
+
+        def configparser_write():
+            with open(path, "w") as f:
+                writer.write(f)
+
+        def save_one():
+            data["s0"] = dict(data["s0"], k0=str(next(changes)))
+            source.save(data)
+
+        def save_changes_one():
+            data["s0"] = dict(data["s0"], k0=str(next(changes)))
+            source.save_changes(data, {("s0", "k0"): data["s0"]["k0"]})
+
+        result = {
+            "sections": args.sections,
+            "options": args.options,
+            "selected": args.selected,
+            "bytes": path.stat().st_size,
+            "load_s": best(INISource(filepath=path).load, args.repeat),
+            "load_schema_s": best(INISource(filepath=path, schema=schema).load, args.repeat),
+        }
+        for selective in (False, True):
+            orm = ConfigORM(
+                schema=schema,
+                sources=[INISource(filepath=path, schema=schema)],
+                selective=selective,
+            )
+            result["orm_selective_s" if selective else "orm_whole_s"] = best(
+                orm.load, args.repeat
+            )
+        result["save_one_s"] = best(save_one, args.repeat)
+        result["save_changes_one_s"] = best(save_changes_one, args.repeat)
+        result["configparser_write_s"] = best(configparser_write, args.repeat)
+    finally:
+        for file in directory.iterdir():
+            file.unlink()
+        directory.rmdir()
+
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Peak RSS of loading large files, read against memory-mapped.
+
+Generates a configuration with `benchmarks.generate`, saves it with every
+file source, then loads each file in a fresh process with the file read into
+memory (`mmap_threshold=None`) and memory-mapped (`mmap_threshold=0`), and
+reports the load time and the growth of the peak RSS of the process during
+the load.
+
+Usage:
+    python -m benchmarks.bench_mmap --keys 1000000 --sources json,toml
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_suite import PREFIX, make_source
+from benchmarks.generate import generate, shape
+
+SOURCES = ("json", "toml", "yaml", "dotenv")
+
+
+def _peak_rss() -> int:
+    # Kilobytes on Linux, bytes on macOS.
+    #
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak * 1024 if sys.platform != "darwin" else peak
+
+
+def measure(kind: str, path: Path, mapped: bool):
+    """Load a file in this process and print the time and peak RSS growth."""
+    from py_configorm.sources.dotenv_source import DOTENVSource
+    from py_configorm.sources.json_source import JSONSource
+    from py_configorm.sources.toml_source import TOMLSource
+    from py_configorm.sources.yaml_source import YAMLSource
+
+    if kind == "dotenv":
+        source = DOTENVSource(filepath=path, prefix=PREFIX)
+    else:
+        cls = {"json": JSONSource, "toml": TOMLSource, "yaml": YAMLSource}[kind]
+        source = cls(filepath=path)
+    source.mmap_threshold = 0 if mapped else None
+
+    before = _peak_rss()
+    start = time.perf_counter()
+    source.load()
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"load_s": elapsed, "peak_rss_mb": (_peak_rss() - before) / 2**20}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keys", type=int, default=1000000)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--sources", default=",".join(SOURCES))
+    parser.add_argument("--measure", nargs=3, metavar=("SOURCE", "PATH", "MAPPED"))
+    args = parser.parse_args()
+
+    if args.measure is not None:
+        kind, path, mapped = args.measure
+        measure(kind, Path(path), mapped == "1")
+        return
+
+    directory = Path(tempfile.mkdtemp())
+    results = []
+    try:
+        for kind in args.sources.split(","):
+            width, _ = shape(args.keys, args.depth)
+            source = make_source(kind, directory, generate(width, args.depth, kind == "dotenv"))
+            result = {"source": kind, "bytes": source.filepath.stat().st_size}
+            for mapped, name in ((False, "read"), (True, "mmap")):
+                output = subprocess.run(
+                    [
+                        sys.executable,
+                        "-m",
+                        "benchmarks.bench_mmap",
+                        "--measure",
+                        kind,
+                        str(source.filepath),
+                        "1" if mapped else "0",
+                    ],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                ).stdout
+                result[name] = json.loads(output)
+            results.append(result)
+    finally:
+        for path in directory.iterdir():
+            path.unlink()
+        directory.rmdir()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Whole against selective loads, when the schema reads a fraction of the file.
+
+Generates a configuration with `benchmarks.generate` and a schema declaring
+only `--fraction` of its top-level sections, then times a ConfigORM load of
+every file source with and without `selective=True`, and the peak memory
+allocated while loading the source (measured with tracemalloc, so slower).
+
+Usage:
+    python -m benchmarks.bench_selective --keys 100000 --fraction 0.1
+"""
+
+import argparse
+import json
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from pydantic import create_model
+
+from benchmarks.bench_suite import best
+from benchmarks.generate import generate, make_schema, shape
+from py_configorm.core import ConfigORM, ConfigSchema
+from py_configorm.sources.json_source import JSONSource
+from py_configorm.sources.toml_source import TOMLSource
+from py_configorm.sources.yaml_source import YAMLSource
+
+SOURCES = {"json": JSONSource, "toml": TOMLSource, "yaml": YAMLSource}
+
+
+def _peak_mb(func) -> float:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keys", type=int, default=100000)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--fraction", type=float, default=0.1)
+    parser.add_argument("--sources", default=",".join(SOURCES))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    width, _ = shape(args.keys, args.depth)
+    data = generate(width, args.depth)
+    section = make_schema(width, args.depth - 1)
+    sections = max(1, round(width * args.fraction))
+    schema = create_model(
+        "Selected",
+        __base__=ConfigSchema,
+        **{f"k{i}": (section, ...) for i in range(sections)},
+    )
+
+    directory = Path(tempfile.mkdtemp())
+    results = []
+    try:
+        for kind in args.sources.split(","):
+            path = directory / f"config.{kind}"
+            SOURCES[kind](filepath=path, readonly=False).save(data)
+            source = SOURCES[kind](filepath=path)
+            result = {"source": kind, "sections": f"{sections}/{width}"}
+            for selective in (False, True):
+                orm = ConfigORM(schema=schema, sources=[source], selective=selective)
+                name = "selective" if selective else "whole"
+                result[f"{name}_s"] = best(orm.load, args.repeat)
+                result[f"{name}_peak_mb"] = _peak_mb(orm.load)
+            results.append(result)
+    finally:
+        for path in directory.iterdir():
+            path.unlink()
+        directory.rmdir()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Workers loading the configuration themselves against reading it from shared memory.
+
+Writes a large YAML file, starts `--workers` forked processes, then times,
+until every worker holds the configuration:
+
+- `independent`: every worker loads the file (read, parse, merge, validate)
+  at once, as the workers of a pre-fork server without a coordinator do.
+- `shared_reload`: the master reloads the changed file and publishes it
+  with `ConfigORM.share`, and every worker reads it with `ConfigWorker`.
+- `shared_unchanged`: every worker reads the configuration again while its
+  generation is unchanged.
+
+Usage:
+    python -m benchmarks.bench_shared --sections 200 --fields 20 --workers 8
+"""
+
+import argparse
+import json
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from benchmarks.bench_cache import make_data, make_schema
+from py_configorm.core import ConfigORM
+from py_configorm.shared import ConfigWorker
+from py_configorm.sources.yaml_source import YAMLSource
+
+
+def _load(schema, path, start, done):
+    start.wait()
+    ConfigORM(schema=schema, sources=[YAMLSource(filepath=path)]).load()
+    done.put(time.perf_counter())
+
+
+def _read(name, start, done, rounds):
+    worker = ConfigWorker(name, timeout=60)
+    worker.config
+    for changed in rounds:
+        start.wait()
+        generation = worker.generation
+        # Poll as a worker would between requests, without starving the master.
+        #
+        while worker.config is not None and changed and worker.generation == generation:
+            time.sleep(0.0001)
+        done.put(time.perf_counter())
+    worker.close()
+
+
+def _wall(workers, start, done, trigger=None):
+    """Time from the release of the workers to the last of them done."""
+    began = time.perf_counter()
+    start.wait()
+    if trigger is not None:
+        trigger()
+    return max(done.get() for _ in range(workers)) - began
+
+
+def run(sections: int, fields: int, workers: int, repeat: int) -> dict:
+    context = multiprocessing.get_context("fork")
+    schema = make_schema(sections, fields)
+    directory = Path(tempfile.mkdtemp())
+    path = directory / "config.yaml"
+    data = make_data(sections, fields)
+    path.write_text(yaml.safe_dump(data))
+
+    result = {"sections": sections, "fields": fields, "workers": workers}
+    try:
+        independent = float("inf")
+        for _ in range(repeat):
+            start, done = context.Barrier(workers + 1), context.Queue()
+            processes = [
+                context.Process(target=_load, args=(schema, path, start, done))
+                for _ in range(workers)
+            ]
+            for process in processes:
+                process.start()
+            independent = min(independent, _wall(workers, start, done))
+            for process in processes:
+                process.join()
+        result["independent_s"] = independent
+
+        shared_reload, shared_unchanged = float("inf"), float("inf")
+        orm = ConfigORM(schema=schema, sources=[YAMLSource(filepath=path)])
+        coordinator = orm.share(size=64 * 2**20)
+        try:
+            # Workers are forked after the master loaded, as in a pre-fork
+            # server, then wait for a reload or read again.
+            #
+            rounds = (True, False) * repeat
+            start, done = context.Barrier(workers + 1), context.Queue()
+            processes = [
+                context.Process(target=_read, args=(coordinator.name, start, done, rounds))
+                for _ in range(workers)
+            ]
+            for process in processes:
+                process.start()
+
+            for _ in range(repeat):
+                data["Section0"]["Field0"] += 1
+                path.write_text(yaml.safe_dump(data))
+                shared_reload = min(
+                    shared_reload, _wall(workers, start, done, orm.reload_config)
+                )
+                shared_unchanged = min(shared_unchanged, _wall(workers, start, done))
+            for process in processes:
+                process.join()
+        finally:
+            coordinator.close()
+        result["shared_reload_s"] = shared_reload
+        result["shared_unchanged_s"] = shared_unchanged
+    finally:
+        path.unlink()
+        directory.rmdir()
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, default=200)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.sections, args.fields, args.workers, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
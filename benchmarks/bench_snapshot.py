@@ -0,0 +1,107 @@
+"""
+Multi-threaded read throughput of ConfigORM snapshots while reloading.
+
+Reader threads repeatedly take a snapshot and read several settings from it,
+checking that they all belong to the same generation, while a writer thread
+rewrites the configuration file and reloads it in a loop.
+
+Usage:
+    python -m benchmarks.bench_snapshot --threads 8 --duration 3
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from py_configorm.core import ConfigORM, ConfigSchema
+from py_configorm.sources.json_source import JSONSource
+
+
+class ServiceConfig(BaseModel):
+    Host: str
+    Port: int
+    Generation: int
+
+
+class BenchConfig(ConfigSchema):
+    Service: ServiceConfig
+
+
+def _write(path: Path, n: int):
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(
+        f'{{"Service": {{"Host": "host-{n}", "Port": {n}, "Generation": {n}}}}}'
+    )
+    os.replace(tmp, path)
+
+
+def run(threads: int, duration: float, reload: bool) -> dict:
+    path = Path(tempfile.mkdtemp()) / "config.json"
+    _write(path, 0)
+    orm = ConfigORM(schema=BenchConfig, sources=[JSONSource(filepath=path)])
+    orm.load()
+
+    stop = threading.Event()
+    reads = [0] * threads
+    torn = [0] * threads
+    reloads = 0
+
+    def reader(slot: int):
+        count = errors = 0
+        while not stop.is_set():
+            for _ in range(1000):
+                service = orm.snapshot().config.Service
+                n = service.Port
+                if service.Host != f"host-{n}" or service.Generation != n:
+                    errors += 1
+            count += 1000
+        reads[slot] = count
+        torn[slot] = errors
+
+    def writer():
+        nonlocal reloads
+        n = 0
+        while not stop.is_set():
+            n += 1
+            _write(path, n)
+            if orm.reload_config():
+                reloads += 1
+
+    workers = [threading.Thread(target=reader, args=(i,)) for i in range(threads)]
+    if reload:
+        workers.append(threading.Thread(target=writer))
+
+    for worker in workers:
+        worker.start()
+    time.sleep(duration)
+    stop.set()
+    for worker in workers:
+        worker.join()
+
+    return {
+        "threads": threads,
+        "reloading": reload,
+        "reads_per_second": round(sum(reads) / duration),
+        "reloads": reloads,
+        "torn_reads": sum(torn),
+        "final_generation": orm.generation,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    for reload in (False, True):
+        print(run(args.threads, args.duration, reload))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Benchmark suite of the sources, merge, validation and reload.
+
+For every source type and configuration size, times loading, saving,
+merging a second layer over the loaded data, validating the merged data and
+reloading through ConfigORM after the source changed. Configurations are
+generated with `benchmarks.generate`.
+
+Results are printed (or written with `--output`) as JSON, and can be
+compared with a previous run with `--compare`, which exits with status 1 when
+a timing regressed by more than `--threshold`.
+
+Usage:
+    python -m benchmarks.bench_suite --keys 10,1000,100000 --output results.json
+    python -m benchmarks.bench_suite --compare results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pydantic
+
+from benchmarks.generate import count_keys, generate, make_schema, shape
+from py_configorm.core import ConfigORM
+from py_configorm.merge import merge
+from py_configorm.sources.base import BaseSource
+from py_configorm.sources.dotenv_source import DOTENVSource
+from py_configorm.sources.env_source import ENVSource
+from py_configorm.sources.json_source import JSONSource
+from py_configorm.sources.toml_source import TOMLSource
+from py_configorm.sources.yaml_source import YAMLSource
+
+PREFIX = "BENCH_"
+SOURCES = ("json", "toml", "yaml", "dotenv", "env")
+METRICS = ("load_s", "save_s", "merge_s", "validate_s", "reload_s")
+
+
+def best(func: Callable[[], Any], repeat: int) -> float:
+    elapsed = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed
+
+
+def _clear_env():
+    for key in [key for key in os.environ if key.startswith(PREFIX)]:
+        del os.environ[key]
+
+
+def make_source(kind: str, directory: Path, data: Dict[str, Any]) -> BaseSource:
+    """Write the data where a source of the given kind reads it."""
+    if kind == "env":
+        source = ENVSource(prefix=PREFIX, readonly=False)
+        source.save(data)
+        return source
+
+    if kind == "dotenv":
+        source = DOTENVSource(filepath=directory / "config.env", prefix=PREFIX, readonly=False)
+        source.save(data)
+        return source
+
+    cls = {"json": JSONSource, "toml": TOMLSource, "yaml": YAMLSource}[kind]
+    source = cls(filepath=directory / f"config.{kind}", readonly=False)
+    source.save(data)
+    return source
+
+
+def _touch(source: BaseSource, data: Dict[str, Any]):
+    """Change a source so that the next reload loads it again."""
+    if source.filepath is None:
+        keys = []
+        while isinstance(data, dict):
+            keys.append(next(iter(data)))
+            data = data[keys[-1]]
+        os.environ[PREFIX + "__".join(keys)] = str(time.perf_counter_ns())
+    else:
+        stat = os.stat(source.filepath)
+        os.utime(source.filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def run(kind: str, keys: int, depth: int, repeat: int) -> Dict[str, Any]:
+    """
+    Time one source type at one configuration size.
+
+    Returns:
+        dict: The configuration shape, the file size and the best time in
+            seconds of every metric, `None` for an unsupported operation.
+    """
+    strings = kind in ("dotenv", "env")
+    width, _ = shape(keys, depth)
+    data = generate(width, depth, strings)
+    overlay = generate(width, depth, strings, bump=1)
+    schema = make_schema(width, depth)
+
+    directory = Path(tempfile.mkdtemp())
+    try:
+        source = make_source(kind, directory, data)
+        loaded = source.load()
+        merged = merge([loaded, overlay])
+        validate = schema.__pydantic_validator__.validate_python
+
+        result = {
+            "source": kind,
+            "keys": count_keys(data),
+            "width": width,
+            "depth": depth,
+            "bytes": os.path.getsize(source.filepath) if source.filepath else None,
+            "load_s": best(source.load, repeat),
+            "save_s": None,
+            "merge_s": best(lambda: merge([loaded, overlay]), repeat),
+            "validate_s": best(lambda: validate(merged), repeat),
+        }
+
+        try:
+            result["save_s"] = best(lambda: source.save(loaded), repeat)
+        except (NotImplementedError, PermissionError):
+            pass
+
+        orm = ConfigORM(schema=schema, sources=[source])
+        orm.load()
+
+        def reload():
+            _touch(source, data)
+            orm.reload_config()
+
+        result["reload_s"] = best(reload, repeat)
+        return result
+    finally:
+        _clear_env()
+        for path in directory.iterdir():
+            path.unlink()
+        directory.rmdir()
+
+
+def _version(package: str) -> str | None:
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def suite(kinds: List[str], keys: List[int], depth: int, repeat: int) -> Dict[str, Any]:
+    return {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "py_configorm": _version("py_configorm"),
+            "pydantic": pydantic.VERSION,
+            "repeat": repeat,
+        },
+        "results": [run(kind, n, depth, repeat) for n in keys for kind in kinds],
+    }
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Timings of `new` slower than in `old` by more than `threshold` times.
+
+    Returns:
+        list: A description of every regression.
+    """
+    previous = {(r["source"], r["keys"]): r for r in old["results"]}
+    regressions = []
+    for result in new["results"]:
+        baseline = previous.get((result["source"], result["keys"]))
+        if baseline is None:
+            continue
+        for metric in METRICS:
+            before, after = baseline.get(metric), result.get(metric)
+            if before and after and after / before > threshold:
+                regressions.append(
+                    f"{result['source']} keys={result['keys']} {metric}: "
+                    f"{before:.6f}s -> {after:.6f}s ({after / before:.2f}x)"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sources", default=",".join(SOURCES))
+    parser.add_argument("--keys", default="10,1000,10000")
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args()
+
+    results = suite(
+        args.sources.split(","),
+        [int(n) for n in args.keys.split(",")],
+        args.depth,
+        args.repeat,
+    )
+
+    text = json.dumps(results, indent=2)
+    if args.output is not None:
+        args.output.write_text(text)
+    else:
+        print(text)
+
+    if args.compare is not None:
+        regressions = compare(json.loads(args.compare.read_text()), results, args.threshold)
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
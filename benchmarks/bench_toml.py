@@ -0,0 +1,66 @@
+"""
+TOML parser backends on large documents.
+
+Generates a configuration with `benchmarks.generate`, saves it with every
+installed TOML writer and loads it with every installed TOML reader, through
+TOMLSource, so the times include file I/O.
+
+Usage:
+    python -m benchmarks.bench_toml --keys 100000 --depth 3
+"""
+
+import argparse
+import json
+import os
+import tempfile
+from importlib.util import find_spec
+from pathlib import Path
+
+from benchmarks.bench_suite import best
+from benchmarks.generate import count_keys, generate, shape
+from py_configorm.sources.toml_source import READERS, WRITERS, TOMLSource
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keys", type=int, default=100000)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    width, _ = shape(args.keys, args.depth)
+    data = generate(width, args.depth)
+    path = Path(tempfile.mkdtemp()) / "config.toml"
+
+    results = []
+    try:
+        for writer in [w for w in WRITERS if find_spec(w) is not None]:
+            source = TOMLSource(filepath=path, readonly=False, writer=writer)
+            results.append(
+                {"backend": writer, "save_s": best(lambda: source.save(data), args.repeat)}
+            )
+
+        for reader in [r for r in READERS if find_spec(r) is not None]:
+            source = TOMLSource(filepath=path, reader=reader)
+            assert source.load() == data
+            results.append(
+                {"backend": reader, "load_s": best(source.load, args.repeat)}
+            )
+
+        print(
+            json.dumps(
+                {
+                    "keys": count_keys(data),
+                    "bytes": os.path.getsize(path),
+                    "results": results,
+                },
+                indent=2,
+            )
+        )
+    finally:
+        path.unlink(missing_ok=True)
+        path.parent.rmdir()
+
+
+if __name__ == "__main__":
+    main()
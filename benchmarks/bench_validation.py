@@ -0,0 +1,122 @@
+"""
+Full validation against subtree revalidation on reload.
+
+Builds a schema with many model sections, loads it, changes a single section
+and times merging and validating the new data, once with a full validation
+and once reusing the unchanged sections of the current configuration. File
+I/O and parsing are excluded.
+
+Also compares an eager load with a lazy load accessing only a few sections.
+
+Usage:
+    python -m benchmarks.bench_validation --sections 200 --fields 20
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from pydantic import create_model
+
+from py_configorm.core import ConfigORM, ConfigSchema
+from py_configorm.sources.json_source import JSONSource
+
+
+def make_schema(sections: int, fields: int):
+    types = (int, str, float, bool, List[str])
+    section = create_model(
+        "Section", **{f"Field{f}": (types[f % len(types)], ...) for f in range(fields)}
+    )
+    return create_model(
+        "BenchConfig",
+        __base__=ConfigSchema,
+        **{f"Section{s}": (section, ...) for s in range(sections)},
+    )
+
+
+def make_data(sections: int, fields: int, bump: int = 0):
+    values = (1, "value", 1.5, True, ["a", "b", "c"])
+    data = {
+        f"Section{s}": {f"Field{f}": values[f % len(values)] for f in range(fields)}
+        for s in range(sections)
+    }
+    data["Section0"]["Field0"] = bump
+    return data
+
+
+def run(sections: int, fields: int, repeat: int) -> dict:
+    schema = make_schema(sections, fields)
+    path = Path(tempfile.mkdtemp()) / "config.json"
+    path.write_text(json.dumps(make_data(sections, fields)))
+
+    orm = ConfigORM(schema=schema, sources=[JSONSource(filepath=path)])
+    orm.load()
+
+    full, incremental = float("inf"), float("inf")
+    for n in range(1, repeat + 1):
+        sources_data = [make_data(sections, fields, n)]
+
+        start = time.perf_counter()
+        orm._build(sources_data)
+        full = min(full, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        build = orm._build(sources_data, incremental=True)
+        incremental = min(incremental, time.perf_counter() - start)
+
+    stats = build.validation_stats
+    return {
+        "sections": sections,
+        "fields": fields,
+        "full_s": full,
+        "incremental_s": incremental,
+        "revalidated": len(stats.revalidated),
+        "reused": len(stats.reused),
+    }
+
+
+def run_lazy(sections: int, fields: int, repeat: int, accessed: int = 3) -> dict:
+    schema = make_schema(sections, fields)
+    path = Path(tempfile.mkdtemp()) / "config.json"
+    sources_data = [make_data(sections, fields)]
+
+    eager_orm = ConfigORM(schema=schema, sources=[JSONSource(filepath=path)])
+    lazy_orm = ConfigORM(schema=schema, sources=[JSONSource(filepath=path)], lazy=True)
+
+    eager, lazy = float("inf"), float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        eager_orm._build(sources_data)
+        eager = min(eager, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        config = lazy_orm._build(sources_data).config
+        for s in range(accessed):
+            getattr(config, f"Section{s}")
+        lazy = min(lazy, time.perf_counter() - start)
+
+    return {
+        "sections": sections,
+        "fields": fields,
+        "accessed": accessed,
+        "eager_s": eager,
+        "lazy_s": lazy,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, default=200)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.sections, args.fields, args.repeat)))
+    print(json.dumps(run_lazy(args.sections, args.fields, args.repeat)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Synthetic configurations for the benchmarks.
+
+A configuration is a tree of tables of uniform shape: every table has
+`width` keys, tables `depth - 1` levels down hold the values. Keys are named
+after their position (`k0`, `k1`, ...) and value types cycle through int,
+str, float and bool, so one model per level describes the whole tree and
+schemas stay cheap to build even for a million keys.
+
+Usage:
+    python -m benchmarks.generate --keys 1000 --depth 3
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, Tuple
+
+from pydantic import create_model
+
+from py_configorm.core import ConfigSchema
+
+VALUES = (1, "value", 1.5, True)
+TYPES = (int, str, float, bool)
+
+
+def shape(keys: int, depth: int) -> Tuple[int, int]:
+    """
+    Width giving about `keys` values at `depth`, and the actual key count.
+    """
+    width = max(1, round(keys ** (1 / depth)))
+    return width, width**depth
+
+
+def generate(
+    width: int, depth: int, strings: bool = False, bump: int = 0
+) -> Dict[str, Any]:
+    """
+    Generate a configuration.
+
+    Args:
+        width (int): Keys per table.
+        depth (int): Levels of tables, `1` for a flat table of values.
+        strings (bool): Whether values are strings, as read from environment
+            variables.
+        bump (int): Added to every integer value, to generate a changed
+            version of the same configuration.
+
+    Returns:
+        dict: The configuration data.
+    """
+    values = [value + bump if type(value) is int else value for value in VALUES]
+    if strings:
+        values = [str(value).lower() for value in values]
+
+    leaf = {f"k{i}": values[i % len(values)] for i in range(width)}
+
+    # Every table of a level has the same content, but they must be distinct
+    # objects, as they would be when parsed from a file.
+    #
+    def table(level: int) -> Dict[str, Any]:
+        if level == depth - 1:
+            return dict(leaf)
+        return {f"k{i}": table(level + 1) for i in range(width)}
+
+    return table(0)
+
+
+def make_schema(width: int, depth: int):
+    """
+    Schema of the configurations generated with the same width and depth.
+    """
+    model = create_model(
+        f"Level{depth - 1}",
+        __base__=ConfigSchema if depth == 1 else None,
+        **{f"k{i}": (TYPES[i % len(TYPES)], ...) for i in range(width)},
+    )
+    for level in range(depth - 2, -1, -1):
+        model = create_model(
+            f"Level{level}",
+            __base__=ConfigSchema if level == 0 else None,
+            **{f"k{i}": (model, ...) for i in range(width)},
+        )
+    return model
+
+
+def count_keys(data: Dict[str, Any]) -> int:
+    """Number of values in a configuration."""
+    return sum(count_keys(v) if isinstance(v, dict) else 1 for v in data.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keys", type=int, default=1000)
+    parser.add_argument("--depth", type=int, default=3)
+    args = parser.parse_args()
+
+    width, keys = shape(args.keys, args.depth)
+    print(json.dumps(generate(width, args.depth), indent=2))
+    print(f"width={width} depth={args.depth} keys={keys}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,56 @@
-from .core import ConfigORM, ConfigSchema
-from .sources.json_source import JSONSource
-from .sources.toml_source import TOMLSource
-from .sources.dotenv_source import DOTENVSource
-from .sources.yaml_source import YAMLSource
-from .sources.env_source import ENVSource
-
-__all__ = [
-    "ConfigORM",
-    "ConfigSchema",
-    "JSONSource",
-    "TOMLSource",
-    "DOTENVSource",
-    "YAMLSource",
-    "ENVSource",
-    "INISource"
-]
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core import ConfigORM, ConfigSchema, ConfigSnapshot, Provenance
+    from .merge import MergeStrategy
+    from .stats import Instrumentation, LoadStats
+    from .sources.base import AsyncBaseSource
+    from .sources.json_source import JSONSource, AsyncJSONSource
+    from .sources.toml_source import TOMLSource, AsyncTOMLSource
+    from .sources.dotenv_source import DOTENVSource, AsyncDOTENVSource
+    from .sources.yaml_source import YAMLSource, AsyncYAMLSource
+    from .sources.env_source import ENVSource, AsyncENVSource
+    from .sources.ini_source import INISource, AsyncINISource
+
+# Exports are imported on first access, so that importing the package doesn't
+# import pydantic or the parser of every source.
+#
+_EXPORTS = {
+    "ConfigORM": ".core",
+    "ConfigSchema": ".core",
+    "ConfigSnapshot": ".core",
+    "Provenance": ".core",
+    "MergeStrategy": ".merge",
+    "Instrumentation": ".stats",
+    "LoadStats": ".stats",
+    "AsyncBaseSource": ".sources.base",
+    "JSONSource": ".sources.json_source",
+    "TOMLSource": ".sources.toml_source",
+    "DOTENVSource": ".sources.dotenv_source",
+    "YAMLSource": ".sources.yaml_source",
+    "ENVSource": ".sources.env_source",
+    "INISource": ".sources.ini_source",
+    "AsyncJSONSource": ".sources.json_source",
+    "AsyncTOMLSource": ".sources.toml_source",
+    "AsyncDOTENVSource": ".sources.dotenv_source",
+    "AsyncYAMLSource": ".sources.yaml_source",
+    "AsyncENVSource": ".sources.env_source",
+    "AsyncINISource": ".sources.ini_source",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
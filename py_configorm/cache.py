@@ -0,0 +1,109 @@
+"""
+ConfigCache: On-disk cache of loaded configurations.
+
+This module provides the cache used by [py_configorm.core.ConfigORM][] to
+skip reading, parsing, merging and validating sources when none of them
+changed since the previous process stored its result.
+
+Attributes:
+    ConfigCache (ConfigCache): The ConfigCache class.
+"""
+
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Hashable
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the layout of cached entries changes.
+#
+FORMAT = 1
+
+
+class ConfigCache:
+    """
+    Single-entry on-disk cache of a loaded configuration.
+
+    An entry is stored under a key, the cache holds only the last entry
+    stored. The key is pickled first, followed by the entry, so a stale
+    entry is detected without unpickling its content.
+
+    Entries are written to a temporary file renamed over the cache file, so
+    concurrent readers see either the old or the new entry, and the last
+    writer wins. An unreadable cache file is treated as a miss.
+
+    Entries are pickled, the cache file must not be writable by anyone not
+    trusted to run code in the process.
+
+    Attributes:
+        path (Path): The cache file.
+    """
+
+    def __init__(self, path: Path | str):
+        self._path = Path(path)
+
+    def load(self, key: Hashable) -> Any | None:
+        """
+        Load the entry stored under a key.
+
+        Args:
+            key (Hashable): The key, compared with the stored key.
+
+        Returns:
+            Any | None: The entry, `None` if there is no entry for this key.
+        """
+        try:
+            with open(self._path, "rb") as f:
+                if pickle.load(f) != (FORMAT, key):
+                    return None
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning(
+                "Ignoring unreadable configuration cache %s", self._path, exc_info=True
+            )
+            return None
+
+    def store(self, key: Hashable, entry: Any):
+        """
+        Store an entry under a key, replacing the current entry.
+
+        Failures are logged, not raised, the cache is an optimization.
+
+        Args:
+            key (Hashable): The key.
+            entry (Any): The entry, must be picklable.
+        """
+        directory, name = os.path.split(os.path.abspath(self._path))
+        tmp = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((FORMAT, key), f, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self._path)
+        except Exception:
+            logger.warning(
+                "Failed to store configuration cache %s", self._path, exc_info=True
+            )
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except FileNotFoundError:
+                    pass
+
+    def clear(self):
+        """Remove the cache file."""
+        try:
+            os.unlink(self._path)
+        except FileNotFoundError:
+            pass
+
+    @property
+    def path(self) -> Path:
+        return self._path
@@ -5,25 +5,282 @@ This module contains the ConfigORM class, a class for handling configuration dat
 
 Classes:
     ConfigSchema (ConfigSchema): The ConfigSchema class.
+    ConfigSnapshot (ConfigSnapshot): The ConfigSnapshot class.
+    Provenance (Provenance): The Provenance class.
+    ValidationStats (ValidationStats): The ValidationStats class.
     ConfigORM (ConfigORM): The ConfigORM class.
 """
 
-from typing import List, Type
+import threading
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, NamedTuple, Tuple, Type
+import pydantic
 from pydantic import BaseModel
 
-from py_configorm.exception import ConfigORMError
-from py_configorm.sources.base import BaseSource
+from py_configorm.exception import ConfigORMError, ConfigORMSourceError
+from py_configorm.lazy import LazyConfig
+from py_configorm.merge import (
+    DELETED,
+    MergeStrategy,
+    compile_strategies,
+    diff,
+    get_path,
+    lookup_provenance,
+    merge,
+    patch,
+    select,
+)
+from py_configorm.sources.base import AsyncBaseSource, BaseSource
+from py_configorm.stats import (
+    Instrumentation,
+    LoadStats,
+    Recorder,
+    count_keys,
+    measure_aload,
+    measure_asave,
+    measure_load,
+    measure_save,
+)
+from py_configorm.validators.schema import (
+    compiled_validator,
+    field_selection,
+    freeze,
+    model_type,
+    schema_digest,
+)
+from py_configorm.validators.schema import merge_strategies as schema_merge_strategies
+
+if TYPE_CHECKING:
+    from py_configorm.cache import ConfigCache
+    from py_configorm.shared import ConfigCoordinator
+    from py_configorm.watcher import ConfigWatcher
+    from py_configorm.writer import WriteBehind
+
+
+_MISSING = object()
+_NO_STAGE = nullcontext()
+
+# Executor classes of `concurrent.futures`, imported on first use.
+#
+EXECUTORS = {
+    "thread": "ThreadPoolExecutor",
+    "process": "ProcessPoolExecutor",
+}
+
+
+def _make_executor(executor: str, max_workers: int | None):
+    import concurrent.futures
+
+    return getattr(concurrent.futures, EXECUTORS[executor])(max_workers=max_workers)
 
 
 class ConfigSchema(BaseModel):
     pass
 
 
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    Immutable, versioned view of a configuration.
+
+    Every successful load or reload publishes a new snapshot with a strictly
+    greater generation. A snapshot is never modified once published: its
+    configuration is a frozen copy of [py_configorm.core.ConfigORM.config][],
+    which rejects assignment and changes to the containers it holds, and
+    changes made to `ConfigORM.config` before a save don't show in it, see
+    [py_configorm.validators.schema.freeze][].
+
+    Attributes:
+        generation (int): Monotonically increasing version, starts at `1`.
+        config (ConfigSchema): The validated configuration, frozen.
+    """
+
+    generation: int
+    config: ConfigSchema
+
+
+@dataclass(frozen=True)
+class Provenance:
+    """
+    Where a configuration value comes from.
+
+    Attributes:
+        path (str): Dotted path of the value.
+        source_index (int): Index of the source which set the value.
+        source_type (str): Class name of that source.
+        filepath (Path | None): File of that source, if any.
+        value (Any): The value set by that source, before validation.
+        overridden (Any): The value it replaced, `None` if there was none.
+    """
+
+    path: str
+    source_index: int
+    source_type: str
+    filepath: Path | None
+    value: Any
+    overridden: Any
+
+
+@dataclass
+class ValidationStats:
+    """
+    What a load or reload validated.
+
+    Attributes:
+        revalidated (List[str]): Top-level model sections which were validated.
+        reused (List[str]): Top-level model sections reused as they were from
+            the previous configuration because their input did not change.
+    """
+
+    revalidated: List[str] = field(default_factory=list)
+    reused: List[str] = field(default_factory=list)
+
+
+class _Build(NamedTuple):
+    config: ConfigSchema
+    config_data: Dict[str, Any]
+    provenance: Dict[str, Tuple[int, Any, Any]] | None
+    validation_stats: ValidationStats
+    dump: Dict[str, Any] | None
+
+
 class ConfigORM:
-    def __init__(self, schema: Type[ConfigSchema], sources: List[BaseSource]):
+    """
+    Configuration ORM.
+
+    Loads configuration data from a list of sources, merges it in list order
+    (last source has the highest precedence) and validates it against a
+    [py_configorm.core.ConfigSchema][] subclass.
+
+    By default sources are loaded one after the other. With `parallel=True`
+    all sources are fetched and parsed at the same time on a thread pool (or
+    a process pool with `executor="process"`, which requires picklable
+    sources), and the results are merged in the original list order, so
+    precedence does not depend on which source finishes first.
+
+    The data returned by every source is kept along with the source
+    fingerprint, so `reload_config` only loads again the sources which
+    changed. Reloads are serialized, and the new configuration is published
+    as a new [py_configorm.core.ConfigSnapshot][] with a single reference
+    assignment once it is validated, see [py_configorm.core.ConfigORM.snapshot][]
+    for consistent lock-free reads and [py_configorm.core.ConfigORM.watch][]
+    for hot reload.
+
+    Changes made to the configuration are tracked by comparing it with the
+    state of the last load or save, see [py_configorm.core.ConfigORM.save][].
+    With `write_behind`, saves are handed over to a background writer which
+    coalesces them, see [py_configorm.writer.WriteBehind][].
+
+    With `cache`, the result of a load is stored on disk, keyed by the schema
+    and the fingerprints of all the sources. The next `load` in any process
+    uses it directly, without reading, merging or validating anything, as
+    long as no source changed, see [py_configorm.cache.ConfigCache][].
+
+    With [py_configorm.core.ConfigORM.share][], every configuration loaded is
+    also published to a shared memory segment, from which worker processes
+    read it, see [py_configorm.shared][].
+
+    Attributes:
+        schema (Type[ConfigSchema]): The configuration schema.
+        sources (List[BaseSource]): The configuration sources.
+        parallel (bool): Whether to load sources concurrently, default is `False`.
+        max_workers (int | None): Maximum number of concurrent workers, default
+            is the executor default.
+        executor (str): `"thread"` or `"process"`, default is `"thread"`.
+        content_hash (bool): Whether file fingerprints include a hash of the
+            file content, default is `False` (metadata only).
+        merge_strategies (Dict[str, MergeStrategy] | None): Merge strategies
+            keyed by dotted path, on top of the ones declared on the schema,
+            see [py_configorm.merge][].
+        track_provenance (bool): Whether to record which source set each
+            value, see [py_configorm.core.ConfigORM.provenance][], default is
+            `False`.
+        lazy (bool): Whether to validate each top-level section only on first
+            access, see [py_configorm.lazy.LazyConfig][], default is `False`.
+        write_behind (float | None): Coalescing window in seconds of
+            background saves, default is `None` (`save` writes synchronously).
+        cache (Path | str | None): File caching the loaded configuration,
+            default is `None` (no cache). The schema must be picklable.
+        instrumentation (Instrumentation | bool): `True` or an
+            [py_configorm.stats.Instrumentation][] to collect timings of every
+            load, reload and save, see [py_configorm.core.ConfigORM.load_stats][],
+            default is `False`.
+        selective (bool): Whether read-only sources load only the keys the
+            schema reads, see [py_configorm.sources.base.BaseSource.load_selected][],
+            default is `False`.
+    """
+
+    def __init__(
+        self,
+        schema: Type[ConfigSchema],
+        sources: List[BaseSource],
+        parallel: bool = False,
+        max_workers: int | None = None,
+        executor: str = "thread",
+        content_hash: bool = False,
+        merge_strategies: Dict[str, MergeStrategy] | None = None,
+        track_provenance: bool = False,
+        lazy: bool = False,
+        write_behind: float | None = None,
+        cache: Path | str | None = None,
+        instrumentation: Instrumentation | bool = False,
+        selective: bool = False,
+    ):
+        if executor not in EXECUTORS:
+            raise ConfigORMError(
+                f"Unknown executor '{executor}', expected one of {list(EXECUTORS)}"
+            )
+
         self._schema = schema
+        self._strategies = compile_strategies(
+            {
+                **schema_merge_strategies(schema),
+                **{
+                    tuple(path.split(".")): MergeStrategy(strategy)
+                    for path, strategy in (merge_strategies or {}).items()
+                },
+            }
+        )
         self._sources = sources
-        self._config = None
+        self._snapshot: ConfigSnapshot | None = None
+        self._generation = 0
+        self._fingerprints: List[Hashable | None] = []
+        self._sources_data: List[Dict[str, Any]] = []
+        self._content_hash = content_hash
+        self._track_provenance = track_provenance
+        self._lazy = lazy
+        self._build_state: _Build | None = None
+        self._saved_data: Dict[str, Any] | None = None
+        self._stale_writes = False
+        self._validator = compiled_validator(schema)
+        self._selection = field_selection(schema) if selective else None
+        self._sections = [
+            (field_info.alias or name, name, model)
+            for name, field_info in schema.model_fields.items()
+            if (model := model_type(field_info.annotation)) is not None
+        ]
+        self._lock = threading.RLock()
+        self._parallel = parallel
+        self._max_workers = max_workers
+        self._executor = executor
+        self._cache: "ConfigCache | None" = None
+        if cache is not None:
+            from py_configorm.cache import ConfigCache
+
+            self._cache = ConfigCache(cache)
+        self._instrumentation = (
+            Instrumentation() if instrumentation is True else instrumentation or None
+        )
+        self._load_stats: LoadStats | None = None
+        self._save_stats: LoadStats | None = None
+        self._coordinator: "ConfigCoordinator | None" = None
+        self._writer: "WriteBehind | None" = None
+        if write_behind is not None:
+            from py_configorm.writer import WriteBehind
+
+            self._writer = WriteBehind(self._write, write_behind)
 
     def load(self) -> ConfigSchema:
         """
@@ -33,63 +290,1071 @@ class ConfigORM:
         during the initialization of this class. The configuration data is
         merged together and returned as a single `ConfigSchema` object.
 
+        The loaded configuration becomes the current configuration, see
+        [py_configorm.core.ConfigORM.config][].
+
         Returns:
             ConfigSchema: The loaded configuration data.
+
+        Raises:
+            ConfigORMSourceError: If one or more sources fail to load in
+                parallel mode.
         """
-        config_data = {}
         try:
-
-            def merge_config(data, new_data):
-                for key, value in new_data.items():
-                    if isinstance(value, dict) and key in data:
-                        merge_config(data[key], value)
-                    else:
-                        data[key] = value
-
             if len(self._sources) == 0:
                 raise ConfigORMError("No configuration sources specified")
 
-            for source in self._sources:
-                merge_config(config_data, source.load())
-
-            return self._schema(**config_data)
+            with self._lock, self._record("load") as recorder:
+                fingerprints = self._fingerprint_sources()
+                cached = self._load_cache(fingerprints)
+                if cached is not None:
+                    sources_data, build = cached
+                    if recorder is not None:
+                        recorder.stats.cached = True
+                else:
+                    sources_data = self._load_sources(
+                        list(range(len(self._sources))), recorder
+                    )
+                    build = self._build(sources_data, recorder=recorder)
+                    self._store_cache(fingerprints, sources_data, build)
+                self._commit(fingerprints, sources_data, build, recorder)
+                return build.config
         except Exception as e:
             raise e
 
+    def _record(self, operation: str) -> "Recorder | nullcontext":
+        """
+        Context manager collecting the statistics of an operation, yields
+        `None` when the ORM is not instrumented.
+        """
+        if self._instrumentation is None:
+            return _NO_STAGE
+        return Recorder(self._instrumentation, operation, {"sources": len(self._sources)})
+
+    def _load_sources(
+        self, indices: List[int], recorder: Recorder | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Load raw data from the sources at the given indices, in that order.
+
+        In parallel mode every source is loaded even if some of them fail, and
+        all the failures are reported together.
+
+        Args:
+            indices (list): Indices into the source list.
+            recorder (Recorder | None): Collects the statistics of each source.
+
+        Returns:
+            list: The data loaded from each source.
+
+        Raises:
+            ConfigORMSourceError: If one or more sources fail in parallel mode.
+        """
+        sources = [self._sources[index] for index in indices]
+        calls = [self._load_call(index, recorder) for index in indices]
+
+        if not self._parallel or len(sources) < 2:
+            results = [call[0](*call[1:]) for call in calls]
+        else:
+            with _make_executor(self._executor, self._max_workers) as executor:
+                futures = [executor.submit(*call) for call in calls]
+
+            results, errors = [], []
+            for index, source, future in zip(indices, sources, futures):
+                error = future.exception()
+                if error is None:
+                    results.append(future.result())
+                else:
+                    errors.append((index, source, error))
+
+            if errors:
+                self._raise_source_errors(errors)
+
+        if recorder is not None:
+            for _, stats in results:
+                recorder.source(stats)
+            results = [data for data, _ in results]
+
+        return results
+
+    def _selection_of(self, source: BaseSource) -> Dict[str, Any] | None:
+        """
+        Keys to load from a source, `None` for everything.
+
+        Writable sources are always loaded whole, as their data is written
+        back when saving.
+        """
+        return self._selection if source.readonly else None
+
+    def _load_call(self, index: int, recorder: Recorder | None) -> Tuple:
+        """The function loading a source and its arguments."""
+        source = self._sources[index]
+        selection = self._selection_of(source)
+        if recorder is not None:
+            return (measure_load, index, source, selection)
+        if selection is not None:
+            return (source.load_selected, selection)
+        return (source.load,)
+
+    def _raise_source_errors(
+        self, errors: List[Tuple[int, BaseSource, BaseException]], action: str = "load"
+    ):
+        """
+        Raise a single error describing every failed source.
+
+        Args:
+            errors (list): `(index, source, exception)` tuples.
+            action (str): What failed, `"load"` or `"save"`.
+
+        Raises:
+            ConfigORMSourceError: Always.
+        """
+        details = "\n".join(
+            f"  [{index}] {source!r}: {type(error).__name__}: {error}"
+            for index, source, error in errors
+        )
+        raise ConfigORMSourceError(
+            f"Failed to {action} {len(errors)} of {len(self._sources)} "
+            f"configuration sources:\n{details}",
+            errors,
+        ) from errors[0][2]
+
+    def _cache_key(self, fingerprints: List[Hashable | None]) -> Hashable | None:
+        """
+        Key of the cached configuration built from sources in a given state.
+
+        The key covers everything the cached result depends on: the schema
+        and pydantic versions, the ORM options and the type, file, options
+        and fingerprint of every source, see
+        [py_configorm.sources.base.BaseSource.cache_options][].
+
+        Returns:
+            Hashable | None: The key, `None` if a source has no fingerprint
+                and the cache can't be used.
+        """
+        if any(fingerprint is None for fingerprint in fingerprints):
+            return None
+
+        return (
+            schema_digest(self._schema),
+            pydantic.VERSION,
+            repr(self._strategies),
+            self._track_provenance,
+            self._lazy,
+            self._selection is not None,
+            tuple(
+                (
+                    type(source).__module__,
+                    type(source).__qualname__,
+                    str(source.filepath),
+                    source.cache_options(),
+                )
+                for source in self._sources
+            ),
+            tuple(fingerprints),
+        )
+
+    def _load_cache(
+        self, fingerprints: List[Hashable | None]
+    ) -> "Tuple[List[Dict[str, Any]], _Build] | None":
+        """
+        The cached source data and build, if the sources did not change.
+        """
+        if self._cache is None or (key := self._cache_key(fingerprints)) is None:
+            return None
+
+        entry = self._cache.load(key)
+        if entry is None:
+            return None
+
+        sources_data, config_data, provenance, config, dump = entry
+        if self._lazy:
+            config = LazyConfig(self._schema, config_data)
+            stats = ValidationStats()
+        else:
+            stats = ValidationStats(reused=[name for _, name, _ in self._sections])
+        return sources_data, _Build(config, config_data, provenance, stats, dump)
+
+    def _store_cache(
+        self,
+        fingerprints: List[Hashable | None],
+        sources_data: List[Dict[str, Any]],
+        build: "_Build",
+    ):
+        if self._cache is None or (key := self._cache_key(fingerprints)) is None:
+            return
+
+        config = None if self._lazy else build.config
+        self._cache.store(
+            key,
+            (sources_data, build.config_data, build.provenance, config, build.dump),
+        )
+
+    def _fingerprint_sources(self) -> List[Hashable | None]:
+        return [source.fingerprint(self._content_hash) for source in self._sources]
+
+    def _changed_sources(self, fingerprints: List[Hashable | None]) -> List[int]:
+        """
+        Find the sources which changed since the last load.
+
+        Args:
+            fingerprints (list): The current fingerprint of every source.
+
+        Returns:
+            list: Indices of the sources which must be loaded again.
+        """
+        return [
+            index
+            for index, (old, new) in enumerate(zip(self._fingerprints, fingerprints))
+            if new is None or new != old
+        ]
+
+    def _prepare(
+        self, build: "_Build"
+    ) -> Tuple[Any, "ConfigCoordinator | None", bytes | None]:
+        """
+        The frozen copy of a configuration, the coordinator it is shared with
+        and its payload, see `_commit`. Async loads prepare them on a worker
+        thread.
+
+        Raises:
+            ConfigORMError: If the configuration doesn't fit the segment.
+        """
+        # Sections holding the same values as in the current snapshot are
+        # shared with it.
+        #
+        if isinstance(build.config, LazyConfig):
+            frozen = LazyConfig(self._schema, build.config_data, frozen=True)
+        else:
+            snapshot = self._snapshot
+            frozen = freeze(build.config, None if snapshot is None else snapshot.config)
+
+        coordinator = self._coordinator
+        return frozen, coordinator, self._payload(build)
+
+    def _commit(
+        self,
+        fingerprints: List[Hashable | None],
+        sources_data: List[Dict[str, Any]],
+        build: "_Build",
+        recorder: Recorder | None = None,
+        prepared: "Tuple[Any, ConfigCoordinator | None, bytes | None] | None" = None,
+    ):
+        """
+        Make a validated configuration current, along with the source state it
+        was built from.
+
+        The configuration is published as a new snapshot with a single
+        reference assignment, readers never observe a partial update.
+        """
+        # A configuration which can't be shared isn't made current either,
+        # workers never fall behind.
+        #
+        frozen, coordinator, payload = (
+            self._prepare(build) if prepared is None else prepared
+        )
+
+        with self._lock:
+            if self._coordinator is not coordinator or (
+                coordinator is not None and coordinator.closed
+            ):
+                payload = self._payload(build)
+            self._fingerprints = fingerprints
+            self._sources_data = sources_data
+            self._build_state = build
+            self._saved_data = build.dump
+            if self._writer is not None and self._writer.pending:
+                self._stale_writes = True
+            self._generation += 1
+            self._snapshot = ConfigSnapshot(self._generation, frozen)
+            if payload is not None:
+                self._coordinator.write(self._generation, payload)
+            if recorder is not None:
+                recorder.stats.generation = self._generation
+                self._load_stats = recorder.stats
+
+    def _build(
+        self,
+        sources_data: List[Dict[str, Any]],
+        incremental: bool = False,
+        recorder: Recorder | None = None,
+    ) -> "_Build":
+        """
+        Merge data loaded from the sources, later sources take precedence, and
+        validate the result.
+
+        See [py_configorm.merge.merge][], source data is never modified.
+
+        Args:
+            sources_data (list): The data loaded from each source, in source
+                list order.
+            incremental (bool): Whether sections of the current configuration
+                can be reused, see `_validate`.
+            recorder (Recorder | None): Collects merge and validation timings.
+
+        Returns:
+            _Build: The validated configuration, the merged data, the
+                provenance records, if tracked, and the dump changes are
+                tracked against, if there is a writable source.
+        """
+        provenance = {} if self._track_provenance else None
+        with _NO_STAGE if recorder is None else recorder.stage("merge"):
+            config_data = merge(sources_data, self._strategies, provenance)
+        with self._lock:
+            previous, snapshot = self._build_state, self._snapshot
+        with _NO_STAGE if recorder is None else recorder.stage("validate"):
+            config, stats = self._validate(
+                config_data,
+                previous if incremental else None,
+                None if snapshot is None else snapshot.config,
+            )
+        if recorder is not None:
+            recorder.stats.keys = count_keys(config_data)
+        dump = None
+        if not self._lazy and any(not source.readonly for source in self._sources):
+            dump = config.model_dump()
+        return _Build(config, config_data, provenance, stats, dump)
+
+    def _validate(
+        self,
+        config_data: Dict[str, Any],
+        previous: "_Build | None" = None,
+        published: Any = None,
+    ) -> Tuple[ConfigSchema, "ValidationStats"]:
+        """
+        Validate merged configuration data against the schema.
+
+        In lazy mode nothing is validated here, see
+        [py_configorm.lazy.LazyConfig][].
+
+        With a previous build, top-level sections typed as models whose merged
+        input did not change are not validated again, the already validated
+        models of the previous configuration are passed in instead (pydantic
+        accepts model instances as they are). Note that these models are then
+        shared by both configurations. Models changed since they were
+        published, i.e. holding unsaved changes, are validated again from
+        the merged data instead.
+
+        Args:
+            config_data (dict): The merged configuration data.
+            previous (_Build | None): The build of the current configuration.
+            published (ConfigSchema | None): The frozen copy of the current
+                configuration, see [py_configorm.core.ConfigSnapshot][].
+
+        Returns:
+            tuple: The validated configuration and validation statistics.
+        """
+        stats = ValidationStats()
+        if self._lazy:
+            return LazyConfig(self._schema, config_data), stats
+
+        data = config_data
+
+        for key, name, model in self._sections:
+            if key not in config_data:
+                continue
+
+            if previous is not None:
+                section = config_data[key]
+                previous_section = previous.config_data.get(key, _MISSING)
+                value = getattr(previous.config, name, None)
+                if (
+                    isinstance(value, model)
+                    and (section is previous_section or section == previous_section)
+                    and value == getattr(published, name, _MISSING)
+                ):
+                    if data is config_data:
+                        data = dict(config_data)
+                    data[key] = value
+                    stats.reused.append(name)
+                    continue
+
+            stats.revalidated.append(name)
+
+        return self._validator(data), stats
+
+    async def aload(self) -> ConfigSchema:
+        """
+        Load configuration data from all the sources without blocking the event loop.
+
+        All sources are loaded concurrently. Sources implementing
+        [py_configorm.sources.base.AsyncBaseSource][] are awaited directly, any
+        other source is loaded on a worker thread. Schema validation, the
+        frozen copy of the snapshot and the shared memory payload are also
+        made on a worker thread.
+
+        Returns:
+            ConfigSchema: The loaded configuration data.
+
+        Raises:
+            ConfigORMSourceError: If one or more sources fail to load.
+        """
+        import asyncio
+
+        if len(self._sources) == 0:
+            raise ConfigORMError("No configuration sources specified")
+
+        with self._record("load") as recorder:
+            fingerprints = await asyncio.to_thread(self._fingerprint_sources)
+            cached = await asyncio.to_thread(self._load_cache, fingerprints)
+            if cached is not None:
+                sources_data, build = cached
+                if recorder is not None:
+                    recorder.stats.cached = True
+            else:
+                sources_data = await self._aload_sources(
+                    list(range(len(self._sources))), recorder
+                )
+                build = await asyncio.to_thread(
+                    self._build, sources_data, recorder=recorder
+                )
+                await asyncio.to_thread(
+                    self._store_cache, fingerprints, sources_data, build
+                )
+            prepared = await asyncio.to_thread(self._prepare, build)
+            self._commit(fingerprints, sources_data, build, recorder, prepared)
+            return build.config
+
+    async def _aload_sources(
+        self, indices: List[int], recorder: Recorder | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Load raw data from the sources at the given indices concurrently.
+
+        Args:
+            indices (list): Indices into the source list.
+            recorder (Recorder | None): Collects the statistics of each source.
+
+        Returns:
+            list: The data loaded from each source.
+
+        Raises:
+            ConfigORMSourceError: If one or more sources fail to load.
+        """
+        import asyncio
+
+        results = await asyncio.gather(
+            *(self._aload_source(index, recorder) for index in indices),
+            return_exceptions=True,
+        )
+
+        errors = [
+            (index, self._sources[index], result)
+            for index, result in zip(indices, results)
+            if isinstance(result, BaseException)
+        ]
+        if errors:
+            self._raise_source_errors(errors)
+
+        if recorder is not None:
+            for _, stats in results:
+                recorder.source(stats)
+            results = [data for data, _ in results]
+
+        return results
+
+    async def _aload_source(self, index: int, recorder: Recorder | None = None):
+        import asyncio
+
+        source = self._sources[index]
+        if isinstance(source, AsyncBaseSource):
+            if recorder is None:
+                return select(await source.aload(), self._selection_of(source))
+            return await measure_aload(index, source, self._selection_of(source))
+
+        return await asyncio.to_thread(*self._load_call(index, recorder))
+
+    async def _asave_source(
+        self,
+        index: int,
+        data: Dict[str, Any],
+        changes: Dict[Tuple[str, ...], Any],
+        recorder: Recorder | None = None,
+    ):
+        import asyncio
+
+        source = self._sources[index]
+        if isinstance(source, AsyncBaseSource):
+            if recorder is None:
+                return await source.asave_changes(data, changes)
+            return await measure_asave(index, source, data, changes)
+
+        if recorder is None:
+            return await asyncio.to_thread(source.save_changes, data, changes)
+        return await asyncio.to_thread(measure_save, index, source, data, changes)
+
+    def _dump(self) -> Dict[str, Any]:
+        """
+        Dump the current configuration.
+
+        Raises:
+            ConfigORMError: If the configuration was never loaded.
+        """
+        config = self.config
+        if config is None:
+            raise ConfigORMError("Configuration is not loaded")
+        return config.model_dump()
+
+    def _changes(self, dump: Dict[str, Any]) -> Dict[Tuple[str, ...], Any]:
+        """
+        Changes made to a configuration dump since the last load or save.
+
+        When no dump was kept at load time (lazy mode, or no writable
+        source), the merged data is validated and dumped on first use, and
+        kept until the next load or save.
+
+        Args:
+            dump (dict): The configuration dump.
+
+        Returns:
+            dict: The changed values keyed by path.
+        """
+        saved = self._saved_data
+        if saved is None:
+            build = self._build_state
+            saved = compiled_validator(self._schema)(build.config_data).model_dump()
+            with self._lock:
+                if self._build_state is build and self._saved_data is None:
+                    self._saved_data = saved
+        return diff(saved, dump)
+
+    def _pending_writes(
+        self, changes: Dict[Tuple[str, ...], Any]
+    ) -> List[Tuple[int, Dict[str, Any], Dict[Tuple[str, ...], Any]]]:
+        """
+        What each writable source needs to save.
+
+        Sources which already hold every changed value are skipped.
+
+        Args:
+            changes (dict): The changed values keyed by path.
+
+        Returns:
+            list: `(index, data, changes)` tuples, the data last loaded from
+                the source patched with the changes relevant to it.
+        """
+        writes = []
+        for index, source in enumerate(self._sources):
+            if source.readonly:
+                continue
+
+            source_data = self._sources_data[index]
+            relevant = {}
+            for path, value in changes.items():
+                current = get_path(source_data, path, _MISSING)
+                if value is DELETED:
+                    if current is not _MISSING:
+                        relevant[path] = value
+                elif current is _MISSING or current != value:
+                    relevant[path] = value
+
+            if relevant:
+                writes.append((index, patch(source_data, relevant), relevant))
+
+        return writes
+
+    def _saved(
+        self,
+        dump: Dict[str, Any],
+        writes: List[Tuple[int, Dict[str, Any], Dict[Tuple[str, ...], Any]]],
+        errors: List[Tuple[int, BaseSource, BaseException]],
+    ):
+        """
+        Record the new state of the sources written by a save.
+
+        The saved dump becomes the state changes are tracked against only if
+        every source was written. Changes written behind (`dump` is None) are
+        tracked against since they were submitted, until a write fails.
+
+        Sources written behind a reload got changes made to the configuration
+        before it, they are loaded again on the next reload.
+
+        Raises:
+            ConfigORMSourceError: If one or more sources failed to save.
+        """
+        failed = {index for index, _, _ in errors}
+        with self._lock:
+            stale = dump is None and self._stale_writes
+            if dump is None:
+                self._stale_writes = False
+            sources_data = list(self._sources_data)
+            fingerprints = list(self._fingerprints)
+            for index, data, _ in writes:
+                if index not in failed:
+                    sources_data[index] = data
+                    fingerprints[index] = (
+                        None
+                        if stale
+                        else self._sources[index].fingerprint(self._content_hash)
+                    )
+            self._sources_data = sources_data
+            self._fingerprints = fingerprints
+            if dump is None:
+                if errors:
+                    self._saved_data = None
+            elif not errors:
+                self._saved_data = dump
+
+        if errors:
+            self._raise_source_errors(errors, "save")
+
+    def dirty_paths(self) -> List[str]:
+        """
+        Paths changed in the current configuration since the last load or save.
+
+        Returns:
+            list: Dotted paths of the changed values, sorted.
+
+        Raises:
+            ConfigORMError: If the configuration was never loaded.
+        """
+        changes = self._changes(self._dump())
+        return sorted(".".join(path) for path in changes)
+
     def save(self):
         """
-        Save configuration data to all the sources.
+        Save the changes made to the configuration to the writable sources.
+
+        Only the paths which changed since the last load or save are written,
+        each writable source gets the data it last loaded patched with them,
+        see [py_configorm.sources.base.BaseSource.save_changes][]. Sources
+        already holding every changed value are not written at all. Several
+        sources are written concurrently, file sources replace their file
+        atomically.
 
-        This method saves the configuration data to all the sources specified
-        during the initialization of this class.
+        In write-behind mode, the changes are handed over to the background
+        writer, nothing is written on the calling thread, see
+        [py_configorm.core.ConfigORM.flush][]. They are patched into the
+        sources as loaded when they are written, so a reload in the meantime
+        doesn't revert what changed in the sources.
 
         Raises:
-            PermissionError: If one of the sources is read-only.
+            ConfigORMError: If the configuration was never loaded.
+            ConfigORMSourceError: If one or more sources fail to save.
         """
+        if len(self._sources) == 0:
+            raise ConfigORMError("No configuration sources specified")
 
-        try:
-            if len(self._sources) == 0:
-                raise ConfigORMError("No configuration sources specified")
+        dump = self._dump()
+        if self._writer is not None:
+            self._submit(dump)
+            return
 
-            for source in self._sources:
-                if not source.readonly:
-                    source.save(self._config.model_dump())
-        except Exception as e:
-            raise e
+        with self._lock:
+            self._write(self._changes(dump), dump)
 
-    def reload_config(self):
+    def _submit(self, dump: Dict[str, Any]):
         """
-        Reload configuration data from all the sources.
+        Hand the changes of a configuration dump over to the background writer.
 
-        This method reloads the configuration data from all the sources specified
-        during the initialization of this class. The configuration data is
-        merged together and returned as a single `ConfigSchema` object.
+        Raises:
+            RuntimeError: If the writer is closed.
+        """
+        with self._lock:
+            self._writer.submit(self._changes(dump))
+            self._saved_data = dump
+
+    def _write(
+        self, changes: Dict[Tuple[str, ...], Any], dump: Dict[str, Any] | None = None
+    ):
+        """
+        Write configuration changes to the writable sources.
+
+        Args:
+            changes (dict): The changed values keyed by path.
+            dump (dict | None): The configuration dump the changes were
+                computed from, None when written behind.
+
+        Raises:
+            ConfigORMSourceError: If one or more sources fail to save.
+        """
+        with self._lock, self._record("save") as recorder:
+            writes = self._pending_writes(changes)
+            if recorder is None:
+                calls = [
+                    (self._sources[index].save_changes, data, changes_)
+                    for index, data, changes_ in writes
+                ]
+            else:
+                calls = [
+                    (measure_save, index, self._sources[index], data, changes_)
+                    for index, data, changes_ in writes
+                ]
+
+            results, errors = [], []
+            if len(calls) == 1:
+                try:
+                    results.append(calls[0][0](*calls[0][1:]))
+                except Exception as e:
+                    errors.append((writes[0][0], self._sources[writes[0][0]], e))
+            elif calls:
+                with _make_executor("thread", self._max_workers) as executor:
+                    futures = [executor.submit(*call) for call in calls]
+                for (index, _, _), future in zip(writes, futures):
+                    if future.exception() is not None:
+                        errors.append((index, self._sources[index], future.exception()))
+                    else:
+                        results.append(future.result())
+
+            if recorder is not None:
+                for stats in results:
+                    recorder.source(stats)
+                self._save_stats = recorder.stats
+
+            self._saved(dump, writes, errors)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until the saves handed over to the background writer are written.
+
+        Does nothing unless the ORM was created with `write_behind`.
+
+        Args:
+            timeout (float | None): Maximum time to wait.
+
+        Returns:
+            bool: Whether everything was written before the timeout.
+
+        Raises:
+            ConfigORMSourceError: If the last background write failed.
+        """
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+
+    def close(self, timeout: float | None = None):
+        """
+        Flush pending saves and stop the background writer, if any.
+
+        Args:
+            timeout (float | None): Maximum time to wait.
+        """
+        if self._writer is not None:
+            self._writer.close(timeout)
+
+    def reload_config(self) -> List[BaseSource]:
+        """
+        Reload configuration data from the sources which changed.
+
+        Every source is fingerprinted (see
+        [py_configorm.sources.base.BaseSource.fingerprint][]) and only the
+        sources whose fingerprint moved since the last load are loaded again,
+        the others contribute the data they returned last time. When no
+        fingerprint moved, merging and validation are skipped altogether and
+        the current configuration is kept.
+
+        Returns:
+            list: The sources which were actually loaded again.
+        """
+        with self._lock:
+            if self._snapshot is None or len(self._fingerprints) != len(self._sources):
+                self.load()
+                return list(self._sources)
+
+            with self._record("reload") as recorder:
+                fingerprints = self._fingerprint_sources()
+                changed = self._changed_sources(fingerprints)
+                if not changed:
+                    return []
+
+                sources_data = list(self._sources_data)
+                for index, data in zip(changed, self._load_sources(changed, recorder)):
+                    sources_data[index] = data
+
+                build = self._build(sources_data, incremental=True, recorder=recorder)
+                self._store_cache(fingerprints, sources_data, build)
+                self._commit(fingerprints, sources_data, build, recorder)
+                return [self._sources[index] for index in changed]
+
+    async def asave(self):
+        """
+        Save configuration data to all the sources without blocking the event loop.
+
+        See [py_configorm.core.ConfigORM.save][], writable sources are saved
+        concurrently.
+
+        Raises:
+            ConfigORMError: If the configuration was never loaded.
+            ConfigORMSourceError: If one or more sources fail to save.
+        """
+        import asyncio
+
+        if len(self._sources) == 0:
+            raise ConfigORMError("No configuration sources specified")
+
+        dump = await asyncio.to_thread(self._dump)
+        if self._writer is not None:
+            await asyncio.to_thread(self._submit, dump)
+            return
+
+        with self._record("save") as recorder:
+            changes = await asyncio.to_thread(self._changes, dump)
+            writes = await asyncio.to_thread(self._pending_writes, changes)
+            results = await asyncio.gather(
+                *(
+                    self._asave_source(index, data, changes_, recorder)
+                    for index, data, changes_ in writes
+                ),
+                return_exceptions=True,
+            )
+
+            errors = [
+                (index, self._sources[index], result)
+                for (index, _, _), result in zip(writes, results)
+                if isinstance(result, BaseException)
+            ]
+            if recorder is not None:
+                for result in results:
+                    if not isinstance(result, BaseException):
+                        recorder.source(result)
+                self._save_stats = recorder.stats
+
+            self._saved(dump, writes, errors)
+
+    async def areload_config(self) -> List[BaseSource]:
+        """
+        Reload configuration data from the sources which changed without
+        blocking the event loop.
+
+        See [py_configorm.core.ConfigORM.reload_config][] and
+        [py_configorm.core.ConfigORM.aload][].
+
+        Returns:
+            list: The sources which were actually loaded again.
+        """
+        import asyncio
+
+        if self._snapshot is None or len(self._fingerprints) != len(self._sources):
+            await self.aload()
+            return list(self._sources)
+
+        with self._record("reload") as recorder:
+            fingerprints = await asyncio.to_thread(self._fingerprint_sources)
+            changed = self._changed_sources(fingerprints)
+            if not changed:
+                return []
+
+            sources_data = list(self._sources_data)
+            for index, data in zip(changed, await self._aload_sources(changed, recorder)):
+                sources_data[index] = data
+
+            build = await asyncio.to_thread(self._build, sources_data, True, recorder)
+            await asyncio.to_thread(self._store_cache, fingerprints, sources_data, build)
+            prepared = await asyncio.to_thread(self._prepare, build)
+            self._commit(fingerprints, sources_data, build, recorder, prepared)
+            return [self._sources[index] for index in changed]
+
+    def watch(
+        self,
+        debounce: float = 0.2,
+        poll_interval: float = 1.0,
+        backend: str = "auto",
+        on_reload: Callable[[List[BaseSource]], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ) -> "ConfigWatcher":
         """
-        self._config = self.load()
+        Reload the configuration in the background when source files change.
+
+        The configuration is loaded first if it wasn't yet. See
+        [py_configorm.watcher.ConfigWatcher][] for the arguments.
+
+        Returns:
+            ConfigWatcher: The running watcher, call `stop()` to stop it.
+        """
+        from py_configorm.watcher import ConfigWatcher
+
+        if self._snapshot is None:
+            self.load()
+
+        return ConfigWatcher(
+            self,
+            debounce=debounce,
+            poll_interval=poll_interval,
+            backend=backend,
+            on_reload=on_reload,
+            on_error=on_error,
+        ).start()
+
+    def share(self, name: str | None = None, size: int | None = None) -> "ConfigCoordinator":
+        """
+        Publish the configuration to other processes through shared memory.
+
+        The configuration is loaded first if it wasn't yet. It is published
+        right away, and again on every later load or reload, e.g. by
+        [py_configorm.core.ConfigORM.watch][], so that worker processes
+        attached with [py_configorm.shared.ConfigWorker][] never load the
+        sources themselves. The schema must be picklable.
+
+        Args:
+            name (str | None): Name of the shared memory segment, default is
+                a random name, see [py_configorm.shared.ConfigCoordinator][].
+            size (int | None): Size of the segment in bytes, default is
+                `py_configorm.shared.SEGMENT_SIZE`.
+
+        Returns:
+            ConfigCoordinator: The coordinator, pass its `name` to the
+                workers and call `close()` to remove the segment.
+        """
+        from py_configorm.shared import SEGMENT_SIZE, ConfigCoordinator
+
+        with self._lock:
+            if self._snapshot is None:
+                self.load()
+
+            coordinator = ConfigCoordinator(name, SEGMENT_SIZE if size is None else size)
+            try:
+                self._coordinator = coordinator
+                coordinator.write(self._generation, self._payload(self._build_state))
+            except BaseException:
+                self._coordinator = None
+                coordinator.close()
+                raise
+            return coordinator
+
+    def _payload(self, build: "_Build") -> bytes | None:
+        """
+        A configuration pickled for the shared memory segment, `None` if it
+        isn't shared. A closed coordinator is detached from the ORM.
+
+        Raises:
+            ConfigORMError: If the configuration doesn't fit the segment.
+        """
+        coordinator = self._coordinator
+        if coordinator is None:
+            return None
+        if coordinator.closed:
+            with self._lock:
+                if self._coordinator is coordinator:
+                    self._coordinator = None
+            return None
+
+        return coordinator.payload(
+            self._schema, build.config_data, None if self._lazy else build.config
+        )
+
+    def validate_all(self) -> ConfigSchema:
+        """
+        Validate the whole current configuration.
+
+        In lazy mode, this forces the validation of every section not accessed
+        yet, e.g. in a readiness check. Otherwise the configuration is already
+        fully validated.
+
+        Returns:
+            ConfigSchema: The fully validated configuration.
+
+        Raises:
+            ConfigORMError: If the configuration was never loaded.
+            pydantic.ValidationError: If the configuration is invalid.
+        """
+        config = self.config
+        if config is None:
+            raise ConfigORMError("Configuration is not loaded")
+        if isinstance(config, LazyConfig):
+            return config.validate_all()
+        return config
+
+    def snapshot(self) -> "ConfigSnapshot | None":
+        """
+        The current configuration snapshot.
+
+        Take a snapshot once and read every setting from it to get a
+        consistent view, even while reloads publish newer configurations.
+        Reading a snapshot never takes a lock.
+
+        Returns:
+            ConfigSnapshot | None: The current snapshot, `None` if the
+                configuration was never loaded.
+        """
+        return self._snapshot
+
+    def provenance(
+        self, path: str | None = None
+    ) -> "Provenance | Dict[str, Provenance] | None":
+        """
+        Which source set a configuration value.
+
+        Provenance is recorded during the merge when the ORM is created with
+        `track_provenance=True`. Looking a path up costs as much as its depth,
+        whatever the size of the configuration.
+
+        Args:
+            path (str | None): Dotted path of the value, e.g. `"Service.Port"`.
+
+        Returns:
+            Provenance | None: Without `path`, a dictionary with a record for
+                every path set during the merge (a subtree set as a whole is
+                recorded at its root). With `path`, the record for that value,
+                `None` if no source set it.
+
+        Raises:
+            ConfigORMError: If provenance is not tracked or the configuration
+                was never loaded.
+        """
+        build = self._build_state
+        provenance = None if build is None else build.provenance
+        if provenance is None:
+            raise ConfigORMError(
+                "Provenance is not available, create the ConfigORM with "
+                "track_provenance=True and load the configuration"
+            )
+
+        if path is None:
+            return {
+                path_: self._provenance_record(path_, *record)
+                for path_, record in provenance.items()
+            }
+
+        record = lookup_provenance(provenance, path)
+        if record is None:
+            return None
+
+        _, index, value, overridden = record
+        return self._provenance_record(path, index, value, overridden)
+
+    def _provenance_record(
+        self, path: str, index: int, value: Any, overridden: Any
+    ) -> "Provenance":
+        source = self._sources[index]
+        return Provenance(
+            path=path,
+            source_index=index,
+            source_type=type(source).__name__,
+            filepath=source.filepath,
+            value=value,
+            overridden=overridden,
+        )
+
+    @property
+    def validation_stats(self) -> "ValidationStats | None":
+        """Which sections the last load or reload validated and reused."""
+        build = self._build_state
+        return None if build is None else build.validation_stats
+
+    @property
+    def load_stats(self) -> "LoadStats | None":
+        """
+        Statistics of the last load or reload which published a configuration.
+
+        Only collected when the ORM is created with `instrumentation`, see
+        [py_configorm.stats][].
+        """
+        return self._load_stats
+
+    @property
+    def save_stats(self) -> "LoadStats | None":
+        """Statistics of the last save, see `load_stats`."""
+        return self._save_stats
+
+    @property
+    def generation(self) -> int:
+        """Generation of the current configuration, `0` if never loaded."""
+        return self._generation
 
     @property
     def config(self) -> ConfigSchema | None:
-        return self._config
+        build = self._build_state
+        return None if build is None else build.config
 
     @property
     def sources(self) -> List:
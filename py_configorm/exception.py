@@ -1,5 +1,16 @@
-
-class ConfigORMSourceError(Exception):
-    pass
 class ConfigORMError(Exception):
     pass
+
+
+class ConfigORMSourceError(ConfigORMError):
+    """
+    Raised when one or more configuration sources fail.
+
+    Attributes:
+        errors (list): `(index, source, exception)` tuples, one for every
+            failed source, in source list order.
+    """
+
+    def __init__(self, message: str, errors: list | None = None):
+        super().__init__(message)
+        self.errors = errors or []
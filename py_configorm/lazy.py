@@ -0,0 +1,107 @@
+"""
+LazyConfig: Configuration validated section by section, on first access.
+
+This module provides the configuration object returned by
+[py_configorm.core.ConfigORM][] in lazy mode.
+
+Attributes:
+    LazyConfig (LazyConfig): The LazyConfig class.
+"""
+
+import threading
+from typing import Any, Dict, Type
+
+from py_configorm.validators.schema import compiled_validator, freeze, section_validator
+
+
+class LazyConfig:
+    """
+    Configuration validated section by section, on first access.
+
+    Sources are merged as usual but no section is validated up front. The
+    first access to a top-level attribute validates that section alone into
+    its model (or value), which is then cached on the instance, so later
+    accesses are plain attribute reads.
+
+    Validators spanning several sections (model validators of the schema
+    itself) only run in [py_configorm.lazy.LazyConfig.validate_all][], which
+    validates the whole configuration eagerly, e.g. in CI or a readiness
+    check.
+
+    Attributes:
+        schema (Type[ConfigSchema]): The configuration schema.
+        frozen (bool): Whether sections are validated into read-only copies
+            and assignment is rejected, see
+            [py_configorm.validators.schema.freeze][], default is `False`.
+    """
+
+    def __init__(self, schema: Type, config_data: Dict[str, Any], frozen: bool = False):
+        self._lazy_schema = schema
+        self._lazy_data = config_data
+        self._lazy_config = None
+        self._lazy_frozen = frozen
+        self._lazy_lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the instance, i.e. sections
+        # which are not validated yet.
+        #
+        if name.startswith("_lazy_") or name not in self._lazy_schema.model_fields:
+            raise AttributeError(
+                f"'{self._lazy_schema.__name__}' object has no attribute '{name}'"
+            )
+
+        with self._lazy_lock:
+            if name not in self.__dict__:
+                value = section_validator(self._lazy_schema, name)(self._lazy_data)
+                self.__dict__[name] = freeze(value) if self._lazy_frozen else value
+            return self.__dict__[name]
+
+    def __setattr__(self, name: str, value: Any):
+        if not name.startswith("_lazy_") and self.__dict__.get("_lazy_frozen"):
+            raise AttributeError(f"'{self._lazy_schema.__name__}' object is frozen")
+        self.__dict__[name] = value
+        if not name.startswith("_lazy_") and self._lazy_config is not None:
+            setattr(self._lazy_config, name, value)
+
+    def validate_all(self):
+        """
+        Validate the whole configuration.
+
+        Sections already accessed keep their instance, the others are taken
+        from the full validation.
+
+        Returns:
+            ConfigSchema: The fully validated configuration.
+
+        Raises:
+            pydantic.ValidationError: If the configuration is invalid.
+        """
+        with self._lazy_lock:
+            if self._lazy_config is None:
+                config = compiled_validator(self._lazy_schema)(self._lazy_data)
+                if self._lazy_frozen:
+                    config = freeze(config)
+                for name in self._lazy_schema.model_fields:
+                    if name in self.__dict__:
+                        config.__dict__[name] = self.__dict__[name]
+                    else:
+                        self.__dict__[name] = getattr(config, name)
+                self._lazy_config = config
+            return self._lazy_config
+
+    def model_dump(self, **kwargs) -> Dict[str, Any]:
+        """
+        Dump the configuration, see `pydantic.BaseModel.model_dump`.
+
+        The whole configuration is validated first.
+        """
+        return self.validate_all().model_dump(**kwargs)
+
+    @property
+    def validated(self) -> list:
+        """Names of the sections validated so far."""
+        return [name for name in self._lazy_schema.model_fields if name in self.__dict__]
+
+    def __repr__(self) -> str:
+        return f"LazyConfig({self._lazy_schema.__name__}, validated={self.validated})"
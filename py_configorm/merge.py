@@ -0,0 +1,390 @@
+"""
+Merge engine for layered configuration data.
+
+This module merges the data loaded from configuration sources, later layers
+taking precedence over earlier ones.
+
+The merge is iterative (no recursion limit on deeply nested data) and never
+modifies its input. Subtrees which only one layer provides are shared with
+that layer rather than copied, a dictionary is copied only when a later layer
+actually changes something inside it. The result must therefore be treated
+as read-only.
+
+How values meeting at the same path are combined is decided by a
+[py_configorm.merge.MergeStrategy][], per path. Strategies are usually
+declared on the schema with `typing.Annotated`,
+
+```python
+class ServiceConfig(BaseModel):
+    Hosts: Annotated[List[str], MergeStrategy.APPEND]
+    Limits: Annotated[Dict[str, int], MergeStrategy.REPLACE]
+```
+
+see [py_configorm.validators.schema.merge_strategies][].
+
+The module also computes and applies changes between two versions of
+configuration data, see `diff` and `patch`.
+
+Attributes:
+    MergeStrategy (MergeStrategy): The MergeStrategy enum.
+    merge (Callable): Merge configuration layers.
+    diff (Callable): Changes between two versions of configuration data.
+    patch (Callable): Apply changes to configuration data.
+    select (Callable): Keep only selected keys of configuration data.
+"""
+
+from enum import Enum
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+
+class MergeStrategy(str, Enum):
+    """
+    How a value is combined with the value of an earlier layer at the same path.
+
+    Attributes:
+        DEEP: Dictionaries are merged key by key, anything else is replaced.
+            This is the default.
+        REPLACE: The value replaces the earlier value, dictionaries included.
+        APPEND: Lists are concatenated, anything else is replaced.
+        UNIQUE: Lists are concatenated, dropping items already present, anything
+            else is replaced.
+    """
+
+    DEEP = "deep"
+    REPLACE = "replace"
+    APPEND = "append"
+    UNIQUE = "unique"
+
+
+# Compiled strategies, a trie keyed by path component, each node is a
+# `(strategy, children)` tuple.
+#
+_StrategyTrie = Dict[str, Tuple[MergeStrategy, "_StrategyTrie | None"]]
+
+_DEFAULT = (MergeStrategy.DEEP, None)
+_MISSING = object()
+
+
+def compile_strategies(
+    strategies: Mapping[Tuple[str, ...], MergeStrategy],
+) -> _StrategyTrie | None:
+    """
+    Compile per-path strategies into the lookup structure used by `merge`.
+
+    Args:
+        strategies (Mapping): Strategies keyed by path, a tuple of keys.
+
+    Returns:
+        The compiled strategies, `None` if there are none.
+    """
+    if not strategies:
+        return None
+
+    trie: dict = {}
+    for path, strategy in strategies.items():
+        node = trie
+        for key in path[:-1]:
+            strategy_, children = node.get(key, _DEFAULT)
+            if children is None:
+                children = {}
+            node[key] = (strategy_, children)
+            node = children
+        _, children = node.get(path[-1], _DEFAULT)
+        node[path[-1]] = (MergeStrategy(strategy), children)
+
+    return trie
+
+
+def _unique(current: List[Any], value: List[Any]) -> List[Any]:
+    merged, seen = [], set()
+    for item in chain(current, value):
+        try:
+            if item in seen:
+                continue
+            seen.add(item)
+        except TypeError:
+            if item in merged:
+                continue
+        merged.append(item)
+    return merged
+
+
+def merge(
+    layers: Iterable[Mapping[str, Any]],
+    strategies: _StrategyTrie | None = None,
+    provenance: Dict[str, Tuple[int, Any, Any]] | None = None,
+) -> Dict[str, Any]:
+    """
+    Merge configuration layers, later layers take precedence.
+
+    Args:
+        layers (Iterable): The data of each layer, lowest precedence first.
+        strategies: Per-path strategies compiled with `compile_strategies`,
+            `None` to deep-merge everything.
+        provenance (dict | None): If given, filled with a
+            `(layer index, value, overridden value)` record keyed by dotted
+            path for every value the merge sets, see `lookup_provenance`.
+
+    Returns:
+        dict: The merged data, sharing unchanged subtrees with the layers.
+    """
+    if provenance is not None:
+        return _merge_tracked(layers, strategies, provenance)
+
+    result: Dict[str, Any] = {}
+
+    # Dictionaries created by this merge, and therefore safe to modify. Keyed
+    # by id, the values keep them alive so ids can't be reused.
+    #
+    owned = {id(result): result}
+
+    for layer in layers:
+        if not layer:
+            continue
+
+        stack = [(result, layer, strategies)]
+        while stack:
+            target, source, node = stack.pop()
+
+            if node is None:
+                # Fast path, no strategy below this point, deep merge.
+                #
+                for key, value in source.items():
+                    if isinstance(value, dict):
+                        current = target.get(key)
+                        if isinstance(current, dict):
+                            if id(current) not in owned:
+                                current = dict(current)
+                                owned[id(current)] = current
+                                target[key] = current
+                            stack.append((current, value, None))
+                            continue
+                    target[key] = value
+                continue
+
+            for key, value in source.items():
+                strategy, children = node.get(key, _DEFAULT)
+                current = target.get(key, _MISSING)
+
+                if strategy is MergeStrategy.DEEP:
+                    if isinstance(value, dict) and isinstance(current, dict):
+                        if id(current) not in owned:
+                            current = dict(current)
+                            owned[id(current)] = current
+                            target[key] = current
+                        stack.append((current, value, children))
+                        continue
+                elif strategy is not MergeStrategy.REPLACE:
+                    if isinstance(value, list) and isinstance(current, list):
+                        if strategy is MergeStrategy.APPEND:
+                            target[key] = current + value
+                        else:
+                            target[key] = _unique(current, value)
+                        continue
+
+                target[key] = value
+
+    return result
+
+
+def _merge_tracked(
+    layers: Iterable[Mapping[str, Any]],
+    strategies: _StrategyTrie | None,
+    provenance: Dict[str, Tuple[int, Any, Any]],
+) -> Dict[str, Any]:
+    """
+    Same as `merge`, recording provenance along the way.
+
+    Only the paths where a layer sets a value are recorded. A subtree set as a
+    whole is recorded at its root, the keys below it are resolved through
+    their closest recorded ancestor, see `lookup_provenance`.
+    """
+    result: Dict[str, Any] = {}
+    owned = {id(result): result}
+
+    for index, layer in enumerate(layers):
+        if not layer:
+            continue
+
+        stack = [(result, layer, strategies, "")]
+        while stack:
+            target, source, node, prefix = stack.pop()
+            for key, value in source.items():
+                strategy, children = node.get(key, _DEFAULT) if node else _DEFAULT
+                current = target.get(key, _MISSING)
+
+                if strategy is MergeStrategy.DEEP:
+                    if isinstance(value, dict) and isinstance(current, dict):
+                        if id(current) not in owned:
+                            current = dict(current)
+                            owned[id(current)] = current
+                            target[key] = current
+                        stack.append((current, value, children, f"{prefix}{key}."))
+                        continue
+                elif strategy is not MergeStrategy.REPLACE:
+                    if isinstance(value, list) and isinstance(current, list):
+                        if strategy is MergeStrategy.APPEND:
+                            value = current + value
+                        else:
+                            value = _unique(current, value)
+
+                target[key] = value
+                provenance[f"{prefix}{key}"] = (
+                    index,
+                    value,
+                    None if current is _MISSING else current,
+                )
+
+    return result
+
+
+def lookup_provenance(
+    provenance: Dict[str, Tuple[int, Any, Any]], path: str
+) -> Tuple[str, int, Any, Any] | None:
+    """
+    Find the layer which set the value at a dotted path.
+
+    The record of the path itself and the records of its ancestors are
+    considered, the one from the layer with the highest precedence wins. The
+    cost is proportional to the depth of the path, not to the size of the data.
+
+    Args:
+        provenance (dict): Records filled by `merge`.
+        path (str): The dotted path.
+
+    Returns:
+        tuple | None: The recorded path, layer index, value and overridden value,
+            `None` if no layer set the path.
+    """
+    keys = path.split(".")
+    best = None
+    for depth in range(len(keys), 0, -1):
+        record = provenance.get(".".join(keys[:depth]))
+        if record is not None and (best is None or record[0] > best[1][0]):
+            best = (depth, record)
+
+    if best is None:
+        return None
+
+    depth, (index, value, overridden) = best
+    for key in keys[depth:]:
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+        overridden = overridden.get(key) if isinstance(overridden, dict) else None
+
+    return ".".join(keys[:depth]), index, value, overridden
+
+
+class _Deleted:
+    def __repr__(self) -> str:
+        return "DELETED"
+
+
+DELETED = _Deleted()
+"""Marks a path removed in the changes computed by `diff`."""
+
+
+def diff(old: Mapping[str, Any], new: Mapping[str, Any]) -> Dict[Tuple[str, ...], Any]:
+    """
+    Changes between two versions of configuration data.
+
+    Dictionaries are compared key by key, any other value as a whole.
+
+    Args:
+        old (Mapping): The previous data.
+        new (Mapping): The current data.
+
+    Returns:
+        dict: The new value of every changed path, keyed by path, `DELETED`
+            for removed paths.
+    """
+    changes: Dict[Tuple[str, ...], Any] = {}
+    stack = [((), old, new)]
+    while stack:
+        prefix, old_, new_ = stack.pop()
+        for key, value in new_.items():
+            current = old_.get(key, _MISSING)
+            if isinstance(value, dict) and isinstance(current, dict):
+                stack.append((prefix + (key,), current, value))
+            elif current is _MISSING or current != value:
+                changes[prefix + (key,)] = value
+        for key in old_.keys() - new_.keys():
+            changes[prefix + (key,)] = DELETED
+
+    return changes
+
+
+def get_path(data: Mapping[str, Any], path: Tuple[str, ...], default: Any = None) -> Any:
+    """
+    The value at a path, `default` if there is none.
+    """
+    for key in path:
+        if not isinstance(data, Mapping) or key not in data:
+            return default
+        data = data[key]
+    return data
+
+
+def select(data: Any, selection: Mapping[str, Any] | None) -> Any:
+    """
+    The selected keys of configuration data, without modifying it.
+
+    Args:
+        data (Any): The data.
+        selection (Mapping | None): Nested dictionary of the keys to keep, a
+            key mapped to `None` is kept with everything below it. `None`
+            keeps everything.
+
+    Returns:
+        Any: The selected data, sharing the kept subtrees with `data`.
+    """
+    if selection is None or not isinstance(data, Mapping):
+        return data
+    return {
+        key: select(value, selection[key])
+        for key, value in data.items()
+        if key in selection
+    }
+
+
+def patch(
+    data: Mapping[str, Any], changes: Mapping[Tuple[str, ...], Any]
+) -> Dict[str, Any]:
+    """
+    Apply changes computed by `diff` without modifying the data.
+
+    Only the dictionaries along the changed paths are copied, everything else
+    is shared with `data`.
+
+    Args:
+        data (Mapping): The data to patch.
+        changes (Mapping): New values keyed by path, `DELETED` to remove a path.
+
+    Returns:
+        dict: The patched data.
+    """
+    result = dict(data)
+    owned = {id(result): result}
+
+    for path, value in changes.items():
+        node = result
+        for key in path[:-1]:
+            child = node.get(key)
+            if not isinstance(child, dict):
+                if value is DELETED:
+                    break
+                child = {}
+            if id(child) not in owned:
+                child = dict(child)
+                owned[id(child)] = child
+            node[key] = child
+            node = child
+        else:
+            if value is DELETED:
+                node.pop(path[-1], None)
+            else:
+                node[path[-1]] = value
+
+    return result
@@ -0,0 +1,273 @@
+"""
+ConfigCoordinator and ConfigWorker: Configuration shared between processes.
+
+This module lets one process (the coordinator, e.g. the master of a pre-fork
+server) load the configuration and publish it into a shared memory segment,
+from which any number of worker processes read it without touching the
+sources.
+
+Attributes:
+    ConfigCoordinator (ConfigCoordinator): The ConfigCoordinator class.
+    ConfigWorker (ConfigWorker): The ConfigWorker class.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+import time
+import zlib
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, Callable, Dict, Tuple, Type
+
+from py_configorm.exception import ConfigORMError
+
+if TYPE_CHECKING:
+    from py_configorm.core import ConfigSchema
+    from py_configorm.lazy import LazyConfig
+
+# Default size of a segment. Pages of a segment are only allocated once
+# written, a large segment costs nothing until the configuration fills it.
+#
+SEGMENT_SIZE = 16 * 2**20
+
+# Segment header: magic and format, sequence (odd while a configuration is
+# being written), generation, payload length and CRC-32 of the payload.
+#
+MAGIC = b"CFGORM\x00\x01"
+HEADER = struct.Struct("<8sQQQI4x")
+_SEQUENCE = struct.Struct("<Q")
+_SEQUENCE_OFFSET = 8
+
+
+def _attach(name: str) -> Tuple[Any, Callable[[], None]]:
+    """
+    Map an existing segment, returns the buffer and the function unmapping it.
+
+    `SharedMemory` registers the segments it attaches to with the resource
+    tracker, which unlinks them when the process exits (before Python 3.13)
+    or drops the registration of the coordinator when they share the
+    tracker. On POSIX the segment is opened directly instead, read-only, as
+    `shared_memory` does itself.
+    """
+    if os.name == "posix":
+        import _posixshmem
+
+        fd = _posixshmem.shm_open("/" + name, os.O_RDONLY, mode=0o600)
+        try:
+            mapped = mmap.mmap(fd, os.fstat(fd).st_size, prot=mmap.PROT_READ)
+        finally:
+            os.close(fd)
+        return mapped, mapped.close
+
+    segment = shared_memory.SharedMemory(name=name)
+    return segment.buf, segment.close
+
+
+class ConfigCoordinator:
+    """
+    Publisher of a configuration into a shared memory segment.
+
+    Created by [py_configorm.core.ConfigORM.share][], which publishes every
+    configuration the ORM loads or reloads from then on, so that N workers
+    reading it through [py_configorm.shared.ConfigWorker][] cost one load
+    per reload instead of N, and only the coordinator reads the sources.
+
+    A configuration is published as the pickled merged data and validated
+    configuration along with its generation. Writes follow a sequence lock:
+    the sequence is odd while the payload is written, and readers retry
+    until they read the same even sequence before and after copying the
+    payload, and the payload matches its checksum.
+
+    The segment is created with the name given, or a random one, and is
+    only readable by the user running the coordinator. Payloads are
+    pickled, so the segment must not be writable by anyone not trusted to
+    run code in the workers. Call `close` to remove the segment, the ORM
+    which created the coordinator stops publishing then.
+
+    Attributes:
+        name (str | None): Name of the segment, default is a random name.
+        size (int): Size of the segment in bytes, the largest configuration
+            it can hold, default is `SEGMENT_SIZE`.
+    """
+
+    def __init__(self, name: str | None = None, size: int = SEGMENT_SIZE):
+        self._segment = shared_memory.SharedMemory(name=name, create=True, size=size)
+        HEADER.pack_into(self._segment.buf, 0, MAGIC, 0, 0, 0, 0)
+        self._sequence = 0
+
+    def publish(
+        self,
+        generation: int,
+        schema: Type,
+        config_data: Dict[str, Any],
+        config: Any | None = None,
+    ):
+        """
+        Publish a configuration, replacing the current one.
+
+        Args:
+            generation (int): Generation of the configuration, workers
+                deserialize the configuration again when it moves.
+            schema (Type[ConfigSchema]): The configuration schema, must be
+                picklable.
+            config_data (dict): The merged configuration data.
+            config (ConfigSchema | None): The validated configuration, `None`
+                for workers to validate it lazily, see
+                [py_configorm.lazy.LazyConfig][].
+
+        Raises:
+            ConfigORMError: If the configuration doesn't fit the segment.
+        """
+        self.write(generation, self.payload(schema, config_data, config))
+
+    def payload(
+        self, schema: Type, config_data: Dict[str, Any], config: Any | None = None
+    ) -> bytes:
+        """
+        The pickled configuration, as published by `publish`.
+
+        Lets a configuration be checked before it is made current anywhere,
+        and written later with `write`, which can't fail.
+
+        Raises:
+            ConfigORMError: If the coordinator is closed, or the
+                configuration doesn't fit the segment.
+        """
+        if self.closed:
+            raise ConfigORMError(f"Shared memory segment '{self.name}' is closed")
+
+        payload = pickle.dumps((schema, config_data, config), pickle.HIGHEST_PROTOCOL)
+        if HEADER.size + len(payload) > self.size:
+            raise ConfigORMError(
+                f"Configuration of {len(payload)} bytes doesn't fit the "
+                f"{self.size} bytes shared memory segment '{self.name}'"
+            )
+        return payload
+
+    def write(self, generation: int, payload: bytes):
+        """
+        Publish a payload returned by `payload`, replacing the current one.
+
+        Args:
+            generation (int): Generation of the configuration.
+            payload (bytes): The pickled configuration.
+        """
+        buf = self._segment.buf
+        self._sequence += 1
+        _SEQUENCE.pack_into(buf, _SEQUENCE_OFFSET, self._sequence)
+        buf[HEADER.size : HEADER.size + len(payload)] = payload
+        self._sequence += 1
+        HEADER.pack_into(
+            buf, 0, MAGIC, self._sequence, generation, len(payload), zlib.crc32(payload)
+        )
+
+    def close(self):
+        """Detach from the segment and remove it, attached workers keep it."""
+        self._segment.close()
+        try:
+            self._segment.unlink()
+        except FileNotFoundError:
+            pass
+
+    @property
+    def closed(self) -> bool:
+        """Whether `close` was called, nothing can be published anymore."""
+        return self._segment.buf is None
+
+    @property
+    def name(self) -> str:
+        """Name of the segment, for workers to attach to it."""
+        return self._segment.name
+
+    @property
+    def size(self) -> int:
+        return self._segment.size
+
+
+class ConfigWorker:
+    """
+    Reader of the configuration published by a
+    [py_configorm.shared.ConfigCoordinator][].
+
+    Reading `config` only compares the published generation with the one
+    last read, the configuration is copied out of the segment and
+    unpickled again only when it moved, so the workers of a pre-fork server
+    never read the sources nor validate anything.
+
+    Attributes:
+        name (str): Name of the segment, see
+            [py_configorm.shared.ConfigCoordinator.name][].
+        timeout (float): Maximum time in seconds to wait for a configuration
+            being published, default is `1.0`.
+    """
+
+    def __init__(self, name: str, timeout: float = 1.0):
+        self._name = name
+        self._buf, self._close = _attach(name)
+        self._timeout = timeout
+        self._current: Tuple[int, Any] = (0, None)
+
+        if bytes(self._buf[: len(MAGIC)]) != MAGIC:
+            self._close()
+            raise ConfigORMError(f"Shared memory segment '{name}' holds no configuration")
+
+    def _read(self) -> Tuple[int, Any]:
+        """The published generation and configuration, read consistently."""
+        buf = self._buf
+        deadline = None
+        while True:
+            _, sequence, generation, length, crc = HEADER.unpack_from(buf)
+            if sequence % 2 == 0:
+                if generation == self._current[0]:
+                    if _SEQUENCE.unpack_from(buf, _SEQUENCE_OFFSET)[0] == sequence:
+                        return self._current
+                else:
+                    payload = bytes(buf[HEADER.size : HEADER.size + length])
+                    if (
+                        _SEQUENCE.unpack_from(buf, _SEQUENCE_OFFSET)[0] == sequence
+                        and zlib.crc32(payload) == crc
+                    ):
+                        return generation, self._load(payload)
+
+            # A configuration is being written.
+            #
+            now = time.monotonic()
+            if deadline is None:
+                deadline = now + self._timeout
+            elif now > deadline:
+                raise ConfigORMError(
+                    f"Timed out reading shared memory segment '{self.name}'"
+                )
+            time.sleep(0)
+
+    @staticmethod
+    def _load(payload: bytes) -> Any:
+        from py_configorm.lazy import LazyConfig
+
+        schema, config_data, config = pickle.loads(payload)
+        return LazyConfig(schema, config_data) if config is None else config
+
+    def close(self):
+        """Detach from the segment."""
+        self._close()
+
+    @property
+    def config(self) -> "ConfigSchema | LazyConfig | None":
+        """
+        The published configuration, `None` if none was published yet.
+
+        The configuration object is shared between reads of the same
+        generation and must be treated as read-only.
+        """
+        self._current = self._read()
+        return self._current[1]
+
+    @property
+    def generation(self) -> int:
+        """Generation of the configuration last read, `0` if none."""
+        return self._current[0]
+
+    @property
+    def name(self) -> str:
+        return self._name
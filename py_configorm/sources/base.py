@@ -5,9 +5,63 @@ This is a python library for handling configuration data.
 
 """
 
+import hashlib
+import mmap
+import os
+import stat
+import tempfile
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Dict
+from typing import IO, Any, Dict, Hashable, Iterator, Tuple
+
+from py_configorm.exception import ConfigORMError
+from py_configorm.merge import select
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once, os.umask can only be read by changing it, which is not thread-safe.
+#
+UMASK = _umask()
+
+# Files at least this large are memory-mapped instead of read, see
+# `BaseSource._raw`.
+#
+MMAP_THRESHOLD = 8 * 1024 * 1024
+
+
+def select_backend(kind: str, backends: Tuple[str, ...], name: str | None) -> str:
+    """
+    Name of the parser backend to use, the first one installed if `name` is
+    `None`.
+
+    Backends are named after their module, and are looked up without being
+    imported.
+
+    Args:
+        kind (str): What the backend does, e.g. `"TOML reader"`.
+        backends (tuple): The supported backends, in order of preference.
+        name (str | None): The backend asked for.
+
+    Raises:
+        ConfigORMError: If the backend is unknown or not installed.
+    """
+    if name is not None and name not in backends:
+        raise ConfigORMError(
+            f"Unknown {kind} '{name}', expected one of {', '.join(backends)}."
+        )
+    candidates = backends if name is None else (name,)
+    for backend in candidates:
+        if find_spec(backend) is not None:
+            return backend
+    raise ConfigORMError(f"{kind} {' or '.join(candidates)} is not installed.")
+
 
 class BaseSource(ABC):
     """
@@ -20,8 +74,13 @@ class BaseSource(ABC):
     Attributes:
         filepath (Path): The path to the source configuration file.
         readonly (bool): Whether the source is read-only.
+        mmap_threshold (int | None): Size from which the source file is
+            memory-mapped rather than read, `None` to always read it. Set on a
+            subclass or an instance to override `MMAP_THRESHOLD`.
     """
 
+    mmap_threshold: int | None = MMAP_THRESHOLD
+
     def __init__(self, filepath: Path | None, readonly: bool = True):
         self._readonly = readonly
         self._filepath = filepath
@@ -46,6 +105,220 @@ class BaseSource(ABC):
         """
         pass
 
+    def _read(self) -> bytes | mmap.mmap:
+        """
+        Read the raw content of the source file.
+
+        Files of at least `mmap_threshold` bytes are memory-mapped read-only
+        instead of being copied into a bytes object, the caller must close the
+        returned map, see `_raw`.
+
+        Returns:
+            bytes | mmap.mmap: The file content.
+        """
+        with open(self._filepath, "rb") as f:
+            threshold = self.mmap_threshold
+            if threshold is None or os.fstat(f.fileno()).st_size < max(threshold, 1):
+                return f.read()
+
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            return mapped
+
+    @contextmanager
+    def _raw(self) -> Iterator[bytes | mmap.mmap]:
+        """
+        Raw content of the source file, released when the block exits.
+
+        Sources which parse a file override `_parse` and implement `load` as
+        `with self._raw() as raw: return self._parse(raw)`, which lets the
+        time spent reading and parsing be measured separately, see
+        [py_configorm.stats][].
+
+        Yields:
+            bytes | mmap.mmap: The file content.
+        """
+        raw = self._read()
+        try:
+            yield raw
+        finally:
+            if isinstance(raw, mmap.mmap):
+                raw.close()
+
+    def _parse(self, raw: bytes | mmap.mmap) -> Dict[Any, Any]:
+        """
+        Parse raw content read by `_read` into configuration data.
+
+        Large files are passed as a memory map, which supports the buffer
+        protocol (e.g. `str(raw, "utf-8")`) and the file `read` method, but
+        must not be referenced once `_parse` returns.
+
+        Args:
+            raw (bytes | mmap.mmap): The file content.
+
+        Returns:
+            dict: The configuration data.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not parse raw content")
+
+    def load_selected(self, selection: Dict[str, Any]) -> Dict[Any, Any]:
+        """
+        Load only the selected keys of the configuration data.
+
+        Used by [py_configorm.core.ConfigORM][] with `selective=True` to load
+        only what the schema reads, see
+        [py_configorm.validators.schema.field_selection][].
+
+        Args:
+            selection (dict): Nested dictionary of the keys to load, a key
+                mapped to `None` is loaded with everything below it.
+
+        Returns:
+            dict: The selected configuration data.
+        """
+        if self._splits_load():
+            with self._raw() as raw:
+                return self._parse_selected(raw, selection)
+        return select(self.load(), selection)
+
+    def _parse_selected(
+        self, raw: bytes | mmap.mmap, selection: Dict[str, Any]
+    ) -> Dict[Any, Any]:
+        """
+        Parse only the selected keys of raw content read by `_read`.
+
+        The whole content is parsed and the rest dropped, sources with a
+        streaming parser override this method to skip what isn't selected.
+        """
+        return select(self._parse(raw), selection)
+
+    def _splits_load(self) -> bool:
+        """
+        Whether `load` parses `self._raw()` with `_parse` for this source.
+
+        That's the case when `_parse` is implemented by the class implementing
+        `load` or by a subclass of it.
+        """
+        mro = type(self).__mro__
+        load = next(cls for cls in mro if "load" in vars(cls))
+        parse = next(cls for cls in mro if "_parse" in vars(cls))
+        return parse is not BaseSource and issubclass(parse, load)
+
+    def save_changes(self, data: Dict[str, Any], changes: Dict[Tuple[str, ...], Any]):
+        """
+        Save configuration data to this source, knowing what changed.
+
+        [py_configorm.core.ConfigORM.save][] calls this method with the data
+        last loaded from this source patched with the changes made since.
+        Sources which can write individual keys should override it and only
+        write `changes`, by default the whole data is saved with `save`.
+
+        Args:
+            data (dict): The configuration data to save.
+            changes (dict): The changed values keyed by path,
+                [py_configorm.merge.DELETED][] for removed paths.
+        """
+        self.save(data)
+
+    @contextmanager
+    def _atomic_write(self, mode: str = "w") -> Iterator[IO]:
+        """
+        Open a temporary file to replace the source file with.
+
+        The temporary file is created next to the source file. When the block
+        exits without error, it is flushed to disk and renamed over the source
+        file, so readers see either the old or the new content, never a
+        partial write. The permissions of the existing file are preserved.
+
+        Args:
+            mode (str): The file mode, `"w"` or `"wb"`.
+
+        Yields:
+            IO: The temporary file.
+        """
+        directory, name = os.path.split(os.path.abspath(self._filepath))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, mode) as f:
+                yield f
+                f.flush()
+                os.fsync(f.fileno())
+
+            try:
+                os.chmod(tmp, stat.S_IMODE(os.stat(self._filepath).st_mode))
+            except FileNotFoundError:
+                os.chmod(tmp, 0o666 & ~UMASK)
+
+            os.replace(tmp, self._filepath)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+
+        if hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    def fingerprint(self, content_hash: bool = False) -> Hashable | None:
+        """
+        Cheap identity of the current state of this source.
+
+        Two equal fingerprints mean the source would load the same data. For
+        file sources the fingerprint is made of the file inode, size and
+        modification time, and optionally a hash of the file content for
+        filesystems with coarse timestamps.
+
+        Args:
+            content_hash (bool): Whether to include a hash of the file content.
+
+        Returns:
+            Hashable | None: The fingerprint, or `None` if it can't be
+                determined, in which case the source is always loaded again.
+        """
+        if self._filepath is None:
+            return None
+
+        try:
+            stat = os.stat(self._filepath)
+            fingerprint = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            if content_hash:
+                digest = hashlib.blake2b()
+                with open(self._filepath, "rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        digest.update(chunk)
+                fingerprint += (digest.hexdigest(),)
+            return fingerprint
+        except FileNotFoundError:
+            return None
+
+    def cache_options(self) -> Hashable:
+        """
+        Options of this source which change the data it loads.
+
+        Part of the key of the configurations cached by
+        [py_configorm.cache.ConfigCache][], along with the source type, file
+        and fingerprint. Sources taking such options (a prefix, a schema)
+        must override it.
+
+        Returns:
+            Hashable: The options, `()` by default.
+        """
+        return ()
+
+    def __repr__(self) -> str:
+        if self._filepath is None:
+            return f"{type(self).__name__}(readonly={self._readonly})"
+        return (
+            f"{type(self).__name__}(filepath='{self._filepath}', "
+            f"readonly={self._readonly})"
+        )
+
     @property
     def filepath(self) -> Path | None:
         return self._filepath
@@ -53,3 +326,50 @@ class BaseSource(ABC):
     @property
     def readonly(self) -> bool:
         return self._readonly
+
+
+class AsyncBaseSource(BaseSource):
+    """
+    Base class for configuration sources with a non-blocking interface.
+
+    This class extends [py_configorm.sources.base.BaseSource][] with
+    coroutine versions of `load` and `save`, which must not block the running
+    event loop. [py_configorm.core.ConfigORM][] awaits them from
+    `aload`, `asave` and `areload_config`.
+    """
+
+    @abstractmethod
+    async def aload(self) -> Dict[Any, Any]:
+        """
+        Load configuration data from this source without blocking the event loop.
+
+        Returns:
+            dict: The loaded configuration data.
+        """
+        pass
+
+    @abstractmethod
+    async def asave(self, data: Dict[str, Any]):
+        """
+        Save configuration data to this source without blocking the event loop.
+
+        Args:
+            data (dict): The configuration data to save.
+        """
+        pass
+
+    async def asave_changes(self, data: Dict[str, Any], changes: Dict[Tuple[str, ...], Any]):
+        """
+        Save configuration data to this source without blocking the event
+        loop, knowing what changed.
+
+        Coroutine version of [py_configorm.sources.base.BaseSource.save_changes][],
+        awaited by [py_configorm.core.ConfigORM.asave][]. By default the whole
+        data is saved with `asave`.
+
+        Args:
+            data (dict): The configuration data to save.
+            changes (dict): The changed values keyed by path,
+                [py_configorm.merge.DELETED][] for removed paths.
+        """
+        await self.asave(data)
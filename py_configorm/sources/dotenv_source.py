@@ -9,11 +9,70 @@ Attributes:
 
 """
 
+import io
+import os
+import re
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, Tuple, Type
 
-import dotenv
+from py_configorm.merge import DELETED, get_path
+from py_configorm.sources.base import AsyncBaseSource, BaseSource
+from py_configorm.sources.env_source import flatten_variables, nest_variables
 
-from py_configorm.sources.base import BaseSource
+if TYPE_CHECKING:
+    from dotenv.parser import Binding
+
+    from py_configorm.core import ConfigSchema
+    from py_configorm.validators.env import EnvField
+
+# What precedes and follows the key of a binding, as dotenv reads them.
+#
+_EXPORT = re.compile(r"\s*(?:export[^\S\r\n]+)?")
+_WHITESPACE = re.compile(r"[^\S\r\n]*")
+_EQUAL_SIGN = re.compile(r"=[^\S\r\n]*")
+_BLANK_LINES = re.compile(r"(?:[^\S\r\n]*(?:\r\n|\n|\r))*")
+
+# Values written without quotes.
+#
+_UNQUOTED = re.compile(r"[\w./:@+,-]*")
+
+
+def _bindings(text: str) -> List["Binding"]:
+    """
+    Bindings of a dotenv file, parsed by dotenv. A warning is logged for
+    invalid lines, which are skipped.
+    """
+    from dotenv.main import with_warn_for_invalid_lines
+    from dotenv.parser import parse_stream
+
+    return list(with_warn_for_invalid_lines(parse_stream(io.StringIO(text))))
+
+
+def _span(original: str) -> Tuple[int, int]:
+    """Span of the key and value in the text of a binding, without export or comment."""
+    from dotenv.parser import Reader, parse_key, parse_value
+
+    reader = Reader(io.StringIO(original))
+    reader.read_regex(_EXPORT)
+    start = reader.position.chars
+    parse_key(reader)
+    end = reader.position.chars
+    reader.read_regex(_WHITESPACE)
+    if reader.peek(1) == "=":
+        reader.read_regex(_EQUAL_SIGN)
+        end = reader.position.chars
+        quoted = reader.peek(1) in ("'", '"')
+        value = parse_value(reader)
+        end = reader.position.chars if quoted else end + len(value)
+    return start, end
+
+
+def _quote(value: str) -> str:
+    """A value as written in a dotenv file."""
+    if _UNQUOTED.fullmatch(value):
+        return value
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
 
 
 class DOTENVSource(BaseSource):
@@ -23,8 +82,24 @@ class DOTENVSource(BaseSource):
     configuration source. It provides methods to load and save configuration
     data from/to a dotenv file.
 
+    Variables are named and nested like those of
+    [py_configorm.sources.env_source.ENVSource][], at any depth, and variables
+    without the prefix are skipped. The file is parsed by dotenv, which logs
+    a warning for invalid lines. Values referring to other variables
+    (`${NAME}`) are expanded like dotenv does, in a single pass.
+
+    Saving rewrites only the lines of the variables whose value changed and
+    appends new variables, so comments, blank lines and other variables of
+    the file are kept as they are.
+
+    Built with a `schema`, only the variables holding the fields of the
+    schema are picked from the file, and their values are decoded according
+    to the field types, see [py_configorm.sources.env_source.ENVSource][].
+
     Attributes:
         _file_path (Path): The path to the dotenv configuration file.
+        schema (Type[ConfigSchema] | None): The schema whose fields are looked
+            up, default is `None` (every variable with the prefix).
 
     Methods:
         __init__(self, file_path: Path, readonly: bool = True):
@@ -56,10 +131,23 @@ class DOTENVSource(BaseSource):
         prefix: str = "CFGORM_",
         readonly: bool = True,
         nesting_slug: str = "__",
+        schema: "Type[ConfigSchema] | None" = None,
     ):
         super().__init__(filepath, readonly)
         self._prefix = prefix
         self._nesting_slug = nesting_slug
+        self._schema = schema
+        self._fields: "List[EnvField] | None" = None
+        if schema is not None:
+            from py_configorm.validators.env import env_fields
+
+            self._fields = env_fields(schema, prefix, nesting_slug)
+
+    def cache_options(self) -> Hashable:
+        from py_configorm.validators.schema import schema_digest
+
+        schema = None if self._schema is None else schema_digest(self._schema)
+        return (self._prefix, self._nesting_slug, schema)
 
     def load(self) -> dict:
         """Load configuration data from this source.
@@ -74,30 +162,61 @@ class DOTENVSource(BaseSource):
             FileNotFoundError: If the specified dotenv file does not exist.
         """
         try:
-            data = {}
-            with open(self.filepath, "r") as f:
-                vars_ = dotenv.dotenv_values(dotenv_path=f.name)
-                for key, value in vars_.items():
-                    n_key = key.split(self._prefix, maxsplit=1)[1]
-                    l1_keys = n_key.split(self._nesting_slug, maxsplit=1)
-                    if l1_keys[0] in data:
-                        if l1_keys[1] in data[l1_keys[0]]:
-                            data[l1_keys[0]][l1_keys[1]] = value
-                        else:
-                            data[l1_keys[0]][l1_keys[1]] = {}
-                            data[l1_keys[0]][l1_keys[1]] = value
-                    else:
-                        data[l1_keys[0]] = {}
-                        data[l1_keys[0]][l1_keys[1]] = value
-                return data
+            with self._raw() as raw:
+                return self._parse(raw)
         except Exception as e:
             raise e
 
+    def _parse(self, raw: bytes) -> dict:
+        text = str(raw, "utf-8")
+        prefix = self._prefix
+
+        # Only the values of the prefixed variables are decoded, unless one of
+        # them refers to another variable.
+        #
+        bindings = _bindings(text)
+        variables: Dict[str, Any] = {}
+        for binding in bindings:
+            if binding.key is not None and binding.key.startswith(prefix):
+                variables[binding.key] = binding.value
+        if any(value is not None and "${" in value for value in variables.values()):
+            variables = self._interpolate(bindings)
+
+        if self._fields is not None:
+            from py_configorm.validators.env import load_fields
+
+            return load_fields(self._fields, variables)
+
+        return nest_variables(variables.items(), len(prefix), self._nesting_slug)
+
+    def _interpolate(self, bindings: List["Binding"]) -> Dict[str, Any]:
+        """Prefixed variables with `${NAME}` and `${NAME:-default}` expanded.
+
+        Like dotenv, variables of the file set above and then the environment
+        are looked up.
+        """
+        from dotenv.variables import parse_variables
+
+        environ: Dict[str, Any] = dict(os.environ)
+        variables: Dict[str, Any] = {}
+        for key, value, _, _ in bindings:
+            if key is None:
+                continue
+            if value is not None and "${" in value:
+                value = "".join(atom.resolve(environ) for atom in parse_variables(value))
+            environ[key] = value
+            if key.startswith(self._prefix):
+                variables[key] = value
+        return variables
+
     def save(self, data: dict):
         """Save configuration data to this source.
 
         This method saves the configuration data to the dotenv file specified
-        during the initialization of this class.
+        during the initialization of this class. Only the lines of variables
+        whose value changed are rewritten, variables missing from the file
+        are appended, and comments, blank lines and any other variable are
+        kept as they are.
 
         Args:
             data (dict): The configuration data to save.
@@ -108,4 +227,146 @@ class DOTENVSource(BaseSource):
         if self.readonly:
             raise PermissionError("This source is read-only.")
 
-        raise NotImplementedError("This source does not support saving.")
+        if self._fields is not None:
+            self._update(*self._field_variables(data))
+            return
+
+        updates: Dict[str, str] = {}
+        for key, value in data.items():
+            updates.update(flatten_variables(self._prefix + key, value, self._nesting_slug))
+        self._update(updates)
+
+    def save_changes(self, data: dict, changes: Dict[Tuple[str, ...], Any]):
+        """Save only the changed variables.
+
+        Args:
+            data (dict): The configuration data.
+            changes (dict): The changed values keyed by path.
+        """
+        if self.readonly:
+            raise PermissionError("This source is read-only.")
+
+        if self._fields is not None:
+            updates, deleted = self._field_variables(data, changes)
+            self._update(updates, deleted)
+            return
+
+        updates, deleted = {}, []
+        for path, value in changes.items():
+            name = self._prefix + self._nesting_slug.join(path)
+            if value is DELETED:
+                deleted.append(name)
+            else:
+                updates.update(flatten_variables(name, value, self._nesting_slug))
+        self._update(updates, deleted)
+
+    def _field_variables(
+        self, data: dict, changes: Dict[Tuple[str, ...], Any] | None = None
+    ) -> Tuple[Dict[str, str], List[str]]:
+        """Encoded variables of the fields in the data, and variables to remove.
+
+        Variables of `None` values are removed. With `changes`, only the
+        variables of changed fields are returned, and those of fields missing
+        from the data are removed, see [py_configorm.sources.env_source.ENVSource][].
+        """
+        from py_configorm.validators.env import changed_fields, encode
+
+        fields = self._fields if changes is None else changed_fields(self._fields, changes)
+        updates: Dict[str, str] = {}
+        deleted: List[str] = []
+        for name, path, _ in fields:
+            value = get_path(data, path, DELETED)
+            if value is None or (changes is not None and value is DELETED):
+                deleted.append(name)
+            elif value is not DELETED:
+                updates[name] = encode(value)
+        return updates, deleted
+
+    def _update(self, updates: Dict[str, str], deleted: Iterable[str] = ()):
+        """Rewrite the changed lines of the file.
+
+        Args:
+            updates (dict): Values of the variables to set.
+            deleted (Iterable): Variables to remove, with the variables nested
+                in them.
+        """
+        try:
+            with self._raw() as raw:
+                text = str(raw, "utf-8")
+        except FileNotFoundError:
+            text = ""
+
+        removed = tuple(deleted)
+        nested = tuple(name + self._nesting_slug for name in removed)
+        pieces: List[str] = []
+        seen, changed = set(), False
+        for binding in _bindings(text):
+            key, original = binding.key, binding.original.string
+            if key is not None and key.startswith(self._prefix):
+                if key in removed or key.startswith(nested):
+                    # The blank lines above the binding are kept.
+                    #
+                    original, changed = _BLANK_LINES.match(original)[0], True
+                elif key in updates:
+                    seen.add(key)
+                    if binding.value != updates[key]:
+                        start, end = _span(original)
+                        original = (
+                            f"{original[:start]}{key}={_quote(updates[key])}{original[end:]}"
+                        )
+                        changed = True
+            pieces.append(original)
+
+        added = [f"{key}={_quote(value)}\n" for key, value in updates.items() if key not in seen]
+        if added:
+            if text and not text.endswith(("\n", "\r")):
+                pieces.append("\n")
+            pieces.extend(added)
+            changed = True
+
+        if changed:
+            with self._atomic_write() as f:
+                f.write("".join(pieces))
+
+
+class AsyncDOTENVSource(DOTENVSource, AsyncBaseSource):
+    """
+    Asynchronous dotenv configuration source.
+
+    Same as [py_configorm.sources.dotenv_source.DOTENVSource][], except that file I/O
+    and parsing run on a worker thread, so the event loop is never blocked.
+    """
+
+    async def aload(self) -> dict:
+        """
+        Load configuration data from this source without blocking the event loop.
+
+        Returns:
+            dict: The loaded configuration data.
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.load)
+
+    async def asave(self, data: dict):
+        """
+        Save configuration data to this source without blocking the event loop.
+
+        Args:
+            data (dict): The configuration data to save.
+        """
+        import asyncio
+
+        await asyncio.to_thread(self.save, data)
+
+    async def asave_changes(self, data: dict, changes: Dict[Tuple[str, ...], Any]):
+        """
+        Save the changes without blocking the event loop, see `save_changes`.
+
+        Args:
+            data (dict): The configuration data to save.
+            changes (dict): The changed values keyed by path.
+        """
+        import asyncio
+
+        await asyncio.to_thread(self.save_changes, data, changes)
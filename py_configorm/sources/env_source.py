@@ -9,9 +9,68 @@ Attributes:
 
 """
 
+import hashlib
 import os
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, Iterator, List, Tuple, Type
 
-from py_configorm.sources.base import BaseSource
+from py_configorm.merge import DELETED, get_path
+from py_configorm.sources.base import AsyncBaseSource, BaseSource
+
+if TYPE_CHECKING:
+    from py_configorm.core import ConfigSchema
+    from py_configorm.validators.env import EnvField
+
+
+def nest_variables(
+    variables: Iterable[Tuple[str, Any]], start: int, nesting_slug: str
+) -> Dict[str, Any]:
+    """
+    Configuration data of `(name, value)` variables.
+
+    Names are split on every nesting slug from `start` (past the prefix), so
+    data can be nested at any depth. When a variable and nested variables
+    share a name, the nested variables win.
+
+    Args:
+        variables (Iterable): The variables.
+        start (int): Length of the prefix of the names.
+        nesting_slug (str): Separator of the keys in variable names.
+
+    Returns:
+        dict: The nested configuration data.
+    """
+    data: Dict[str, Any] = {}
+    for key, value in variables:
+        *tables, name = key[start:].split(nesting_slug)
+        node = data
+        for table in tables:
+            child = node.get(table)
+            if not isinstance(child, dict):
+                child = node[table] = {}
+            node = child
+        if not isinstance(node.get(name), dict):
+            node[name] = value
+    return data
+
+
+def flatten_variables(name: str, value: Any, nesting_slug: str) -> Iterator[Tuple[str, str]]:
+    """Variables holding a value, nested dictionaries at any depth."""
+    stack = [(name, value)]
+    while stack:
+        name, value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend((name + nesting_slug + k, v) for k, v in value.items())
+        else:
+            yield name, str(value)
+
+
+def _copy(value: Any) -> Any:
+    """A copy of loaded data, down to its lists and dictionaries."""
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
 
 
 class ENVSource(BaseSource):
@@ -29,16 +88,13 @@ class ENVSource(BaseSource):
     for ORM, these variables need to be converted to a dictionary following the
     semantics of the user specified by subclassing [py_configorm.core.ConfigSchema][].
 
-    This library only supports single level of nesting of configuration data, i.e.,
-    for environment variables containing multiple `NESTING_SLUGS`, only the first
-    `NESTING_SLUG` will be considered for nesting, the remaining will become the
-    nested configuration attribute. For example, if environment variable is,
-    `CFGORM_KEY1__NESTEDKEY2__NESTEDKEY3 = VALUE`, only `KEY1` will be considered
-    for nesting and the remaining will become the nested configuration attribute as
-    following,
+    Variable names are split on every `NESTING_SLUG`, so configuration data
+    can be nested at any depth. When a variable and nested variables share a
+    name (`CFGORM_KEY1` and `CFGORM_KEY1__NESTEDKEY1`), the nested variables
+    win.
 
-    ```env    
-    CFGORM_KEY1__NESTEDKEY1__NESTEDKEY1 = VALUE
+    ```env
+    CFGORM_KEY1__NESTEDKEY1__NESTEDKEY2 = VALUE
     CFGORM_KEY2__NESTEDKEY1 = VALUE
     CFGORM_KEY3 = VALUE
     ```
@@ -46,7 +102,9 @@ class ENVSource(BaseSource):
     ```python
     data = {
         'KEY1': {
-            'NESTEDKEY1__NESTEDKEY1': 'VALUE'
+            'NESTEDKEY1': {
+                'NESTEDKEY2': 'VALUE'
+            }
         },
         'KEY2': {
             'NESTEDKEY1': 'VALUE'
@@ -55,9 +113,22 @@ class ENVSource(BaseSource):
     }
     ```
 
+    Built with a `schema`, the source looks up only the variables holding
+    the fields of the schema instead of scanning the whole environment, and
+    decodes their values according to the field types, so lists,
+    dictionaries (as JSON), booleans and durations can be set in variables,
+    see [py_configorm.validators.env][]. Saving encodes values the same way.
+
+    The loaded data is cached along with the variables it was built from,
+    so loading again while they are unchanged only scans the environment.
+    The returned data is shared between loads and must be treated as
+    read-only.
+
     Attributes:
         prefix (str): The prefix for environment variables.
         nesting_slug (str): The string used to determine nesting in environment variables.
+        schema (Type[ConfigSchema] | None): The schema whose fields are looked
+            up, default is `None` (scan every variable with the prefix).
 
     Methods:
         __init__(self, prefix: str = "CFGORM", readonly: bool = True, nesting_slug: str = "__"):
@@ -83,11 +154,41 @@ class ENVSource(BaseSource):
     """
 
     def __init__(
-        self, prefix: str = "CFGORM_", readonly: bool = True, nesting_slug: str = "__"
+        self,
+        prefix: str = "CFGORM_",
+        readonly: bool = True,
+        nesting_slug: str = "__",
+        schema: "Type[ConfigSchema] | None" = None,
     ):
         super().__init__(None, readonly)
         self._prefix = prefix
         self._nesting_slug = nesting_slug
+        self._schema = schema
+        self._fields: "List[EnvField] | None" = None
+        if schema is not None:
+            from py_configorm.validators.env import env_fields
+
+            self._fields = env_fields(schema, prefix, nesting_slug)
+
+        # The last variables loaded (and fingerprinted) and their result.
+        #
+        self._index: Tuple[Tuple, Dict[str, Any]] | None = None
+        self._fingerprint: Tuple[Tuple, str] | None = None
+
+    def _variables(self) -> Tuple:
+        """
+        The prefixed `(name, value)` variables, or with a schema the value of
+        every field variable, `None` if unset.
+        """
+        environ = os.environ
+        if self._fields is not None:
+            return tuple(environ.get(name) for name, _, _ in self._fields)
+
+        # os.environ decodes every name and value it returns, only decode the
+        # values of the prefixed variables.
+        #
+        prefix = self._prefix
+        return tuple((k, environ[k]) for k in environ if k.startswith(prefix))
 
     def load(self) -> dict:
         """Load configuration data from this source.
@@ -95,26 +196,79 @@ class ENVSource(BaseSource):
         Returns:
             dict: The loaded configuration data.
         """
-        vars_ = {
-            k[len(self._prefix) :]: v
-            for k, v in os.environ.items()
-            if k.startswith(self._prefix)
-        }
-
-        data = {}
-        for key, value in vars_.items():
-            l1_keys = key.split(self._nesting_slug, maxsplit=1)
-            if l1_keys[0] in data:
-                if l1_keys[1] in data[l1_keys[0]]:
-                    data[l1_keys[0]][l1_keys[1]] = value
-                else:
-                    data[l1_keys[0]][l1_keys[1]] = {}
-                    data[l1_keys[0]][l1_keys[1]] = value
+        variables = self._variables()
+        index = self._index
+        if index is None or index[0] != variables:
+            if self._fields is not None:
+                from py_configorm.validators.env import load_fields
+
+                data = load_fields(self._fields, variables)
             else:
-                data[l1_keys[0]] = {}
-                data[l1_keys[0]][l1_keys[1]] = value
+                data = nest_variables(variables, len(self._prefix), self._nesting_slug)
+            index = self._index = (variables, data)
+
+        # The cached data is copied, callers may change what they load.
+        #
+        return _copy(index[1])
+
+    def save_changes(self, data: dict, changes: Dict[Tuple[str, ...], Any]):
+        """Save only the changed variables.
+
+        Args:
+            data (dict): The configuration data, only read with a schema.
+            changes (dict): The changed values keyed by path.
+        """
+        if self.readonly:
+            raise PermissionError("This source is read-only.")
+
+        if self._fields is not None:
+            self._save_fields(data, changes)
+            return
+
+        for path, value in changes.items():
+            name = self._prefix + self._nesting_slug.join(path)
+            if value is DELETED:
+                os.environ.pop(name, None)
+                for key in [k for k in os.environ if k.startswith(name + self._nesting_slug)]:
+                    del os.environ[key]
+                continue
+
+            os.environ.update(flatten_variables(name, value, self._nesting_slug))
+
+    def cache_options(self) -> Hashable:
+        from py_configorm.validators.schema import schema_digest
+
+        schema = None if self._schema is None else schema_digest(self._schema)
+        return (self._prefix, self._nesting_slug, schema)
+
+    def fingerprint(self, content_hash: bool = False) -> Hashable | None:
+        """Digest of the environment variables starting with the prefix.
+
+        Args:
+            content_hash (bool): Ignored, the digest always covers the values.
 
-        return data
+        Returns:
+            Hashable: The fingerprint.
+        """
+        variables = self._variables()
+        fingerprint = self._fingerprint
+        if fingerprint is not None and fingerprint[0] == variables:
+            return fingerprint[1]
+
+        if self._fields is not None:
+            items = [
+                (name, value)
+                for (name, _, _), value in zip(self._fields, variables)
+                if value is not None
+            ]
+        else:
+            items = sorted(variables)
+
+        digest = hashlib.blake2b()
+        for key, value in items:
+            digest.update(f"{key}\0{value}\0".encode())
+        self._fingerprint = (variables, digest.hexdigest())
+        return self._fingerprint[1]
 
     def save(self, data: dict):
         """Save configuration data to this source.
@@ -125,11 +279,71 @@ class ENVSource(BaseSource):
         if self.readonly:
             raise PermissionError("This source is read-only.")
 
-        for k0, v0 in data.items():
-            if isinstance(v0, dict):
-                for k1, v1 in v0.items():
-                    if isinstance(v1, dict):
-                        raise ValueError("Only one level of nesting is supported.")
-                    os.environ[self._prefix + k0 + self._nesting_slug + k1] = v1
-            else:
-                os.environ[self._prefix + k0] = v0
+        if self._fields is not None:
+            self._save_fields(data)
+            return
+
+        for key, value in data.items():
+            os.environ.update(flatten_variables(self._prefix + key, value, self._nesting_slug))
+
+    def _save_fields(
+        self, data: dict, changes: Dict[Tuple[str, ...], Any] | None = None
+    ):
+        """Set the variable of every field in the data, encoded for its type.
+
+        Variables of `None` values are unset, there is no way to tell them from
+        strings otherwise.
+
+        Args:
+            data (dict): The configuration data.
+            changes (dict | None): The changed values keyed by path, only the
+                variables of changed fields are set, and those of fields
+                missing from the data are unset.
+        """
+        from py_configorm.validators.env import changed_fields, encode
+
+        fields = self._fields if changes is None else changed_fields(self._fields, changes)
+        for name, path, _ in fields:
+            value = get_path(data, path, DELETED)
+            if value is None or (changes is not None and value is DELETED):
+                os.environ.pop(name, None)
+            elif value is not DELETED:
+                os.environ[name] = encode(value)
+
+
+class AsyncENVSource(ENVSource, AsyncBaseSource):
+    """
+    Asynchronous environment variable configuration source.
+
+    Same as [py_configorm.sources.env_source.ENVSource][]. Environment
+    variables are process memory, so no worker thread is needed and both
+    coroutines complete without suspending.
+    """
+
+    async def aload(self) -> dict:
+        """
+        Load configuration data from this source.
+
+        Returns:
+            dict: The loaded configuration data.
+        """
+        return self.load()
+
+    async def asave(self, data: dict):
+        """
+        Save configuration data to this source.
+
+        Args:
+            data (dict): The configuration data to save.
+        """
+        self.save(data)
+
+    async def asave_changes(self, data: dict, changes: Dict[Tuple[str, ...], Any]):
+        """
+        Save the changed variables only, see `save_changes`.
+
+        Args:
+            data (dict): The configuration data to save.
+            changes (dict): The changed values keyed by path.
+        """
+        self.save_changes(data, changes)
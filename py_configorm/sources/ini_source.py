@@ -7,9 +7,116 @@ from INI files.
 Attributes:
     INISource (INISource): The INISource class.
 """
+
 import configparser
+import functools
+import re
 from pathlib import Path
-from py_configorm.sources.base import BaseSource
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Mapping, Set, Tuple, Type
+
+from py_configorm.exception import ConfigORMError
+from py_configorm.merge import select
+from py_configorm.sources.base import AsyncBaseSource, BaseSource
+
+if TYPE_CHECKING:
+    from py_configorm.core import ConfigSchema
+
+# Section headers, as matched by configparser on a stripped line. Headers at
+# the start of a line are always headers, indented ones may be continuation
+# lines of a value.
+#
+_HEADER = re.compile(rb"^\[(.+)\]", re.M)
+_INDENTED_HEADER = re.compile(rb"^[ \t\f\v]+\[", re.M)
+
+# Option names and delimiters, as matched by configparser on a stripped line.
+#
+_OPTION = re.compile(r"(?P<option>.*?)\s*[=:]\s*")
+
+_MISSING = object()
+
+
+def _headers(raw: bytes) -> List[Tuple[str, int]]:
+    """Name and offset of every section header of an INI file."""
+    if _INDENTED_HEADER.search(raw) is None:
+        return [(match[1].decode("utf-8"), match.start()) for match in _HEADER.finditer(raw)]
+
+    # Tell headers from continuation lines the way configparser does: a line
+    # indented deeper than the option above it continues its value, comments
+    # and blank lines are skipped.
+    #
+    headers = []
+    pos, option, indent_level = 0, False, 0
+    for line in bytes(raw).split(b"\n"):
+        start, pos = pos, pos + len(line) + 1
+        value = line.strip()
+        if not value or value[:1] in (b"#", b";"):
+            continue
+        indent = len(line) - len(line.lstrip())
+        if option and indent > indent_level:
+            continue
+        indent_level = indent
+        match = _HEADER.match(value)
+        if match is not None:
+            headers.append((match[1].decode("utf-8"), start))
+        option = match is None
+    return headers
+
+
+def _sections(raw: bytes) -> List[Tuple["str | None", int, int]]:
+    """
+    Name, start and end offsets of every section, the lines before the first
+    header come first, named `None`.
+    """
+    headers = [(None, 0)] + _headers(raw)
+    ends = [start for _, start in headers[1:]] + [len(raw)]
+    return [(name, start, end) for (name, start), end in zip(headers, ends)]
+
+
+def _option_spans(lines: List[str]) -> Dict[str, Tuple[int, int, str]]:
+    """
+    First and end line, and the text before the value, of every option of a
+    section, keyed by lowercase name. The first line is the header.
+
+    Continuation lines are told apart the way configparser does, the blank
+    and comment lines after a value aren't part of it.
+    """
+    spans: Dict[str, Tuple[int, int, str]] = {}
+    key, indent_level = None, 0
+    for i, line in enumerate(lines[1:], 1):
+        value = line.strip()
+        if not value:
+            continue
+        indent = len(line) - len(line.lstrip())
+        if value[:1] in ("#", ";"):
+            key = None
+        elif key is not None and indent > indent_level:
+            spans[key] = (spans[key][0], i + 1, spans[key][2])
+        else:
+            match = _OPTION.match(value)
+            if match is None:
+                key = None
+                continue
+            key, indent_level = match["option"].lower(), indent
+            spans[key] = (i, i + 1, line[:indent] + value[: match.end()])
+    return spans
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_options(
+    schema: Type["ConfigSchema"],
+) -> Dict[str, Dict[str, Tuple[str, "Callable[[str], Any] | None"]]]:
+    """Field name and decoder of the options of every section of a schema."""
+    from py_configorm.validators.env import decoder
+    from py_configorm.validators.schema import iter_fields, model_type
+
+    # configparser lowercases option names.
+    #
+    options: Dict[str, Dict[str, Tuple[str, Any]]] = {}
+    for path, field in iter_fields(schema):
+        if len(path) == 2 and model_type(field.annotation) is None:
+            section, name = path
+            options.setdefault(section, {})[name.lower()] = (name, decoder(field.annotation))
+    return options
 
 
 class INISource(BaseSource):
@@ -17,36 +124,288 @@ class INISource(BaseSource):
     A source that reads configuration from an INI file.
 
     This class provides a way to read and parse configuration data from an INI
-    file. The data can be accessed using standard dictionary-like syntax, making
-    it easy to integrate with other parts of the application.
+    file. Every section is a dictionary of its options, which include the
+    options of the `DEFAULT` section, with `%(name)s` references expanded.
+
+    Sections are loaded lazily: with `selective=True`, [py_configorm.core.ConfigORM][]
+    only loads the sections the schema reads, and the other sections are
+    skipped by their header without being parsed, see
+    [py_configorm.validators.schema.field_selection][].
+
+    Built with a `schema`, options are decoded according to the types of the
+    fields of the section models and keyed by field name (option names are
+    case-insensitive), like the variables of
+    [py_configorm.sources.env_source.ENVSource][]. Without, options are strings
+    keyed by their lowercase name.
+
+    Saving rewrites only the options whose value changed, so the comments
+    and layout of the file are kept as they are.
 
     Attributes:
         - file_path (str): The path to the INI file.
-        - config_data (dict): A dictionary containing the parsed configuration
-            data from the INI file.
+        - schema (Type[ConfigSchema] | None): The schema whose options are
+            decoded, default is `None` (every option is a string).
     """
 
-    def __ini__(self, file_path: Path | None, readonly: bool = True):
-        super().__init__(file_path, readonly)
+    def __init__(
+        self,
+        filepath: Path | None,
+        readonly: bool = True,
+        schema: "Type[ConfigSchema] | None" = None,
+    ):
+        super().__init__(filepath, readonly)
+        self._schema = schema
+        self._options = _schema_options(schema) if schema is not None else None
+
+    def cache_options(self) -> Hashable:
+        from py_configorm.validators.schema import schema_digest
+
+        return (None if self._schema is None else schema_digest(self._schema),)
 
     def load(self) -> dict:
+        """
+        Load configuration data from this source.
+
+        Returns:
+            dict: The loaded configuration data.
+
+        Raises:
+            FileNotFoundError: If the specified INI file does not exist.
+
+            configparser.Error: If there is an error parsing the INI file.
+        """
         try:
-            with open(self.filepath, "r") as f:
-                parser_ = configparser.ConfigParser()
-                parser_.read_file(f)
-                return {s: dict(parser_.items(s)) for s in parser_.sections()}
+            with self._raw() as raw:
+                return self._parse(raw)
         except Exception as e:
             raise e
 
+    def _parse(self, raw: bytes) -> dict:
+        return self._data(self._parser(str(raw, "utf-8")))
+
+    def _parse_selected(self, raw: bytes, selection: Dict[str, Any]) -> dict:
+        # Only the lines before the first header, the DEFAULT sections and the
+        # selected sections are parsed. Sections are kept whole, option names
+        # may differ from the field names in case.
+        #
+        chunks = [
+            raw[start:end]
+            for name, start, end in _sections(raw)
+            if name in (None, configparser.DEFAULTSECT) or name in selection
+        ]
+        data = self._data(self._parser(b"".join(chunks).decode("utf-8")))
+        return select(data, {name: None for name in selection})
+
+    def _parser(self, text: str) -> configparser.ConfigParser:
+        parser = configparser.ConfigParser()
+        parser.read_string(text, source=str(self._filepath))
+        return parser
+
+    def _data(self, parser: configparser.ConfigParser) -> dict:
+        """Options of every section, decoded with the schema if any."""
+        if self._options is None:
+            return {s: dict(parser.items(s)) for s in parser.sections()}
+
+        data = {}
+        for s in parser.sections():
+            fields = self._options.get(s, {})
+            data[s] = {
+                fields.get(key, (key, None))[0]: value
+                for key, value in self._decoded(parser, s).items()
+            }
+        return data
+
+    def _decoded(self, parser: configparser.ConfigParser, name: str) -> Dict[str, Any]:
+        """Options of a section keyed by lowercase name, decoded with the schema if any."""
+        if not parser.has_section(name):
+            return {}
+        if self._options is None:
+            return dict(parser.items(name))
+
+        fields = self._options.get(name, {})
+        section = {}
+        for key, value in parser.items(name):
+            decode = fields.get(key, (key, None))[1]
+            section[key] = value if decode is None else decode(value)
+        return section
+
     def save(self, data: dict):
+        """
+        Save configuration data to this source.
+
+        Sections holding the same options as the file are left untouched, in
+        the others only the changed options are rewritten in place, new
+        sections are appended and sections missing from the data are
+        removed. Values are compared once decoded, unchanged options keep
+        their spelling and text, `%(name)s` references included, and options
+        inherited from the `DEFAULT` section are not repeated.
+
+        Args:
+            data (dict): The configuration data to save.
+
+        Raises:
+            PermissionError: If the source is read-only.
+
+            ConfigORMError: If a top-level value isn't a section.
+        """
+        self._save(data, None)
+
+    def save_changes(self, data: dict, changes: Dict[Tuple[str, ...], Any]):
+        """
+        Save only the sections holding changes, the others aren't parsed.
+
+        Args:
+            data (dict): The configuration data to save.
+            changes (dict): The changed values keyed by path.
+        """
+        self._save(data, {path[0] for path in changes})
+
+    def _save(self, data: dict, names: "Set[str] | None"):
+        """Rewrite the sections of the data, of the given names or all."""
+        if self.readonly:
+            raise PermissionError("This source is read-only.")
+
         try:
-            if self.readonly:
-                raise PermissionError("This source is readonly.")
+            with self._raw() as raw:
+                chunks = [(name, raw[start:end]) for name, start, end in _sections(raw)]
+        except FileNotFoundError:
+            chunks = [(None, b"")]
 
-            raise NotImplementedError("This source doesn't support save.")
+        sections = {
+            name: self._section_options(name, section)
+            for name, section in data.items()
+            if section is not None and (names is None or name in names)
+        }
+        default = configparser.DEFAULTSECT
+        parser = self._parser(
+            b"".join(
+                chunk for name, chunk in chunks if name in (None, default) or name in sections
+            ).decode("utf-8")
+        )
 
-        except Exception as e:
-            raise e
+        pieces = []
+        changed = False
+        for name, chunk in chunks:
+            if name in (None, default) or (names is not None and name not in names):
+                pieces.append(chunk)
+            elif name not in sections:
+                changed = True
+            elif {
+                key: value for key, (_, value) in sections[name].items()
+            } == self._decoded(parser, name):
+                pieces.append(chunk)
+            else:
+                pieces.append(self._render(name, sections[name], parser, chunk))
+                changed = True
+
+        for name, options in sections.items():
+            if name != default and not parser.has_section(name):
+                tail = b"".join(pieces)[-2:]
+                if tail and tail != b"\n\n":
+                    pieces.append(b"\n" if tail.endswith(b"\n") else b"\n\n")
+                pieces.append(self._render(name, options, parser, b""))
+                changed = True
+
+        if changed:
+            with self._atomic_write("wb") as f:
+                f.write(b"".join(pieces))
+
+    @staticmethod
+    def _section_options(name: str, section: Any) -> Dict[str, Tuple[str, Any]]:
+        """Name and value of the options of a section, keyed by lowercase name."""
+        if not isinstance(section, Mapping):
+            raise ConfigORMError(f"INI files only hold sections, '{name}' is not one.")
+        return {k.lower(): (k, v) for k, v in section.items() if v is not None}
+
+    def _render(
+        self,
+        name: str,
+        options: Dict[str, Tuple[str, Any]],
+        parser: configparser.ConfigParser,
+        chunk: bytes,
+    ) -> bytes:
+        """
+        A section with its changed options rewritten, its other lines as they
+        are, or as configparser writes it if new.
+        """
+        from py_configorm.validators.env import encode
+
+        def option(prefix: str, value: Any) -> str:
+            text = encode(value).replace("%", "%%").replace("\n", "\n\t")
+            return f"{prefix}{text}\n"
+
+        current = self._decoded(parser, name)
+        lines = chunk.decode("utf-8").splitlines(keepends=True) or [f"[{name}]\n"]
+        spans = _option_spans(lines)
+
+        # Options are replaced or removed from the last one up, so that the
+        # line numbers of the others hold.
+        #
+        for key, (start, end, prefix) in sorted(spans.items(), key=lambda s: -s[1][0]):
+            if key not in options:
+                del lines[start:end]
+            elif options[key][1] != current.get(key, _MISSING):
+                lines[start:end] = [option(prefix, options[key][1])]
+
+        # New options, and options overriding those inherited from the
+        # DEFAULT section, follow the last option, before the blank and
+        # comment lines ending the section.
+        #
+        added = [
+            option(f"{spelling} = ", value)
+            for key, (spelling, value) in options.items()
+            if key not in spans and value != current.get(key, _MISSING)
+        ]
+        if added:
+            at = len(lines)
+            while at > 1 and lines[at - 1].strip()[:1] in ("", "#", ";"):
+                at -= 1
+            if not lines[at - 1].endswith("\n"):
+                lines[at - 1] += "\n"
+            lines[at:at] = added
+
+        text = "".join(lines).encode("utf-8")
+        return text if chunk else text + b"\n"
+
+
+class AsyncINISource(INISource, AsyncBaseSource):
+    """
+    Asynchronous INI configuration source.
+
+    Same as [py_configorm.sources.ini_source.INISource][], except that file I/O
+    and parsing run on a worker thread, so the event loop is never blocked.
+    """
+
+    async def aload(self) -> dict:
+        """
+        Load configuration data from this source without blocking the event loop.
+
+        Returns:
+            dict: The loaded configuration data.
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.load)
+
+    async def asave(self, data: dict):
+        """
+        Save configuration data to this source without blocking the event loop.
+
+        Args:
+            data (dict): The configuration data to save.
+        """
+        import asyncio
+
+        await asyncio.to_thread(self.save, data)
+
+    async def asave_changes(self, data: dict, changes: Dict[Tuple[str, ...], Any]):
+        """
+        Save the changes without blocking the event loop, see `save_changes`.
+
+        Args:
+            data (dict): The configuration data to save.
+            changes (dict): The changed values keyed by path.
+        """
+        import asyncio
 
-    def reload(self) -> dict:
-        pass
+        await asyncio.to_thread(self.save_changes, data, changes)
@@ -7,17 +7,53 @@ Attributes:
 
 """
 
-import json
 from pathlib import Path
+from typing import Any, Callable, Tuple
 
-from py_configorm.sources.base import BaseSource
+from py_configorm.sources.base import AsyncBaseSource, BaseSource, select_backend
+
+# Decoder backends, in order of preference. Both decode bytes, and encode to
+# bytes so that files are written from a single buffer.
+#
+BACKENDS = ("orjson", "json")
+
+
+def _codec(backend: str) -> Tuple[Callable[[Any], Any], Callable[[Any], bytes]]:
+    # Decoders also get memory-mapped files: orjson parses the mapped buffer
+    # in place, json only decodes bytes and str.
+    #
+    if backend == "orjson":
+        import orjson
+
+        def loads(raw):
+            with memoryview(raw) as view:
+                return orjson.loads(view)
+
+        # Keys of `Dict[int, ...]` fields are written as strings, as json does.
+        #
+        def dumps(data):
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+        return loads, dumps
+
+    import json
+
+    def loads(raw):
+        return json.loads(raw if isinstance(raw, bytes) else str(raw, "utf-8"))
+
+    return loads, lambda data: json.dumps(data).encode("utf-8")
 
 
 class JSONSource(BaseSource):
     """A class for a JSON configuration source.
 
+    Files are read as bytes in one call and decoded with `orjson` if
+    installed, the standard library `json` module otherwise. Pass
+    `backend="json"` or `backend="orjson"` to pick the decoder of one source.
+
     Attributes:
         _file_path (Path): The path to the JSON configuration file.
+        backend (str): The decoder backend, one of `BACKENDS`.
 
     Methods:
         __init__(self, file_path: Path, readonly: bool = True):
@@ -42,8 +78,11 @@ class JSONSource(BaseSource):
             configuration data must be reloaded from the source.
     """
 
-    def __init__(self, filepath: Path | None, readonly: bool = True):
+    def __init__(
+        self, filepath: Path | None, readonly: bool = True, backend: str | None = None
+    ):
         super().__init__(filepath, readonly)
+        self._backend = select_backend("JSON backend", BACKENDS, backend)
 
     def load(self) -> dict:
         """
@@ -62,11 +101,14 @@ class JSONSource(BaseSource):
 
         """
         try:
-            with open(self.filepath, "r") as f:
-                return json.load(f)
+            with self._raw() as raw:
+                return self._parse(raw)
         except Exception as e:
             raise e
 
+    def _parse(self, raw: bytes) -> dict:
+        return _codec(self._backend)[0](raw)
+
     def save(self, data: dict):
         """
         Save configuration data to this source.
@@ -84,7 +126,43 @@ class JSONSource(BaseSource):
             if self.readonly:
                 raise PermissionError("This source is read-only.")
 
-            with open(self.filepath, "w") as f:
-                json.dump(data, f)
+            raw = _codec(self._backend)[1](data)
+            with self._atomic_write("wb") as f:
+                f.write(raw)
         except Exception as e:
-            raise e
\ No newline at end of file
+            raise e
+
+    @property
+    def backend(self) -> str:
+        return self._backend
+
+
+class AsyncJSONSource(JSONSource, AsyncBaseSource):
+    """
+    Asynchronous JSON configuration source.
+
+    Same as [py_configorm.sources.json_source.JSONSource][], except that file I/O
+    and parsing run on a worker thread, so the event loop is never blocked.
+    """
+
+    async def aload(self) -> dict:
+        """
+        Load configuration data from this source without blocking the event loop.
+
+        Returns:
+            dict: The loaded configuration data.
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.load)
+
+    async def asave(self, data: dict):
+        """
+        Save configuration data to this source without blocking the event loop.
+
+        Args:
+            data (dict): The configuration data to save.
+        """
+        import asyncio
+
+        await asyncio.to_thread(self.save, data)
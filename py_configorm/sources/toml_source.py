@@ -8,11 +8,27 @@ Attributes:
     TOMLSource (TOMLSource): The TOMLSource class.
 """
 
+import importlib
 from pathlib import Path
 from typing import Any, Dict
 
-import toml
-from py_configorm.sources.base import BaseSource
+from py_configorm.sources.base import AsyncBaseSource, BaseSource, select_backend
+
+# Parser backends, in order of preference. Every backend module provides
+# `loads` (readers) or `dumps` (writers), and is imported on first use.
+#
+READERS = ("tomllib", "tomli", "toml")
+WRITERS = ("tomli_w", "toml")
+
+
+def _drop_none(data: Dict[str, Any]) -> Dict[str, Any]:
+    # TOML has no null, `toml` skips `None` values but `tomli_w` rejects them.
+    #
+    return {
+        key: _drop_none(value) if isinstance(value, dict) else value
+        for key, value in data.items()
+        if value is not None
+    }
 
 
 class TOMLSource(BaseSource):
@@ -20,8 +36,10 @@ class TOMLSource(BaseSource):
     TOML configuration source.
 
     This class is a subclass of `BaseSource` and represents a TOML configuration
-    source. It uses `toml` package to load and save configuration data from/to
-    a TOML file.
+    source. It loads configuration data with the first installed of `tomllib`
+    (standard library since Python 3.11), `tomli` and `toml`, and saves it with
+    `tomli_w` if installed, `toml` otherwise. Either backend can be chosen per
+    instance with `reader` and `writer`.
 
     ```toml
     Key1 = "Value1"
@@ -43,6 +61,8 @@ class TOMLSource(BaseSource):
     Attributes:
         filepath (Path): The path to the TOML configuration file in URL syntax.
         readonly (bool): Whether the source is read-only, default is `True`.
+        reader (str): The backend loading the file, one of `READERS`.
+        writer (str): The backend saving the file, one of `WRITERS`.
 
     Methods:
         load(self) -> dict:
@@ -58,8 +78,16 @@ class TOMLSource(BaseSource):
                 data (dict): The configuration data to save.
     """
 
-    def __init__(self, filepath: Path, readonly: bool = True):
+    def __init__(
+        self,
+        filepath: Path,
+        readonly: bool = True,
+        reader: str | None = None,
+        writer: str | None = None,
+    ):
         super().__init__(filepath, readonly)
+        self._reader = select_backend("TOML reader", READERS, reader)
+        self._writer = select_backend("TOML writer", WRITERS, writer)
 
     def load(self) -> Dict[str, Any]:
         """
@@ -73,14 +101,17 @@ class TOMLSource(BaseSource):
             dict: The loaded configuration data.
         """
         try:
-            with open(self.filepath.resolve(), "r") as f:
-                # Load raw data from TOML file, at this point it's just a
-                # dictionary containing the TOML data.
-                #
-                return toml.load(f)
+            # Load raw data from TOML file, at this point it's just a
+            # dictionary containing the TOML data.
+            #
+            with self._raw() as raw:
+                return self._parse(raw)
         except Exception as e:
             raise e
 
+    def _parse(self, raw: bytes) -> Dict[str, Any]:
+        return importlib.import_module(self._reader).loads(str(raw, "utf-8"))
+
     def save(self, data: dict):
         """
         Save configuration data to this source.
@@ -99,7 +130,47 @@ class TOMLSource(BaseSource):
             if self.readonly:
                 raise PermissionError("This source is read-only.")
 
-            with open(self.filepath, "w") as f:
-                toml.dump(data, f)
+            text = importlib.import_module(self._writer).dumps(_drop_none(data))
+            with self._atomic_write() as f:
+                f.write(text)
         except Exception as e:
             raise e
+
+    @property
+    def reader(self) -> str:
+        return self._reader
+
+    @property
+    def writer(self) -> str:
+        return self._writer
+
+
+class AsyncTOMLSource(TOMLSource, AsyncBaseSource):
+    """
+    Asynchronous TOML configuration source.
+
+    Same as [py_configorm.sources.toml_source.TOMLSource][], except that file I/O
+    and parsing run on a worker thread, so the event loop is never blocked.
+    """
+
+    async def aload(self) -> Dict[str, Any]:
+        """
+        Load configuration data from this source without blocking the event loop.
+
+        Returns:
+            dict: The loaded configuration data.
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.load)
+
+    async def asave(self, data: dict):
+        """
+        Save configuration data to this source without blocking the event loop.
+
+        Args:
+            data (dict): The configuration data to save.
+        """
+        import asyncio
+
+        await asyncio.to_thread(self.save, data)
@@ -6,9 +6,160 @@ This module is part of the `configorm` package for handling configuration data.
 """
 
 from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator
+
 import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.events import (
+    AliasEvent,
+    CollectionEndEvent,
+    CollectionStartEvent,
+    NodeEvent,
+)
+from yaml.nodes import ScalarNode
+from yaml.parser import Parser
+from yaml.reader import Reader
+from yaml.resolver import Resolver
+from yaml.scanner import Scanner
+
 from py_configorm.exception import ConfigORMError
-from py_configorm.sources.base import BaseSource
+from py_configorm.merge import merge
+from py_configorm.sources.base import AsyncBaseSource, BaseSource
+
+# Loader and dumper of each backend, `libyaml` is only available when PyYAML
+# is built with it.
+#
+BACKENDS = {
+    "libyaml": (getattr(yaml, "CSafeLoader", None), getattr(yaml, "CSafeDumper", None)),
+    "python": (yaml.SafeLoader, yaml.SafeDumper),
+}
+
+
+
+class _SelectiveComposer(Composer):
+    """
+    Composer skipping the events of mapping values which aren't selected, so
+    no node, and therefore no object, is built for them.
+
+    Anchored nodes are composed whole, wherever they are, since an alias may
+    use them anywhere later in the document.
+    """
+
+    def __init__(self, selection: Dict[str, Any]):
+        Composer.__init__(self)
+        self._selections = [selection]
+
+    def compose_node(self, parent, index):
+        event = self.peek_event()
+        if isinstance(event, AliasEvent) or event.anchor is None:
+            return Composer.compose_node(self, parent, index)
+
+        self._selections.append(None)
+        try:
+            return Composer.compose_node(self, parent, index)
+        finally:
+            self._selections.pop()
+
+    def compose_sequence_node(self, anchor):
+        self._selections.append(None)
+        try:
+            return Composer.compose_sequence_node(self, anchor)
+        finally:
+            self._selections.pop()
+
+    def compose_mapping_node(self, anchor):
+        selection = self._selections[-1]
+        if selection is None:
+            return Composer.compose_mapping_node(self, anchor)
+
+        # Same as Composer.compose_mapping_node, skipping what isn't selected.
+        # Merge keys (`<<`) are always kept.
+        #
+        start_event = self.get_event()
+        tag = start_event.tag
+        if tag is None or tag == "!":
+            tag = self.resolve(yaml.MappingNode, None, start_event.implicit)
+        node = yaml.MappingNode(
+            tag, [], start_event.start_mark, None, flow_style=start_event.flow_style
+        )
+        if anchor is not None:
+            self.anchors[anchor] = node
+        while not self.check_event(yaml.MappingEndEvent):
+            self._selections.append(None)
+            try:
+                item_key = self.compose_node(node, None)
+            finally:
+                self._selections.pop()
+
+            key = item_key.value if isinstance(item_key, ScalarNode) else None
+            if key != "<<" and key not in selection:
+                self._skip_node()
+                continue
+
+            self._selections.append(selection.get(key))
+            try:
+                item_value = self.compose_node(node, item_key)
+            finally:
+                self._selections.pop()
+            node.value.append((item_key, item_value))
+        end_event = self.get_event()
+        node.end_mark = end_event.end_mark
+        return node
+
+    def _skip_node(self):
+        depth = 0
+        while True:
+            event = self.peek_event()
+            if (
+                isinstance(event, NodeEvent)
+                and not isinstance(event, AliasEvent)
+                and event.anchor is not None
+            ):
+                self.compose_node(None, None)
+            else:
+                self.get_event()
+                if isinstance(event, CollectionStartEvent):
+                    depth += 1
+                elif isinstance(event, CollectionEndEvent):
+                    depth -= 1
+            if depth == 0:
+                return
+
+
+class _SelectiveLoader(
+    Reader, Scanner, Parser, _SelectiveComposer, SafeConstructor, Resolver
+):
+    def __init__(self, stream, selection: Dict[str, Any]):
+        Reader.__init__(self, stream)
+        Scanner.__init__(self)
+        Parser.__init__(self)
+        _SelectiveComposer.__init__(self, selection)
+        SafeConstructor.__init__(self)
+        Resolver.__init__(self)
+
+
+SELECTIVE_LOADERS = {"python": _SelectiveLoader}
+
+if yaml.__with_libyaml__:
+    from yaml.cyaml import CParser
+
+    class _CSelectiveLoader(_SelectiveComposer, CParser, SafeConstructor, Resolver):
+        # libyaml parses, the composer comes first so that its methods are
+        # used instead of the CParser ones, which compose whole documents.
+        #
+        def __init__(self, stream, selection: Dict[str, Any]):
+            CParser.__init__(self, stream)
+            _SelectiveComposer.__init__(self, selection)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+    SELECTIVE_LOADERS["libyaml"] = _CSelectiveLoader
+
+
+def _documents(loader) -> Iterator[Any]:
+    while loader.check_data():
+        yield loader.get_data()
 
 
 class YAMLSource(BaseSource):
@@ -19,8 +170,21 @@ class YAMLSource(BaseSource):
     source. It provides methods to load and save configuration data from/to a
     YAML file.
 
+    Files are parsed and written with PyYAML's libyaml bindings
+    (`CSafeLoader` and `CSafeDumper`) when PyYAML is built with libyaml, with
+    the pure-Python `SafeLoader` and `SafeDumper` otherwise. Pass
+    `backend="libyaml"` to require libyaml, or `backend="python"` to never
+    use it.
+
+    With `multi_document`, the file is a stream of documents, e.g. a base
+    configuration followed by overrides, which are merged in order, later
+    documents taking precedence. Documents are parsed and merged one at a
+    time. Saving writes the merged data as a single document.
+
     Attributes:
         _file_path (Path): The path to the YAML configuration file.
+        backend (str): `"libyaml"` or `"python"`.
+        multi_document (bool): Whether the file is a stream of documents.
 
     Methods:
         __init__(self, file_path: Path, readonly: bool = True):
@@ -45,8 +209,28 @@ class YAMLSource(BaseSource):
             configuration data must be reloaded from the source.
     """
 
-    def __init__(self, filepath: Path, readonly: bool = True):
+    def __init__(
+        self,
+        filepath: Path,
+        readonly: bool = True,
+        backend: str | None = None,
+        multi_document: bool = False,
+    ):
         super().__init__(filepath, readonly)
+        if backend is None:
+            backend = "libyaml" if yaml.__with_libyaml__ else "python"
+        elif backend not in BACKENDS:
+            raise ConfigORMError(
+                f"Unknown YAML backend '{backend}', expected one of {', '.join(BACKENDS)}."
+            )
+        elif BACKENDS[backend][0] is None:
+            raise ConfigORMError("PyYAML is not built with libyaml.")
+
+        self._backend = backend
+        self._multi_document = multi_document
+
+    def cache_options(self) -> Hashable:
+        return (self._multi_document,)
 
     def load(self) -> dict:
         """
@@ -56,11 +240,26 @@ class YAMLSource(BaseSource):
             dict: The loaded configuration data.
         """
         try:
-            with open(self.filepath, "r") as f:
-                return yaml.safe_load(f)
+            with self._raw() as raw:
+                return self._parse(raw)
         except Exception as e:
             raise e
 
+    def _parse(self, raw: bytes) -> dict:
+        loader = BACKENDS[self._backend][0]
+        if self._multi_document:
+            return merge(yaml.load_all(raw, Loader=loader))
+        return yaml.load(raw, Loader=loader)
+
+    def _parse_selected(self, raw: bytes, selection: Dict[str, Any]) -> dict:
+        loader = SELECTIVE_LOADERS[self._backend](raw, selection)
+        try:
+            if self._multi_document:
+                return merge(_documents(loader))
+            return loader.get_single_data()
+        finally:
+            loader.dispose()
+
     def save(self, data: dict):
         """
         Save configuration data to this source.
@@ -72,7 +271,46 @@ class YAMLSource(BaseSource):
             if self.readonly:
                 raise PermissionError("This source is read-only.")
 
-            with open(self.filepath, "w") as f:
-                yaml.dump(data, f)
+            with self._atomic_write() as f:
+                yaml.dump(data, f, Dumper=BACKENDS[self._backend][1])
         except Exception as e:
             raise e
+
+    @property
+    def backend(self) -> str:
+        return self._backend
+
+    @property
+    def multi_document(self) -> bool:
+        return self._multi_document
+
+
+class AsyncYAMLSource(YAMLSource, AsyncBaseSource):
+    """
+    Asynchronous YAML configuration source.
+
+    Same as [py_configorm.sources.yaml_source.YAMLSource][], except that file I/O
+    and parsing run on a worker thread, so the event loop is never blocked.
+    """
+
+    async def aload(self) -> dict:
+        """
+        Load configuration data from this source without blocking the event loop.
+
+        Returns:
+            dict: The loaded configuration data.
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.load)
+
+    async def asave(self, data: dict):
+        """
+        Save configuration data to this source without blocking the event loop.
+
+        Args:
+            data (dict): The configuration data to save.
+        """
+        import asyncio
+
+        await asyncio.to_thread(self.save, data)
@@ -0,0 +1,263 @@
+"""
+Instrumentation of loads, reloads and saves.
+
+This module provides the statistics collected by
+[py_configorm.core.ConfigORM][] when created with `instrumentation`, and the
+hooks connecting them to a metrics or tracing stack.
+
+Attributes:
+    SourceStats (SourceStats): The SourceStats class.
+    LoadStats (LoadStats): The LoadStats class.
+    Instrumentation (Instrumentation): The Instrumentation class.
+"""
+
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, ContextManager, Dict, List, Mapping, Tuple
+
+from py_configorm.merge import select
+
+
+@dataclass
+class SourceStats:
+    """
+    What loading or saving a single source cost.
+
+    Read and parse times are only measured separately for sources which read
+    raw bytes and parse them in two steps (the file sources), other sources
+    only report `load_s`.
+
+    Attributes:
+        index (int): Index of the source.
+        source (str): Representation of the source.
+        load_s (float | None): Wall time of the whole load, in seconds.
+        read_s (float | None): Wall time reading the raw data.
+        parse_s (float | None): Wall time parsing the raw data.
+        bytes_read (int | None): Size of the raw data.
+        keys (int | None): Number of values loaded.
+        save_s (float | None): Wall time of the save.
+    """
+
+    index: int
+    source: str
+    load_s: float | None = None
+    read_s: float | None = None
+    parse_s: float | None = None
+    bytes_read: int | None = None
+    keys: int | None = None
+    save_s: float | None = None
+
+
+@dataclass
+class LoadStats:
+    """
+    What a load, reload or save cost.
+
+    Attributes:
+        operation (str): `"load"`, `"reload"` or `"save"`.
+        generation (int | None): Generation of the configuration published
+            by a load or reload.
+        total_s (float): Wall time of the whole operation, in seconds.
+        merge_s (float | None): Wall time merging the sources.
+        validate_s (float | None): Wall time validating the merged data.
+        keys (int | None): Number of values in the merged data.
+        cached (bool): Whether the configuration came from the cache.
+        error (str | None): The error the operation failed with, if any.
+        sources (List[SourceStats]): The sources loaded (or saved), sources
+            which did not change are not loaded and not listed.
+    """
+
+    operation: str
+    generation: int | None = None
+    total_s: float = 0.0
+    merge_s: float | None = None
+    validate_s: float | None = None
+    keys: int | None = None
+    cached: bool = False
+    error: str | None = None
+    sources: List[SourceStats] = field(default_factory=list)
+
+
+class Instrumentation:
+    """
+    Hooks called while loading, reloading and saving.
+
+    Subclass and override the hooks to forward timings to a metrics or
+    tracing stack. Statistics are collected (and available as
+    [py_configorm.core.ConfigORM.load_stats][]) whatever the hooks do.
+
+    `span` wraps the operations and the stages which run on the calling
+    thread: `"py_configorm.load"`, `"py_configorm.reload"` and
+    `"py_configorm.save"`, and within loads `"py_configorm.merge"` and
+    `"py_configorm.validate"`. Sources may be loaded on worker threads or
+    processes, so they are reported after the fact to `on_source`.
+    """
+
+    def span(self, name: str, attributes: Dict[str, Any]) -> ContextManager:
+        """
+        Context manager wrapping an operation or stage, e.g. a tracing span.
+
+        Args:
+            name (str): The operation or stage.
+            attributes (dict): Attributes of the operation.
+        """
+        return nullcontext()
+
+    def on_source(self, stats: SourceStats):
+        """Called with the statistics of every source loaded or saved."""
+
+    def on_stats(self, stats: LoadStats):
+        """Called with the statistics of every operation, failed ones included."""
+
+
+def count_keys(data: Any) -> int:
+    """Number of values in configuration data, tables excluded."""
+    count, stack = 0, [data]
+    while stack:
+        table = stack.pop()
+        for value in table.values():
+            if isinstance(value, Mapping):
+                stack.append(value)
+            else:
+                count += 1
+    return count
+
+
+def measure_load(
+    index: int, source, selection: Dict[str, Any] | None = None
+) -> Tuple[Dict[str, Any], SourceStats]:
+    """
+    Load a source and measure it.
+
+    A module-level function, so that it can run in a process pool.
+    With a `selection`, only the selected keys are loaded, see
+    [py_configorm.sources.base.BaseSource.load_selected][].
+
+    Returns:
+        tuple: The loaded data and its statistics.
+    """
+    stats = SourceStats(index, repr(source))
+    start = time.perf_counter()
+    if source._splits_load():
+        with source._raw() as raw:
+            read = time.perf_counter()
+            if selection is None:
+                data = source._parse(raw)
+            else:
+                data = source._parse_selected(raw, selection)
+            stats.read_s = read - start
+            stats.parse_s = time.perf_counter() - read
+            stats.bytes_read = len(raw)
+    elif selection is None:
+        data = source.load()
+    else:
+        data = source.load_selected(selection)
+    stats.load_s = time.perf_counter() - start
+    stats.keys = count_keys(data or {})
+    return data, stats
+
+
+def measure_save(index: int, source, data, changes) -> SourceStats:
+    """
+    Save changes to a source and measure it.
+
+    Returns:
+        SourceStats: The statistics of the save.
+    """
+    start = time.perf_counter()
+    source.save_changes(data, changes)
+    return SourceStats(index, repr(source), save_s=time.perf_counter() - start)
+
+
+async def measure_aload(
+    index: int, source, selection: Dict[str, Any] | None = None
+) -> Tuple[Dict[str, Any], SourceStats]:
+    """
+    Load an asynchronous source and measure it.
+
+    Returns:
+        tuple: The loaded data and its statistics.
+    """
+    start = time.perf_counter()
+    data = select(await source.aload(), selection)
+    stats = SourceStats(index, repr(source), load_s=time.perf_counter() - start)
+    stats.keys = count_keys(data or {})
+    return data, stats
+
+
+async def measure_asave(index: int, source, data, changes) -> SourceStats:
+    """
+    Save changes to an asynchronous source and measure it.
+
+    Returns:
+        SourceStats: The statistics of the save.
+    """
+    start = time.perf_counter()
+    await source.asave_changes(data, changes)
+    return SourceStats(index, repr(source), save_s=time.perf_counter() - start)
+
+
+class Recorder:
+    """
+    Collects the statistics of one operation.
+
+    Used as a context manager wrapping the operation, which opens the
+    operation span and reports the statistics when the operation ends.
+    """
+
+    def __init__(
+        self,
+        instrumentation: Instrumentation,
+        operation: str,
+        attributes: Dict[str, Any] | None = None,
+    ):
+        self.stats = LoadStats(operation)
+        self._instrumentation = instrumentation
+        self._attributes = attributes or {}
+        self._span = None
+        self._start = 0.0
+
+    def __enter__(self) -> "Recorder":
+        self._span = self._instrumentation.span(
+            f"py_configorm.{self.stats.operation}", self._attributes
+        )
+        self._span.__enter__()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stats.total_s = time.perf_counter() - self._start
+        if exc_info[1] is not None:
+            self.stats.error = f"{type(exc_info[1]).__name__}: {exc_info[1]}"
+        try:
+            self._span.__exit__(*exc_info)
+        finally:
+            self._instrumentation.on_stats(self.stats)
+
+    def stage(self, name: str) -> "_Stage":
+        """Time a stage of the operation into `<name>_s`."""
+        return _Stage(self, name)
+
+    def source(self, stats: SourceStats):
+        """Record the statistics of a source."""
+        self.stats.sources.append(stats)
+        self._instrumentation.on_source(stats)
+
+
+class _Stage:
+    def __init__(self, recorder: Recorder, name: str):
+        self._recorder = recorder
+        self._name = name
+
+    def __enter__(self):
+        self._span = self._recorder._instrumentation.span(
+            f"py_configorm.{self._name}", {"operation": self._recorder.stats.operation}
+        )
+        self._span.__enter__()
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self._start
+        setattr(self._recorder.stats, f"{self._name}_s", elapsed)
+        self._span.__exit__(*exc_info)
@@ -0,0 +1,201 @@
+"""
+Schema-driven lookup of environment variables.
+
+This module maps the fields of a [py_configorm.core.ConfigSchema][] to the
+names of the environment variables holding them, and decodes variable values
+according to the field types, so that [py_configorm.sources.env_source.ENVSource][]
+and [py_configorm.sources.dotenv_source.DOTENVSource][] built with a schema
+look up only these names instead of scanning every variable.
+
+Values of fields typed as lists, tuples or sets are JSON arrays or comma
+separated items, dictionaries are JSON objects, booleans are one of `true`,
+`yes`, `on`, `1` or `false`, `no`, `off`, `0` (any case), and durations
+(`timedelta`) are seconds or a sequence of amounts and units such as `1h30m`
+or `250ms`. Any other value, and any value which fails to decode, is passed
+as is to pydantic, which reports invalid values.
+"""
+
+import functools
+import json
+import re
+import types
+from collections import abc
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Mapping, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from py_configorm.validators.schema import iter_fields, model_type
+
+# A variable name, the path of the field it holds and the decoder of its value.
+#
+EnvField = Tuple[str, Tuple[str, ...], "Callable[[str], Any] | None"]
+
+_BOOLEANS = {
+    "true": True, "yes": True, "on": True, "1": True,
+    "false": False, "no": False, "off": False, "0": False,
+}
+
+_DURATION = re.compile(r"(?:\d+(?:\.\d*)?(?:ms|s|m|h|d|w))+")
+_DURATION_PART = re.compile(r"(\d+(?:\.\d*)?)(ms|s|m|h|d|w)")
+_DURATION_UNITS = {
+    "ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800,
+}
+
+
+def decode_json(value: str) -> Any:
+    """A JSON value, the value itself if it isn't JSON."""
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def decode_list(value: str) -> Any:
+    """A JSON array, or comma separated items."""
+    if value.lstrip().startswith("["):
+        return decode_json(value)
+    return [item.strip() for item in value.split(",")] if value.strip() else []
+
+
+def decode_bool(value: str) -> Any:
+    """A boolean, the value itself if it isn't one."""
+    return _BOOLEANS.get(value.strip().lower(), value)
+
+
+def decode_duration(value: str) -> Any:
+    """A duration in seconds or units, e.g. `90`, `1h30m`, `250ms`."""
+    text = value.strip().lower()
+    try:
+        return timedelta(seconds=float(text))
+    except ValueError:
+        pass
+    if not _DURATION.fullmatch(text):
+        return value
+    return timedelta(
+        seconds=sum(
+            float(amount) * _DURATION_UNITS[unit]
+            for amount, unit in _DURATION_PART.findall(text)
+        )
+    )
+
+
+def decoder(annotation: Any) -> Callable[[str], Any] | None:
+    """
+    Decoder of the environment variable values of a field type.
+
+    `Optional[X]` and `X | None` are unwrapped.
+
+    Args:
+        annotation (Any): The field annotation.
+
+    Returns:
+        Callable | None: The decoder, `None` if pydantic converts the value
+            from a string itself.
+    """
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return decoder(args[0]) if len(args) == 1 else None
+
+    origin = get_origin(annotation) or annotation
+    if origin is bool:
+        return decode_bool
+    if origin is timedelta:
+        return decode_duration
+    if not isinstance(origin, type) or issubclass(origin, (str, bytes)):
+        return None
+    if issubclass(origin, abc.Mapping):
+        return decode_json
+    if issubclass(origin, abc.Collection):
+        return decode_list
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def env_fields(schema: Type[BaseModel], prefix: str, nesting_slug: str) -> List[EnvField]:
+    """
+    Environment variables holding the fields of a schema.
+
+    Every field which isn't a model is held by the variable named after the
+    prefix and its path joined with the nesting slug, models are held by the
+    variables of their fields.
+
+    Args:
+        schema (Type[BaseModel]): The schema.
+        prefix (str): Prefix of the variable names.
+        nesting_slug (str): Separator of the keys in variable names.
+
+    Returns:
+        list: `(name, path, decoder)` of every variable.
+    """
+    return [
+        (prefix + nesting_slug.join(path), path, decoder(field.annotation))
+        for path, field in iter_fields(schema)
+        if model_type(field.annotation) is None
+    ]
+
+
+def load_fields(
+    fields: List[EnvField], values: "Mapping[str, str] | Tuple[str | None, ...]"
+) -> Dict[str, Any]:
+    """
+    Configuration data of the variables of `env_fields` which are set.
+
+    Args:
+        fields (list): The variables, see `env_fields`.
+        values: Variable values, either a mapping of the variables found, or
+            the value of each variable in `fields` order, `None` if unset.
+
+    Returns:
+        dict: The decoded configuration data.
+    """
+    if isinstance(values, Mapping):
+        values = tuple(values.get(name) for name, _, _ in fields)
+
+    data: Dict[str, Any] = {}
+    for (_, path, decode), value in zip(fields, values):
+        if value is None:
+            continue
+        node = data
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value if decode is None else decode(value)
+    return data
+
+
+def changed_fields(
+    fields: List[EnvField], changes: "Mapping[Tuple[str, ...], Any]"
+) -> List[EnvField]:
+    """
+    Variables of `env_fields` holding changed values.
+
+    A field changed when a change was made to it, to a value inside it (e.g.
+    a key of a dictionary field), or to a model holding it.
+
+    Args:
+        fields (list): The variables, see `env_fields`.
+        changes (Mapping): The changed values keyed by path.
+
+    Returns:
+        list: The variables of the changed fields, in `fields` order.
+    """
+    inside = {path[:i] for path in changes for i in range(1, len(path) + 1)}
+    return [
+        field
+        for field in fields
+        if field[1] in inside
+        or any(field[1][:i] in changes for i in range(1, len(field[1])))
+    ]
+
+
+def encode(value: Any) -> str:
+    """Environment variable value of a field value, see the decoders."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, timedelta):
+        return str(value.total_seconds())
+    if isinstance(value, (abc.Mapping, list, tuple, set, frozenset)):
+        return json.dumps(
+            list(value) if isinstance(value, (set, frozenset)) else value, default=str
+        )
+    return str(value)
@@ -0,0 +1,391 @@
+"""
+Schema introspection helpers.
+
+This module walks [py_configorm.core.ConfigSchema][] classes to extract what
+the rest of the library needs to know about them ahead of loading.
+"""
+
+import dataclasses
+import functools
+import hashlib
+import re
+import types
+from typing import Any, Callable, Dict, Iterator, Tuple, Type, Union, get_args, get_origin
+
+from pydantic import BaseModel, ConfigDict, ValidationError, create_model
+from pydantic.fields import FieldInfo
+
+from py_configorm.merge import MergeStrategy
+
+
+def model_type(annotation: Any) -> Type[BaseModel] | None:
+    """
+    The model class of a field annotation, if any.
+
+    `Optional[Model]` and `Model | None` are unwrapped.
+
+    Args:
+        annotation (Any): The field annotation.
+
+    Returns:
+        Type[BaseModel] | None: The model class, `None` if the field isn't a model.
+    """
+    if get_origin(annotation) in (Union, types.UnionType):
+        models = [model_type(arg) for arg in get_args(annotation) if arg is not type(None)]
+        models = [model for model in models if model is not None]
+        return models[0] if len(models) == 1 else None
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    return None
+
+
+def iter_fields(
+    schema: Type[BaseModel],
+    prefix: Tuple[str, ...] = (),
+    _ancestors: Tuple[Type[BaseModel], ...] = (),
+) -> Iterator[Tuple[Tuple[str, ...], FieldInfo]]:
+    """
+    Iterate over the fields of a schema and of its nested models, depth first.
+
+    Recursive models are expanded only once along each path.
+
+    Args:
+        schema (Type[BaseModel]): The schema.
+        prefix (tuple): Path of the schema itself.
+
+    Yields:
+        tuple: The path of each field (keys as found in the configuration
+            data) and its `FieldInfo`.
+    """
+    for name, field in schema.model_fields.items():
+        path = prefix + (field.alias or name,)
+        yield path, field
+
+        model = model_type(field.annotation)
+        if model is not None and model is not schema and model not in _ancestors:
+            yield from iter_fields(model, path, _ancestors + (schema,))
+
+
+@functools.lru_cache(maxsize=None)
+def compiled_validator(schema: Type[BaseModel]) -> Callable[[Any], BaseModel]:
+    """
+    Compiled validator of a schema, built once per schema class.
+
+    The validator takes the configuration data as a dictionary, without
+    unpacking it into keyword arguments.
+
+    Args:
+        schema (Type[BaseModel]): The schema.
+
+    Returns:
+        Callable: Validates a dictionary into a schema instance.
+    """
+    return schema.__pydantic_validator__.validate_python
+
+
+@functools.lru_cache(maxsize=None)
+def section_validator(schema: Type[BaseModel], name: str) -> Callable[[dict], Any]:
+    """
+    Validator of a single top-level field of a schema, built once per field.
+
+    A field typed as a plain model is validated with the compiled validator
+    the model already has. Other fields, and invalid or missing model fields,
+    go through a single-field model carrying the field definition and the
+    schema configuration, so defaults, constraints and error locations are
+    the same as with a full validation.
+
+    Args:
+        schema (Type[BaseModel]): The schema.
+        name (str): The field name.
+
+    Returns:
+        Callable: Validates the field out of the configuration data and
+            returns its value.
+    """
+    field = schema.model_fields[name]
+    key = field.alias or name
+
+    @functools.lru_cache(maxsize=None)
+    def field_model():
+        return create_model(
+            schema.__name__,
+            __config__=schema.model_config,
+            **{name: (field.annotation, field)},
+        ).__pydantic_validator__.validate_python
+
+    def validate_field(config_data: dict) -> Any:
+        data = {key: config_data[key]} if key in config_data else {}
+        return getattr(field_model()(data), name)
+
+    if field.metadata or model_type(field.annotation) is not field.annotation:
+        return validate_field
+
+    validate_model = field.annotation.__pydantic_validator__.validate_python
+
+    def validator(config_data: dict) -> Any:
+        if key in config_data:
+            try:
+                return validate_model(config_data[key])
+            except ValidationError:
+                pass
+        elif not field.is_required():
+            return field.get_default(call_default_factory=True)
+        return validate_field(config_data)
+
+    return validator
+
+
+@functools.lru_cache(maxsize=None)
+def field_selection(schema: Type[BaseModel]) -> Dict[str, Any] | None:
+    """
+    Keys of the configuration data a schema can read.
+
+    The selection is a nested dictionary keyed by field name and alias, a
+    field mapped to `None` reads everything below it (any field which isn't
+    a model). Models allowing extra fields, validating whole before their
+    fields (`model_validator(mode="before")`), using alias paths or choices,
+    or recursive, read everything and are selected as `None`. See
+    [py_configorm.merge.select][].
+
+    Args:
+        schema (Type[BaseModel]): The schema.
+
+    Returns:
+        dict | None: The selection, `None` if the schema reads everything.
+    """
+
+    def selection(model, ancestors):
+        if model in ancestors or model.model_config.get("extra") == "allow":
+            return None
+        if any(
+            decorator.info.mode != "after"
+            for decorator in model.__pydantic_decorators__.model_validators.values()
+        ):
+            return None
+
+        result = {}
+        for name, field in model.model_fields.items():
+            if field.validation_alias is not None and not isinstance(
+                field.validation_alias, str
+            ):
+                return None
+
+            nested = model_type(field.annotation)
+            value = None if nested is None else selection(nested, ancestors + (model,))
+            for key in (name, field.alias, field.validation_alias):
+                if key is not None:
+                    result[key] = value
+        return result
+
+    return selection(schema, ())
+
+
+def merge_strategies(schema: Type[BaseModel]) -> Dict[Tuple[str, ...], MergeStrategy]:
+    """
+    Merge strategies declared on a schema.
+
+    A strategy is declared by annotating a field with a
+    [py_configorm.merge.MergeStrategy][] member,
+    `Annotated[List[str], MergeStrategy.APPEND]`.
+
+    Args:
+        schema (Type[BaseModel]): The schema.
+
+    Returns:
+        dict: Strategies keyed by field path.
+    """
+    return {
+        path: metadata
+        for path, field in iter_fields(schema)
+        for metadata in field.metadata
+        if isinstance(metadata, MergeStrategy)
+    }
+
+
+# Object addresses, which differ from one process to the next.
+#
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+@functools.lru_cache(maxsize=None)
+def schema_digest(schema: Type[BaseModel]) -> str:
+    """
+    Digest of the definition of a schema, stable across processes.
+
+    The digest covers the name, configuration and fields (annotation,
+    default, constraints, metadata) of the schema and of every nested model,
+    so it changes whenever the schema changes in a way that affects
+    validation. The code of custom validators is not covered.
+
+    Args:
+        schema (Type[BaseModel]): The schema.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    models, seen = [schema], {schema}
+    while models:
+        model = models.pop()
+        digest.update(f"{model.__module__}.{model.__qualname__}".encode())
+        digest.update(_ADDRESS.sub("", repr(model.model_config)).encode())
+        for name, field in model.model_fields.items():
+            digest.update(_ADDRESS.sub("", f"{name}: {field!r}").encode())
+
+            # Models anywhere in the annotation, e.g. `List[Model]`.
+            #
+            annotations = [field.annotation]
+            while annotations:
+                annotation = annotations.pop()
+                annotations.extend(get_args(annotation))
+                if (
+                    isinstance(annotation, type)
+                    and issubclass(annotation, BaseModel)
+                    and annotation not in seen
+                ):
+                    seen.add(annotation)
+                    models.append(annotation)
+        for name in sorted(
+            name
+            for kind in dataclasses.fields(model.__pydantic_decorators__)
+            for name in getattr(model.__pydantic_decorators__, kind.name)
+        ):
+            digest.update(name.encode())
+    return digest.hexdigest()
+
+
+# Immutable values which `freeze` shares as they are.
+#
+_SCALARS = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+def _read_only(self, *args: Any, **kwargs: Any):
+    raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+
+# Read-only containers made by `freeze`. They subclass the mutable types, so
+# that models holding them still dump as the schema declares.
+#
+class _FrozenList(list):
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+
+class _FrozenDict(dict):
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+class _FrozenSet(set):
+    __slots__ = ()
+    __ior__ = __iand__ = __isub__ = __ixor__ = _read_only
+    add = discard = remove = pop = clear = update = _read_only
+    difference_update = intersection_update = symmetric_difference_update = _read_only
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+
+@functools.lru_cache(maxsize=None)
+def frozen_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    A subclass of a model whose instances reject assignment, built once per
+    model class. Instances compare equal to instances of the model holding
+    the same values.
+
+    Args:
+        model (Type[BaseModel]): The model.
+
+    Returns:
+        Type[BaseModel]: The frozen subclass, of the same name.
+    """
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) in (model, frozen):
+            return (
+                self.__dict__ == other.__dict__
+                and self.__pydantic_extra__ == other.__pydantic_extra__
+                and self.__pydantic_private__ == other.__pydantic_private__
+            )
+        return model.__eq__(self, other)
+
+    frozen = type(model)(
+        model.__name__,
+        (model,),
+        {
+            "model_config": ConfigDict(frozen=True),
+            "__module__": model.__module__,
+            "__qualname__": model.__qualname__,
+            "__eq__": __eq__,
+        },
+    )
+    return frozen
+
+
+def freeze(value: Any, previous: Any = None) -> Any:
+    """
+    A read-only copy of a validated value.
+
+    Models are copied into instances of their frozen subclass, see
+    [py_configorm.validators.schema.frozen_model][], so assigning a field
+    raises a `ValidationError`. Lists, dictionaries and sets are copied into
+    read-only subclasses of their type, for dumps to match the schema, whose
+    methods changing them raise a `TypeError`. Changes made to the original
+    never show in the copy. Other values are shared.
+
+    Args:
+        value (Any): A validated configuration, section or value.
+        previous (Any): A read-only copy of an earlier version of the value,
+            its model fields holding the same values are reused as they are
+            instead of being copied again.
+
+    Returns:
+        Any: The read-only copy.
+    """
+    kind = type(value)
+    if kind in _SCALARS:
+        return value
+    if isinstance(value, BaseModel):
+        model = frozen_model(kind)
+        copy = model.__new__(model)
+        extra, private = value.__pydantic_extra__, value.__pydantic_private__
+        reused = previous.__dict__ if type(previous) is model else {}
+        fields = {}
+        for k, v in value.__dict__.items():
+            old = reused.get(k)
+            if type(v) in _SCALARS:
+                fields[k] = v
+            elif isinstance(v, BaseModel) and type(old) is frozen_model(type(v)) and old == v:
+                fields[k] = old
+            else:
+                fields[k] = freeze(v)
+        object.__setattr__(copy, "__dict__", fields)
+        object.__setattr__(copy, "__pydantic_fields_set__", set(value.__pydantic_fields_set__))
+        object.__setattr__(
+            copy,
+            "__pydantic_extra__",
+            None if extra is None else {k: freeze(v) for k, v in extra.items()},
+        )
+        object.__setattr__(
+            copy, "__pydantic_private__", None if private is None else dict(private)
+        )
+        return copy
+    if isinstance(value, list):
+        return _FrozenList(v if type(v) in _SCALARS else freeze(v) for v in value)
+    if isinstance(value, dict):
+        return _FrozenDict(
+            (k, v if type(v) in _SCALARS else freeze(v)) for k, v in value.items()
+        )
+    if isinstance(value, set):
+        return _FrozenSet(value)
+    return value
@@ -0,0 +1,315 @@
+"""
+ConfigWatcher: Hot reload of file-backed configuration sources.
+
+This module provides a watcher which reloads a [py_configorm.core.ConfigORM][]
+in the background whenever one of its file-backed sources changes on disk.
+
+Attributes:
+    ConfigWatcher (ConfigWatcher): The ConfigWatcher class.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import threading
+import time
+from typing import Callable, List
+
+from py_configorm.exception import ConfigORMError
+from py_configorm.sources.base import BaseSource
+
+logger = logging.getLogger(__name__)
+
+# inotify(7) constants, see <sys/inotify.h>.
+#
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+INOTIFY_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+)
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class _InotifyBackend:
+    """
+    Change detection with inotify.
+
+    Parent directories are watched rather than the files themselves, so that
+    editors and deployment tools replacing a file with a rename are noticed.
+    Only events on the watched file names are reported.
+    """
+
+    name = "inotify"
+
+    def __init__(self, sources: List[BaseSource]):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available on this platform")
+
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._names = {}
+        try:
+            for source in sources:
+                path = os.path.abspath(source.filepath)
+                for path_ in {path, os.path.realpath(path)}:
+                    directory, name = os.path.split(path_)
+                    wd = libc.inotify_add_watch(
+                        self._fd, os.fsencode(directory), INOTIFY_MASK
+                    )
+                    if wd < 0:
+                        errno = ctypes.get_errno()
+                        raise OSError(errno, os.strerror(errno), directory)
+                    self._names.setdefault(wd, set()).add(os.fsencode(name))
+        except Exception:
+            os.close(self._fd)
+            raise
+
+    def wait(self, wakeup_fd: int, timeout: float | None) -> bool:
+        """
+        Wait for a change, a wakeup or the timeout.
+
+        Events on other files of the watched directories are skipped without
+        cutting the wait short.
+
+        Returns:
+            bool: Whether one of the watched files changed.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self._fd, wakeup_fd], [], [], remaining)
+            if self._fd not in ready:
+                return False
+            if self._read_events():
+                return True
+
+    def _read_events(self) -> bool:
+        changed = False
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(buffer):
+                wd, _, _, length = INOTIFY_EVENT.unpack_from(buffer, offset)
+                offset += INOTIFY_EVENT.size
+                name = buffer[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if name in self._names.get(wd, ()):
+                    changed = True
+
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class _PollBackend:
+    """
+    Change detection by periodically comparing source fingerprints.
+    """
+
+    name = "poll"
+
+    def __init__(self, sources: List[BaseSource], interval: float):
+        self._sources = sources
+        self._interval = interval
+        self._fingerprints = [source.fingerprint() for source in sources]
+
+    def wait(self, wakeup_fd: int, timeout: float | None) -> bool:
+        """
+        Wait for the timeout (the poll interval by default) or a wakeup, then
+        check the files.
+
+        Returns:
+            bool: Whether one of the watched files changed.
+        """
+        timeout = self._interval if timeout is None else timeout
+        ready, _, _ = select.select([wakeup_fd], [], [], timeout)
+        if ready:
+            return False
+
+        fingerprints = [source.fingerprint() for source in self._sources]
+        changed = fingerprints != self._fingerprints
+        self._fingerprints = fingerprints
+        return changed
+
+    def close(self):
+        pass
+
+
+class ConfigWatcher:
+    """
+    Background hot reload of file-backed configuration sources.
+
+    The watcher waits for changes to the files of the sources of a
+    [py_configorm.core.ConfigORM][] (using inotify where available, stat
+    polling otherwise). Bursts of events, such as an editor writing a temporary
+    file and renaming it, are debounced: the reload only runs once no event
+    was seen for `debounce` seconds.
+
+    Reloads run on the watcher thread through
+    [py_configorm.core.ConfigORM.reload_config][], which swaps the new
+    validated configuration in with a single assignment. If loading or
+    validation fails, the error is logged (and passed to `on_error`) and
+    `ConfigORM.config` keeps the last good configuration.
+
+    Attributes:
+        orm (ConfigORM): The ORM to reload.
+        debounce (float): Quiet period in seconds before reloading, default is `0.2`.
+        poll_interval (float): Polling period in seconds of the polling backend,
+            default is `1.0`.
+        backend (str): `"auto"`, `"inotify"` or `"poll"`, default is `"auto"`.
+        on_reload (Callable): Called with the list of reloaded sources after
+            each successful reload which changed the configuration.
+        on_error (Callable): Called with the exception when a reload fails.
+    """
+
+    def __init__(
+        self,
+        orm,
+        debounce: float = 0.2,
+        poll_interval: float = 1.0,
+        backend: str = "auto",
+        on_reload: Callable[[List[BaseSource]], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+    ):
+        if backend not in ("auto", "inotify", "poll"):
+            raise ConfigORMError(
+                f"Unknown watcher backend '{backend}', expected one of "
+                "['auto', 'inotify', 'poll']"
+            )
+
+        self._orm = orm
+        self._debounce = debounce
+        self._poll_interval = poll_interval
+        self._backend_name = backend
+        self._on_reload = on_reload
+        self._on_error = on_error
+        self._backend = None
+        self._thread = None
+        self._stopped = threading.Event()
+        self._wakeup_r, self._wakeup_w = -1, -1
+
+    def start(self) -> "ConfigWatcher":
+        """
+        Start watching in a background thread.
+
+        Returns:
+            ConfigWatcher: This watcher.
+
+        Raises:
+            ConfigORMError: If the ORM has no file-backed source or the watcher
+                is already running.
+            OSError: If the `"inotify"` backend was requested and is not available.
+        """
+        if self._thread is not None:
+            raise ConfigORMError("Watcher is already running")
+
+        sources = [s for s in self._orm.sources if s.filepath is not None]
+        if len(sources) == 0:
+            raise ConfigORMError("No file-backed configuration sources to watch")
+
+        self._backend = self._make_backend(sources)
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="py-configorm-watcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None):
+        """
+        Stop watching and wait for the background thread to exit.
+
+        Args:
+            timeout (float | None): Maximum time to wait for the thread.
+        """
+        if self._thread is None:
+            return
+
+        self._stopped.set()
+        os.write(self._wakeup_w, b"\0")
+        self._thread.join(timeout)
+        self._thread = None
+
+        self._backend.close()
+        os.close(self._wakeup_r)
+        os.close(self._wakeup_w)
+
+    def _make_backend(self, sources: List[BaseSource]):
+        if self._backend_name in ("auto", "inotify"):
+            try:
+                return _InotifyBackend(sources)
+            except OSError:
+                if self._backend_name == "inotify":
+                    raise
+                logger.debug("inotify unavailable, falling back to polling")
+        return _PollBackend(sources, self._poll_interval)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            if not self._backend.wait(self._wakeup_r, None):
+                continue
+
+            # Debounce, wait until the files are quiet.
+            #
+            while self._backend.wait(self._wakeup_r, self._debounce):
+                pass
+            if self._stopped.is_set():
+                break
+
+            self._reload()
+
+    def _reload(self):
+        try:
+            reloaded = self._orm.reload_config()
+        except Exception as e:
+            logger.exception("Configuration reload failed, keeping last good configuration")
+            if self._on_error is not None:
+                self._on_error(e)
+            return
+
+        if reloaded:
+            logger.info("Configuration reloaded from %s", reloaded)
+            if self._on_reload is not None:
+                self._on_reload(reloaded)
+
+    def __enter__(self) -> "ConfigWatcher":
+        # `ConfigORM.watch()` returns a started watcher.
+        #
+        return self if self.running else self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def backend(self) -> str | None:
+        return self._backend.name if self._backend is not None else None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
@@ -0,0 +1,195 @@
+"""
+WriteBehind: Background, coalescing persistence of configuration changes.
+
+This module provides the writer used by [py_configorm.core.ConfigORM][] in
+write-behind mode.
+
+Attributes:
+    WriteBehind (WriteBehind): The WriteBehind class.
+"""
+
+import atexit
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehind:
+    """
+    Background writer coalescing frequent saves.
+
+    `submit` only records the changes to persist and returns. The writer
+    thread waits `window` seconds after the first pending save, so that the
+    changes submitted in the meantime are merged into it, later values
+    replacing earlier ones, then writes them all at once. However often the
+    configuration is saved, sources are written at most once per window.
+
+    `flush` writes what is pending right away and waits for it to be on
+    disk. Pending saves are also flushed at interpreter exit.
+
+    Attributes:
+        write (Callable): Writes configuration changes, keyed by path, to the
+            sources.
+        window (float): Coalescing window in seconds.
+        on_error (Callable): Called with the exception when a write fails.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[Dict[Tuple[str, ...], Any]], None],
+        window: float,
+        on_error: Callable[[Exception], None] | None = None,
+    ):
+        self._write = write
+        self._window = window
+        self._on_error = on_error
+        self._condition = threading.Condition()
+        self._pending: Dict[Tuple[str, ...], Any] | None = None
+        self._writing = False
+        self._flushing = False
+        self._closed = False
+        self._error: Exception | None = None
+        self._writes = 0
+        self._thread: threading.Thread | None = None
+
+        # The exit hook must not keep the writer alive.
+        #
+        ref = weakref.ref(self)
+
+        def exit_hook():
+            writer = ref()
+            if writer is not None:
+                writer._exit()
+
+        self._atexit = exit_hook
+        atexit.register(exit_hook)
+
+    def submit(self, changes: Dict[Tuple[str, ...], Any]):
+        """
+        Schedule configuration changes to be written, along with the pending ones.
+
+        Args:
+            changes (dict): The changed values keyed by path, see
+                [py_configorm.merge.diff][].
+
+        Raises:
+            RuntimeError: If the writer is closed.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Write-behind writer is closed")
+
+            # Changes are applied in order, a path submitted again moves
+            # after the paths submitted in between.
+            #
+            pending = {} if self._pending is None else self._pending
+            for path, value in changes.items():
+                pending.pop(path, None)
+                pending[path] = value
+            self._pending = pending
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="py-configorm-writer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Write the pending save now and wait until nothing is left to write.
+
+        Args:
+            timeout (float | None): Maximum time to wait.
+
+        Returns:
+            bool: Whether everything was written before the timeout.
+
+        Raises:
+            Exception: The error of the last write, if it failed. It is
+                raised only once.
+        """
+        with self._condition:
+            self._flushing = True
+            self._condition.notify_all()
+            done = self._condition.wait_for(
+                lambda: self._pending is None and not self._writing, timeout
+            )
+            self._flushing = False
+
+            error, self._error = self._error, None
+            if error is not None:
+                raise error
+            return done
+
+    def close(self, timeout: float | None = None):
+        """
+        Flush pending saves and stop the writer thread.
+
+        Args:
+            timeout (float | None): Maximum time to wait.
+        """
+        try:
+            self.flush(timeout)
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            if self._thread is not None:
+                self._thread.join(timeout)
+                self._thread = None
+            atexit.unregister(self._atexit)
+
+    def _exit(self):
+        try:
+            self.close()
+        except Exception:
+            logger.exception("Failed to write pending configuration changes at exit")
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return
+
+                # Coalesce, let later saves add to the pending changes until
+                # the window is over or a flush is requested.
+                #
+                deadline = time.monotonic() + self._window
+                while not (self._flushing or self._closed):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                changes, self._pending = self._pending, None
+                self._writing = True
+
+            error = None
+            try:
+                self._write(changes)
+            except Exception as e:
+                error = e
+                logger.exception("Failed to write configuration changes")
+                if self._on_error is not None:
+                    self._on_error(e)
+
+            with self._condition:
+                self._writing = False
+                self._writes += 1
+                self._error = error
+                self._condition.notify_all()
+
+    @property
+    def pending(self) -> bool:
+        """Whether a save is waiting to be written."""
+        return self._pending is not None or self._writing
+
+    @property
+    def writes(self) -> int:
+        """Number of writes done so far."""
+        return self._writes
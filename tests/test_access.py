@@ -256,8 +256,10 @@ def test_dotenv_source_rw():
     assert config["Service"]["Port"] == "8080"
 
     config["Service"]["Port"] = "4000"
-    with pytest.raises(NotImplementedError):
-        source.save(config)
+    source.save(config)
+
+    assert config_file.read_text() == dotenv_modified
+    assert source.load()["Service"]["Port"] == "4000"
 
 def test_ini_source_ro():
     config_file = Path(os.path.join(tempfile.mkdtemp(), "config.ini"))
@@ -286,5 +288,6 @@ def test_ini_source_rw():
     assert config["Service"]["port"] == "8080"
 
     config["Service"]["port"] = "4000"
-    with pytest.raises(NotImplementedError):
-        source.save(config)
\ No newline at end of file
+    source.save(config)
+
+    assert source.load()["Service"]["port"] == "4000"
@@ -1,14 +1,27 @@
+import asyncio
+import contextlib
+import dataclasses
+from datetime import timedelta
 import os
 from pathlib import Path
+import shutil
 import tempfile
+import threading
+from typing import Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, PostgresDsn, RedisDsn
+from pydantic import BaseModel, Field, PostgresDsn, RedisDsn, ValidationError
 from pydantic_core import MultiHostUrl, Url
 import pytest
-from py_configorm.core import ConfigORM, ConfigSchema
+from py_configorm import core
+from py_configorm.core import ConfigORM, ConfigSchema, ValidationStats
+from py_configorm.exception import ConfigORMError, ConfigORMSourceError
+from py_configorm.lazy import LazyConfig
 from py_configorm.sources.dotenv_source import DOTENVSource
-from py_configorm.sources.json_source import JSONSource
-from py_configorm.sources.toml_source import TOMLSource
+from py_configorm.sources.env_source import AsyncENVSource, ENVSource
+from py_configorm.sources.json_source import AsyncJSONSource, JSONSource
+from py_configorm.sources.toml_source import AsyncTOMLSource, TOMLSource
+from py_configorm.sources.yaml_source import AsyncYAMLSource
+from py_configorm.stats import Instrumentation
 
 toml = """
     [Service]
@@ -96,3 +109,689 @@ def test_invalid_config_load():
     with pytest.raises(Exception):
         cfg_orm = ConfigORM(schema=ConfigTest, sources=[json_source])
         cfg: ConfigTest = cfg_orm.load()
+
+
+def _make_sources():
+    config_file_toml = Path(os.path.join(tempfile.mkdtemp(), "config.toml"))
+    config_file_toml.write_text(toml)
+
+    config_file_json = Path(os.path.join(tempfile.mkdtemp(), "config.json"))
+    config_file_json.write_text(json)
+
+    config_file_dotenv = Path(os.path.join(tempfile.mkdtemp(), "config.env"))
+    config_file_dotenv.write_text(dotenv)
+
+    return [
+        TOMLSource(filepath=config_file_toml),
+        JSONSource(filepath=config_file_json),
+        DOTENVSource(filepath=config_file_dotenv),
+    ]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_config_load(executor):
+    sources = _make_sources()
+
+    sequential = ConfigORM(schema=ConfigTest, sources=sources).load()
+    parallel = ConfigORM(
+        schema=ConfigTest, sources=sources, parallel=True, max_workers=3,
+        executor=executor,
+    ).load()
+
+    assert parallel == sequential
+    assert parallel.Service.Port == 18080
+
+
+def test_parallel_config_load_errors():
+    sources = _make_sources()
+    sources.insert(1, JSONSource(filepath=Path(tempfile.mkdtemp()) / "missing.json"))
+
+    cfg_orm = ConfigORM(schema=ConfigTest, sources=sources, parallel=True)
+
+    with pytest.raises(ConfigORMSourceError) as exc_info:
+        cfg_orm.load()
+
+    assert len(exc_info.value.errors) == 1
+    index, source, error = exc_info.value.errors[0]
+    assert index == 1
+    assert source is sources[1]
+    assert isinstance(error, FileNotFoundError)
+    assert "missing.json" in str(exc_info.value)
+    assert isinstance(exc_info.value, ConfigORMError)
+
+
+def test_unknown_executor():
+    with pytest.raises(ConfigORMError):
+        ConfigORM(schema=ConfigTest, sources=[], executor="fiber")
+
+
+class ServiceOnlyConfigTest(ConfigSchema):
+    Service: ServiceConfigTest = Field(..., description="Service configuration")
+
+
+def test_async_config_load_save(monkeypatch):
+    monkeypatch.setenv("CFGORM_Service__Host", "example.com")
+
+    config_file_toml = Path(os.path.join(tempfile.mkdtemp(), "config.toml"))
+    config_file_toml.write_text(toml)
+
+    config_file_json = Path(os.path.join(tempfile.mkdtemp(), "config.json"))
+    config_file_json.write_text(json)
+
+    config_file_yaml = Path(os.path.join(tempfile.mkdtemp(), "config.yaml"))
+    config_file_yaml.write_text("Service:\n  Host: example.org\n")
+
+    toml_source = AsyncTOMLSource(filepath=config_file_toml)
+    json_source = AsyncJSONSource(filepath=config_file_json, readonly=False)
+    yaml_source = AsyncYAMLSource(filepath=config_file_yaml)
+    env_source = AsyncENVSource()
+
+    cfg_orm = ConfigORM(
+        schema=ServiceOnlyConfigTest,
+        sources=[toml_source, json_source, yaml_source, env_source],
+    )
+
+    async def scenario():
+        await cfg_orm.areload_config()
+        cfg_orm.config.Service.Port = 9090
+        await cfg_orm.asave()
+        return await cfg_orm.aload()
+
+    cfg: ServiceOnlyConfigTest = asyncio.run(scenario())
+
+    assert cfg.Service.Host == "example.com"
+    assert cfg.Service.Port == 9090
+    assert JSONSource(filepath=config_file_json).load()["Service"]["Port"] == 9090
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_async_config_load_off_loop(monkeypatch, lazy):
+    sources = _make_sources()
+    sources[1] = JSONSource(filepath=sources[1].filepath, readonly=False)
+    cfg_orm = ConfigORM(schema=ConfigTest, sources=sources, lazy=lazy)
+
+    # Freezing the snapshot and diffing saved changes validate and copy
+    # the whole configuration, they never run on the event loop.
+    #
+    threads = []
+    for name in ("freeze", "compiled_validator"):
+        original = getattr(core, name)
+
+        def traced(*args, original=original, **kwargs):
+            threads.append(threading.current_thread())
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(core, name, traced)
+
+    async def scenario():
+        await cfg_orm.aload()
+        cfg_orm.config.Service.Port = 9090
+        await cfg_orm.asave()
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(scenario())
+    assert threads and loop_thread not in threads
+    assert sources[1].load()["Service"]["Port"] == 9090
+
+
+def test_async_config_load_errors():
+    sources = _make_sources()
+    sources.append(AsyncJSONSource(filepath=Path(tempfile.mkdtemp()) / "missing.json"))
+
+    cfg_orm = ConfigORM(schema=ConfigTest, sources=sources)
+
+    with pytest.raises(ConfigORMSourceError) as exc_info:
+        asyncio.run(cfg_orm.aload())
+
+    assert [index for index, _, _ in exc_info.value.errors] == [3]
+
+
+def _touch(path: Path, text: str):
+    stat = path.stat()
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_incremental_reload(monkeypatch):
+    sources = _make_sources()
+    sources.append(ENVSource())
+
+    cfg_orm = ConfigORM(schema=ConfigTest, sources=sources)
+    cfg = cfg_orm.load()
+
+    assert cfg_orm.config is cfg
+    assert cfg_orm.reload_config() == []
+    assert cfg_orm.config is cfg
+
+    _touch(sources[1].filepath, json.replace("18080", "28080"))
+    assert cfg_orm.reload_config() == [sources[1]]
+    assert cfg_orm.config.Service.Port == 28080
+    assert cfg_orm.config.Service.Host == "localhost"
+
+    monkeypatch.setenv("CFGORM_Service__Host", "example.com")
+    assert cfg_orm.reload_config() == [sources[3]]
+    assert cfg_orm.config.Service.Host == "example.com"
+    assert cfg_orm.reload_config() == []
+
+
+def test_incremental_reload_keeps_config_on_error():
+    sources = _make_sources()
+
+    cfg_orm = ConfigORM(schema=ConfigTest, sources=sources, content_hash=True)
+    cfg = cfg_orm.load()
+
+    _touch(sources[1].filepath, json.replace("18080", '"not a port"'))
+    with pytest.raises(Exception):
+        cfg_orm.reload_config()
+    assert cfg_orm.config is cfg
+
+    # The failed reload is not recorded, the source is tried again.
+    _touch(sources[1].filepath, json.replace("18080", "38080"))
+    assert cfg_orm.reload_config() == [sources[1]]
+    assert cfg_orm.config.Service.Port == 38080
+
+
+def test_source_fingerprint(monkeypatch):
+    config_file = Path(os.path.join(tempfile.mkdtemp(), "config.json"))
+    config_file.write_text(json)
+    source = JSONSource(filepath=config_file)
+
+    assert source.fingerprint() == source.fingerprint()
+    assert len(source.fingerprint(content_hash=True)) == 4
+
+    # Same metadata, different content.
+    stat = config_file.stat()
+    fingerprint = source.fingerprint(content_hash=True)
+    config_file.write_text(json.replace("18080", "18081"))
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert source.fingerprint()[:3] == fingerprint[:3]
+    assert source.fingerprint(content_hash=True) != fingerprint
+
+    assert JSONSource(filepath=config_file.with_suffix(".missing")).fingerprint() is None
+
+    env_source = ENVSource(prefix="MYAPP_")
+    fingerprint = env_source.fingerprint()
+    monkeypatch.setenv("OTHER_KEY", "value")
+    assert env_source.fingerprint() == fingerprint
+    monkeypatch.setenv("MYAPP_KEY", "value")
+    assert env_source.fingerprint() != fingerprint
+
+
+def test_config_snapshots():
+    sources = _make_sources()
+
+    cfg_orm = ConfigORM(schema=ConfigTest, sources=sources)
+    assert cfg_orm.snapshot() is None
+    assert cfg_orm.generation == 0
+
+    cfg_orm.load()
+    snapshot = cfg_orm.snapshot()
+    assert snapshot.generation == cfg_orm.generation == 1
+    assert snapshot.config == cfg_orm.config
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.generation = 2
+
+    # The snapshot holds a frozen copy, changes made before a save don't
+    # show in it.
+    #
+    with pytest.raises(ValidationError):
+        snapshot.config.Service.Port = 1
+    cfg_orm.config.Service.Port = 9
+    assert snapshot.config.Service.Port == 18080
+    assert cfg_orm.snapshot() is snapshot
+
+    # Nothing changed, nothing published.
+    cfg_orm.reload_config()
+    assert cfg_orm.snapshot() is snapshot
+
+    _touch(sources[1].filepath, json.replace("18080", "28080"))
+    cfg_orm.reload_config()
+    assert cfg_orm.snapshot().generation == 2
+    assert cfg_orm.snapshot().config.Service.Port == 28080
+    assert snapshot.config.Service.Port == 18080
+    assert cfg_orm.snapshot().config.Store is snapshot.config.Store
+
+
+class TagsConfigTest(BaseModel):
+    Tags: List[str]
+    Limits: Dict[str, List[int]]
+
+
+class ContainersConfigTest(ConfigSchema):
+    Service: TagsConfigTest
+
+
+def test_config_snapshot_containers():
+    config_file = Path(os.path.join(tempfile.mkdtemp(), "config.json"))
+    config_file.write_text('{"Service": {"Tags": ["a"], "Limits": {"cpu": [1, 2]}}}')
+
+    cfg_orm = ConfigORM(
+        schema=ContainersConfigTest, sources=[JSONSource(filepath=config_file)]
+    )
+    cfg_orm.load()
+    snapshot = cfg_orm.snapshot()
+
+    with pytest.raises(TypeError):
+        snapshot.config.Service.Tags.append("x")
+    with pytest.raises(TypeError):
+        snapshot.config.Service.Limits["cpu"][0] = 4
+    with pytest.raises(TypeError):
+        snapshot.config.Service.Limits.update(mem=[1])
+
+    cfg_orm.config.Service.Tags.append("x")
+    assert snapshot.config.Service.Tags == ["a"]
+    assert snapshot.config.model_dump() == {
+        "Service": {"Tags": ["a"], "Limits": {"cpu": [1, 2]}}
+    }
+
+
+def test_incremental_validation():
+    sources = _make_sources()
+
+    cfg_orm = ConfigORM(schema=ConfigTest, sources=sources)
+    cfg = cfg_orm.load()
+
+    assert cfg_orm.validation_stats == ValidationStats(
+        revalidated=["Service", "Store", "Cache"], reused=[]
+    )
+
+    _touch(sources[1].filepath, json.replace("18080", "28080"))
+    cfg_orm.reload_config()
+
+    assert cfg_orm.validation_stats == ValidationStats(
+        revalidated=["Service"], reused=["Store", "Cache"]
+    )
+    assert cfg_orm.config.Service.Port == 28080
+    assert cfg_orm.config.Service is not cfg.Service
+    assert cfg_orm.config.Store is cfg.Store
+    assert cfg_orm.config.Cache is cfg.Cache
+
+
+def test_incremental_validation_unsaved_changes():
+    sources = _make_sources()
+
+    cfg_orm = ConfigORM(schema=ConfigTest, sources=sources)
+    cfg = cfg_orm.load()
+
+    # A section changed but not saved isn't reused, it's validated again
+    # from the sources.
+    #
+    cfg.Service.Port = 999
+    _touch(sources[1].filepath, json.replace('"Debug": true', '"Debug": false'))
+    cfg_orm.reload_config()
+
+    assert cfg_orm.validation_stats == ValidationStats(
+        revalidated=["Service", "Store"], reused=["Cache"]
+    )
+    assert cfg_orm.config.Service.Port == 18080
+    assert cfg_orm.snapshot().config.Service.Port == 18080
+    assert cfg_orm.config.Store.Debug is False
+    assert cfg_orm.dirty_paths() == []
+
+
+def test_lazy_config_load():
+    sources = _make_sources()
+    sources.append(JSONSource(filepath=Path(tempfile.mkdtemp()) / "store.json"))
+    sources[-1].filepath.write_text('{"Store": {"Url": "not a url"}}')
+
+    cfg_orm = ConfigORM(schema=ConfigTest, sources=sources, lazy=True)
+    cfg = cfg_orm.load()
+
+    assert isinstance(cfg, LazyConfig)
+    assert cfg.validated == []
+
+    assert isinstance(cfg.Service, ServiceConfigTest)
+    assert cfg.Service.Port == 18080
+    assert cfg.Service is cfg.Service
+    assert cfg.validated == ["Service"]
+
+    with pytest.raises(ValidationError):
+        cfg.Store
+    with pytest.raises(ValidationError):
+        cfg_orm.validate_all()
+    with pytest.raises(AttributeError):
+        cfg.Missing
+
+    sources[-1].filepath.write_text('{"Store": {"Debug": false}}')
+    cfg = cfg_orm.load()
+    cfg.Service.Port = 1
+
+    full = cfg_orm.validate_all()
+    assert isinstance(full, ConfigTest)
+    assert full.Service is cfg.Service
+    assert full.Store.Debug is False
+    assert cfg.model_dump()["Service"]["Port"] == 1
+
+    snapshot = cfg_orm.snapshot().config
+    assert isinstance(snapshot, LazyConfig)
+    assert snapshot.Service.Port == 18080
+    with pytest.raises(AttributeError):
+        snapshot.Service = cfg.Service
+    with pytest.raises(ValidationError):
+        snapshot.Service.Port = 1
+
+
+def test_delta_save():
+    sources = _make_sources()
+    writable = JSONSource(filepath=Path(tempfile.mkdtemp()) / "local.json", readonly=False)
+    writable.filepath.write_text('{"Service": {"Host": "example.org"}, "Extra": 1}')
+    sources.insert(2, writable)
+
+    cfg_orm = ConfigORM(schema=ServiceOnlyConfigTest, sources=sources)
+    cfg = cfg_orm.load()
+    mtime = writable.filepath.stat().st_mtime_ns
+
+    assert cfg_orm.dirty_paths() == []
+    cfg_orm.save()
+    assert writable.filepath.stat().st_mtime_ns == mtime
+
+    cfg.Service.Port = 9090
+    assert cfg_orm.dirty_paths() == ["Service.Port"]
+    cfg_orm.save()
+
+    assert writable.load() == {
+        "Service": {"Host": "example.org", "Port": 9090},
+        "Extra": 1,
+    }
+    assert os.listdir(writable.filepath.parent) == ["local.json"]
+    assert cfg_orm.dirty_paths() == []
+    assert cfg_orm.reload_config() == []
+
+    cfg.Service.Port = 18080
+    cfg_orm.save()
+    assert writable.load()["Service"]["Port"] == 18080
+
+
+def test_delta_save_lazy():
+    sources = _make_sources()
+    writable = JSONSource(filepath=Path(tempfile.mkdtemp()) / "local.json", readonly=False)
+    writable.filepath.write_text('{"Service": {"Host": "example.org", "Port": "9000"}}')
+    sources.insert(2, writable)
+
+    cfg_orm = ConfigORM(schema=ServiceOnlyConfigTest, sources=sources, lazy=True)
+    cfg = cfg_orm.load()
+
+    # Values normalized by validation aren't changes.
+    #
+    assert cfg_orm.dirty_paths() == []
+
+    cfg.Service.Host = "example.com"
+    assert cfg_orm.dirty_paths() == ["Service.Host"]
+    cfg_orm.save()
+    assert cfg_orm.dirty_paths() == []
+    assert writable.load() == {"Service": {"Host": "example.com", "Port": "9000"}}
+
+
+class ExtraConfigTest(ConfigSchema):
+    Extra: Dict[str, str] = Field(default_factory=dict, description="Extra settings")
+
+
+def test_async_delta_save(monkeypatch):
+    monkeypatch.setenv("T_Extra__a", "1")
+    monkeypatch.setenv("T_Extra__b", "2")
+
+    cfg_orm = ConfigORM(
+        schema=ExtraConfigTest, sources=[AsyncENVSource(prefix="T_", readonly=False)]
+    )
+
+    async def scenario():
+        cfg = await cfg_orm.aload()
+        del cfg.Extra["b"]
+        await cfg_orm.asave()
+
+    asyncio.run(scenario())
+
+    assert os.environ["T_Extra__a"] == "1"
+    assert "T_Extra__b" not in os.environ
+    assert cfg_orm.dirty_paths() == []
+
+
+def test_delta_save_errors():
+    sources = _make_sources()
+    writable = [
+        JSONSource(filepath=Path(tempfile.mkdtemp()) / name, readonly=False)
+        for name in ("a.json", "b.json")
+    ]
+    for source in writable:
+        source.filepath.write_text("{}")
+    sources.extend(writable)
+
+    cfg_orm = ConfigORM(schema=ServiceOnlyConfigTest, sources=sources)
+    cfg = cfg_orm.load()
+    cfg.Service.Port = 9090
+
+    shutil.rmtree(writable[1].filepath.parent)
+    with pytest.raises(ConfigORMSourceError) as exc_info:
+        cfg_orm.save()
+
+    assert [index for index, _, _ in exc_info.value.errors] == [4]
+    assert "Failed to save 1 of 5" in str(exc_info.value)
+    assert writable[0].load()["Service"]["Port"] == 9090
+    assert cfg_orm.dirty_paths() == ["Service.Port"]
+
+
+class PortOnlyServiceConfigTest(BaseModel):
+    Port: int = Field(..., description="Port bound to the service")
+
+
+class PortOnlyConfigTest(ConfigSchema):
+    Service: PortOnlyServiceConfigTest = Field(..., description="Service configuration")
+
+
+def test_config_cache(monkeypatch):
+    sources = _make_sources()
+    cache_file = Path(tempfile.mkdtemp()) / "config.cache"
+
+    cfg = ConfigORM(schema=ConfigTest, sources=sources, cache=cache_file).load()
+    assert cache_file.exists()
+
+    def fail():
+        raise AssertionError("source loaded despite the cache")
+
+    for source in sources:
+        monkeypatch.setattr(source, "load", fail)
+
+    cfg_orm = ConfigORM(schema=ConfigTest, sources=sources, cache=cache_file)
+    assert cfg_orm.load() == cfg
+    assert cfg_orm.validation_stats.reused == ["Service", "Store", "Cache"]
+    assert cfg_orm.reload_config() == []
+
+    # A different schema doesn't use the cached configuration.
+    #
+    with pytest.raises(AssertionError):
+        ConfigORM(schema=PortOnlyConfigTest, sources=sources, cache=cache_file).load()
+
+    monkeypatch.undo()
+    _touch(sources[1].filepath, json.replace("18080", "28080"))
+    monkeypatch.setattr(sources[0], "load", fail)
+    with pytest.raises(AssertionError):
+        ConfigORM(schema=ConfigTest, sources=sources, cache=cache_file).load()
+
+    monkeypatch.undo()
+    cache_file.write_bytes(b"garbage")
+    cfg = ConfigORM(schema=ConfigTest, sources=sources, cache=cache_file).load()
+    assert cfg.Service.Port == 28080
+
+
+def test_config_cache_source_options():
+    directory = Path(tempfile.mkdtemp())
+    cache_file = directory / "config.cache"
+    env_file = directory / ".env"
+    env_file.write_text(
+        "A_Service__Host=localhost\nA_Service__Port=1\n"
+        "B_Service__Host=localhost\nB_Service__Port=2\n"
+    )
+
+    # Sources reading the same file with other options don't use the
+    # cached configuration.
+    #
+    for prefix, port in (("A_", 1), ("B_", 2), ("A_", 1)):
+        cfg_orm = ConfigORM(
+            schema=ServiceOnlyConfigTest,
+            sources=[DOTENVSource(filepath=env_file, prefix=prefix)],
+            cache=cache_file,
+        )
+        assert cfg_orm.load().Service.Port == port
+
+
+@pytest.mark.parametrize("instrumentation", [False, True])
+def test_selective_load(instrumentation):
+    sources = _make_sources()
+    sources[1] = JSONSource(filepath=sources[1].filepath, readonly=False)
+
+    cfg_orm = ConfigORM(
+        schema=PortOnlyConfigTest,
+        sources=sources,
+        selective=True,
+        instrumentation=instrumentation,
+    )
+    assert cfg_orm.load().Service.Port == 18080
+
+    # Read-only sources only load what the schema reads, writable sources
+    # are loaded whole, since saving writes their data back.
+    #
+    assert cfg_orm._sources_data[0] == {"Service": {"Port": 8080}}
+    assert cfg_orm._sources_data[1]["Store"]["Debug"] is True
+    assert cfg_orm._sources_data[2] == {}
+
+
+class WorkerConfigTest(BaseModel):
+    Queues: List[str] = Field(default_factory=list)
+    Weights: Dict[str, int] = Field(default_factory=dict)
+    Enabled: bool = False
+    Timeout: timedelta = timedelta(seconds=30)
+    Retries: Optional[int] = None
+
+
+class WorkerSchemaTest(ConfigSchema):
+    Worker: WorkerConfigTest = Field(default_factory=WorkerConfigTest)
+    Tags: Tuple[str, ...] = ()
+
+
+def test_env_source_schema(monkeypatch):
+    monkeypatch.setenv("CFGORM_Worker__Queues", '["high", "low"]')
+    monkeypatch.setenv("CFGORM_Worker__Weights", '{"high": 3}')
+    monkeypatch.setenv("CFGORM_Worker__Enabled", "Yes")
+    monkeypatch.setenv("CFGORM_Worker__Timeout", "1m30s")
+    monkeypatch.setenv("CFGORM_Tags", "a, b")
+    monkeypatch.setenv("CFGORM_Worker__Unknown", "ignored")
+
+    source = ENVSource(schema=WorkerSchemaTest, readonly=False)
+    assert source.load() == {
+        "Worker": {
+            "Queues": ["high", "low"],
+            "Weights": {"high": 3},
+            "Enabled": True,
+            "Timeout": timedelta(seconds=90),
+        },
+        "Tags": ["a", "b"],
+    }
+
+    cfg_orm = ConfigORM(schema=WorkerSchemaTest, sources=[source])
+    cfg = cfg_orm.load()
+    assert cfg.Worker.Timeout == timedelta(seconds=90)
+
+    monkeypatch.setenv("CFGORM_Worker__Retries", "")  # Removed once the test ends.
+    cfg.Worker.Queues.append("batch")
+    cfg.Worker.Retries = 3
+    cfg_orm.save()
+    assert os.environ["CFGORM_Worker__Queues"] == '["high", "low", "batch"]'
+    assert os.environ["CFGORM_Worker__Retries"] == "3"
+
+    # Variables of unchanged fields are left as they were written.
+    #
+    assert os.environ["CFGORM_Worker__Enabled"] == "Yes"
+    assert os.environ["CFGORM_Worker__Timeout"] == "1m30s"
+
+    cfg = ConfigORM(schema=WorkerSchemaTest, sources=[source]).load()
+    assert cfg.Worker.Queues == ["high", "low", "batch"]
+    assert cfg.Worker.Retries == 3
+
+    config_file = Path(tempfile.mkdtemp()) / "config.env"
+    config_file.write_text(
+        'CFGORM_Worker__Queues="high,low"\nCFGORM_Worker__Enabled=yes\nCFGORM_Other=1\n'
+    )
+    source = DOTENVSource(filepath=config_file, readonly=False, schema=WorkerSchemaTest)
+    data = source.load()
+    assert data == {"Worker": {"Queues": ["high", "low"], "Enabled": True}}
+
+    data["Worker"]["Queues"] = ["batch"]
+    del data["Worker"]["Enabled"]
+    source.save_changes(data, {("Worker", "Queues"): ["batch"]})
+    assert "CFGORM_Worker__Enabled=yes\n" in config_file.read_text()
+    assert source.load() == {"Worker": {"Queues": ["batch"], "Enabled": True}}
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self):
+        self.spans, self.sources, self.stats = [], [], []
+
+    @contextlib.contextmanager
+    def span(self, name, attributes):
+        self.spans.append(name)
+        yield
+
+    def on_source(self, stats):
+        self.sources.append(stats)
+
+    def on_stats(self, stats):
+        self.stats.append(stats)
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_instrumentation(monkeypatch, parallel):
+    monkeypatch.setenv("CFGORM_Service__Host", "example.com")
+    sources = _make_sources()
+    sources.append(ENVSource())
+
+    instrumentation = RecordingInstrumentation()
+    cfg_orm = ConfigORM(
+        schema=ConfigTest,
+        sources=sources,
+        parallel=parallel,
+        instrumentation=instrumentation,
+    )
+    cfg_orm.load()
+
+    stats = cfg_orm.load_stats
+    assert stats.operation == "load"
+    assert stats.generation == 1
+    assert stats.merge_s > 0 and stats.validate_s > 0
+    assert stats.total_s >= stats.merge_s + stats.validate_s
+    assert stats.keys == 6
+    assert [s.index for s in stats.sources] == [0, 1, 2, 3]
+    assert stats.sources[0].bytes_read == len(toml)
+    assert stats.sources[0].keys == 2
+    assert stats.sources[1].read_s is not None and stats.sources[1].parse_s is not None
+    assert stats.sources[3].load_s is not None and stats.sources[3].read_s is None
+    assert instrumentation.spans == [
+        "py_configorm.load", "py_configorm.merge", "py_configorm.validate"
+    ]
+    assert instrumentation.sources == stats.sources
+    assert instrumentation.stats == [stats]
+
+    _touch(sources[1].filepath, json.replace("18080", "28080"))
+    cfg_orm.reload_config()
+    assert cfg_orm.load_stats.operation == "reload"
+    assert [s.index for s in cfg_orm.load_stats.sources] == [1]
+
+
+def test_instrumentation_save():
+    sources = _make_sources()
+    local = Path(tempfile.mkdtemp()) / "local.json"
+    local.write_text("{}")
+    sources.append(JSONSource(filepath=local, readonly=False))
+
+    cfg_orm = ConfigORM(
+        schema=ServiceOnlyConfigTest, sources=sources, instrumentation=True
+    )
+    assert cfg_orm.load_stats is None
+    cfg_orm.load().Service.Port = 9090
+    cfg_orm.save()
+
+    assert cfg_orm.save_stats.operation == "save"
+    assert [s.index for s in cfg_orm.save_stats.sources] == [3]
+    assert cfg_orm.save_stats.sources[0].save_s > 0
+
+    assert ConfigORM(schema=ServiceOnlyConfigTest, sources=sources).load_stats is None
@@ -0,0 +1,55 @@
+import subprocess
+import sys
+
+# Budget of `import py_configorm`, in microseconds. The package itself must
+# stay cheap to import, sources and their parsers are imported on first use.
+#
+IMPORT_BUDGET_US = 50_000
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _import_time(stderr: str, module: str) -> int:
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and line.split("|")[2].strip() == module:
+            return int(line.split("|")[1])
+    raise AssertionError(f"{module} not imported")
+
+
+def test_import_time_budget():
+    # Best of a few runs, the first one may pay for cold caches.
+    #
+    elapsed = min(
+        _import_time(_run("import py_configorm").stderr, "py_configorm")
+        for _ in range(3)
+    )
+    assert elapsed < IMPORT_BUDGET_US, f"import py_configorm took {elapsed}us"
+
+
+def test_lazy_imports():
+    result = _run(
+        "import sys\n"
+        "import py_configorm\n"
+        "assert 'pydantic' not in sys.modules\n"
+        "from py_configorm import ConfigORM, JSONSource, ENVSource\n"
+        "parsers = ('yaml', 'toml', 'dotenv', 'asyncio')\n"
+        "print(sorted(m for m in parsers if m in sys.modules))\n"
+        "from py_configorm import YAMLSource\n"
+        "print('yaml' in sys.modules)\n"
+    )
+    assert result.stdout.splitlines() == ["[]", "True"]
+
+
+def test_exports():
+    import py_configorm
+
+    for name in py_configorm.__all__:
+        assert getattr(py_configorm, name).__name__ == name
+    assert "INISource" in dir(py_configorm)
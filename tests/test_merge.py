@@ -0,0 +1,209 @@
+import copy
+from pathlib import Path
+import tempfile
+from typing import Annotated, Dict, List
+
+from pydantic import BaseModel, Field
+import pytest
+from py_configorm.core import ConfigORM, ConfigSchema, Provenance
+from py_configorm.exception import ConfigORMError
+from py_configorm.merge import (
+    MergeStrategy,
+    compile_strategies,
+    lookup_provenance,
+    merge,
+    select,
+)
+from py_configorm.sources.json_source import JSONSource
+from py_configorm.validators.schema import field_selection, merge_strategies
+
+base = {
+    "Service": {"Host": "localhost", "Port": 8080, "Tags": ["a", "b"]},
+    "Store": {"Url": "postgresql://localhost/store", "Options": {"Debug": False}},
+}
+
+override = {
+    "Service": {"Port": 18080, "Tags": ["b", "c"]},
+    "Store": {"Options": {"Pool": 10}},
+}
+
+
+def test_deep_merge():
+    layers = [copy.deepcopy(base), copy.deepcopy(override)]
+    merged = merge(layers)
+
+    assert merged == {
+        "Service": {"Host": "localhost", "Port": 18080, "Tags": ["b", "c"]},
+        "Store": {
+            "Url": "postgresql://localhost/store",
+            "Options": {"Debug": False, "Pool": 10},
+        },
+    }
+    assert layers == [base, override]
+
+
+def test_merge_copy_on_write():
+    layers = [copy.deepcopy(base), {"Extra": {"Key": "Value"}}, {"Service": {"Port": 1}}]
+    merged = merge(layers)
+
+    # Untouched subtrees are shared, changed ones are copies.
+    assert merged["Store"] is layers[0]["Store"]
+    assert merged["Extra"] is layers[1]["Extra"]
+    assert merged["Service"] is not layers[0]["Service"]
+    assert layers[0]["Service"]["Port"] == 8080
+
+
+def test_merge_strategies():
+    strategies = compile_strategies(
+        {
+            ("Service", "Tags"): MergeStrategy.UNIQUE,
+            ("Store", "Options"): MergeStrategy.REPLACE,
+        }
+    )
+    merged = merge([base, override], strategies)
+
+    assert merged["Service"]["Tags"] == ["a", "b", "c"]
+    assert merged["Store"]["Options"] == {"Pool": 10}
+
+    strategies = compile_strategies({("Service", "Tags"): MergeStrategy.APPEND})
+    merged = merge([base, override, {"Service": {"Tags": [{"d": 1}]}}], strategies)
+
+    assert merged["Service"]["Tags"] == ["a", "b", "b", "c", {"d": 1}]
+    assert base["Service"]["Tags"] == ["a", "b"]
+
+    strategies = compile_strategies({("Tags",): MergeStrategy.UNIQUE})
+    merged = merge([{"Tags": [{"d": 1}, "a"]}, {"Tags": [{"d": 1}, "b"]}], strategies)
+
+    assert merged["Tags"] == [{"d": 1}, "a", "b"]
+
+
+def test_merge_deep_nesting():
+    def nested(depth, leaf):
+        data = {"leaf": leaf}
+        for _ in range(depth):
+            data = {"k": data}
+        return data
+
+    merged = merge([nested(5000, 1), nested(5000, 2)])
+
+    for _ in range(5000):
+        merged = merged["k"]
+    assert merged == {"leaf": 2}
+
+
+class ServiceConfigTest(BaseModel):
+    Host: str = Field(..., description="Host running the service")
+    Tags: Annotated[List[str], MergeStrategy.APPEND] = Field(default_factory=list)
+    Limits: Annotated[Dict[str, int], MergeStrategy.REPLACE] = Field(default_factory=dict)
+
+
+class ConfigTest(ConfigSchema):
+    Service: ServiceConfigTest = Field(..., description="Service configuration")
+    Hosts: List[str] = Field(default_factory=list)
+
+
+def test_schema_merge_strategies():
+    assert merge_strategies(ConfigTest) == {
+        ("Service", "Tags"): MergeStrategy.APPEND,
+        ("Service", "Limits"): MergeStrategy.REPLACE,
+    }
+
+    config_dir = Path(tempfile.mkdtemp())
+    (config_dir / "base.json").write_text(
+        '{"Service": {"Host": "localhost", "Tags": ["a"], "Limits": {"cpu": 1, "mem": 2}},'
+        ' "Hosts": ["a"]}'
+    )
+    (config_dir / "override.json").write_text(
+        '{"Service": {"Tags": ["b"], "Limits": {"cpu": 4}}, "Hosts": ["b"]}'
+    )
+
+    cfg_orm = ConfigORM(
+        schema=ConfigTest,
+        sources=[
+            JSONSource(filepath=config_dir / "base.json"),
+            JSONSource(filepath=config_dir / "override.json"),
+        ],
+        merge_strategies={"Hosts": "unique"},
+    )
+    cfg = cfg_orm.load()
+
+    assert cfg.Service.Tags == ["a", "b"]
+    assert cfg.Service.Limits == {"cpu": 4}
+    assert cfg.Hosts == ["a", "b"]
+
+
+def test_field_selection():
+    selection = field_selection(ConfigTest)
+    assert selection == {
+        "Service": {"Host": None, "Tags": None, "Limits": None},
+        "Hosts": None,
+    }
+    assert select({**base, "Hosts": ["a"]}, selection) == {
+        "Service": {"Host": "localhost", "Tags": ["a", "b"]},
+        "Hosts": ["a"],
+    }
+
+    class ExtraConfigTest(ConfigSchema, extra="allow"):
+        Service: ServiceConfigTest
+
+    assert field_selection(ExtraConfigTest) is None
+
+
+def test_merge_provenance():
+    layers = [base, override, {"Store": {"Options": "disabled"}}]
+    provenance = {}
+    merged = merge(layers, provenance=provenance)
+
+    assert merged == merge(layers)
+    assert lookup_provenance(provenance, "Service.Port") == (
+        "Service.Port", 1, 18080, 8080
+    )
+    assert lookup_provenance(provenance, "Service.Host") == (
+        "Service", 0, "localhost", None
+    )
+    assert lookup_provenance(provenance, "Store.Options") == (
+        "Store.Options", 2, "disabled", {"Debug": False, "Pool": 10}
+    )
+    assert lookup_provenance(provenance, "Store.Options.Pool") is None
+    assert lookup_provenance(provenance, "Missing") is None
+
+    strategies = compile_strategies({("Service",): MergeStrategy.REPLACE})
+    provenance = {}
+    merge([base, override], strategies, provenance)
+
+    assert lookup_provenance(provenance, "Service.Port")[:3] == ("Service", 1, 18080)
+    assert lookup_provenance(provenance, "Service.Host") is None
+
+
+def test_config_provenance():
+    config_dir = Path(tempfile.mkdtemp())
+    (config_dir / "base.json").write_text(
+        '{"Service": {"Host": "localhost", "Tags": ["a"]}}'
+    )
+    (config_dir / "override.json").write_text('{"Service": {"Tags": ["b"]}}')
+
+    sources = [
+        JSONSource(filepath=config_dir / "base.json"),
+        JSONSource(filepath=config_dir / "override.json"),
+    ]
+
+    cfg_orm = ConfigORM(schema=ConfigTest, sources=sources)
+    cfg_orm.load()
+    with pytest.raises(ConfigORMError):
+        cfg_orm.provenance("Service.Host")
+
+    cfg_orm = ConfigORM(schema=ConfigTest, sources=sources, track_provenance=True)
+    cfg_orm.load()
+
+    record = cfg_orm.provenance("Service.Tags")
+    assert record == Provenance(
+        path="Service.Tags",
+        source_index=1,
+        source_type="JSONSource",
+        filepath=config_dir / "override.json",
+        value=["a", "b"],
+        overridden=["a"],
+    )
+    assert cfg_orm.provenance("Service.Host").filepath == config_dir / "base.json"
+    assert cfg_orm.provenance("Hosts") is None
+    assert set(cfg_orm.provenance()) == {"Service", "Service.Tags"}
@@ -0,0 +1,147 @@
+import multiprocessing
+import os
+from pathlib import Path
+import tempfile
+
+from pydantic import BaseModel, Field
+import pytest
+from py_configorm.core import ConfigORM, ConfigSchema
+from py_configorm.exception import ConfigORMError
+from py_configorm.lazy import LazyConfig
+from py_configorm.shared import ConfigCoordinator, ConfigWorker
+from py_configorm.sources.json_source import JSONSource
+
+json = """
+    {
+        "Service": {
+            "Host": "localhost",
+            "Port": 8080
+        }
+    }
+    """
+
+
+class ServiceConfigTest(BaseModel):
+    Host: str = Field(..., description="Host running the service")
+    Port: int = Field(..., description="Port bound to the service")
+
+
+class ConfigTest(ConfigSchema):
+    Service: ServiceConfigTest = Field(..., description="Service configuration")
+
+
+def _make_orm(**kwargs):
+    config_file = Path(os.path.join(tempfile.mkdtemp(), "config.json"))
+    config_file.write_text(json)
+    return ConfigORM(schema=ConfigTest, sources=[JSONSource(filepath=config_file)], **kwargs)
+
+
+def _read_port(name, queue):
+    worker = ConfigWorker(name)
+    queue.put((worker.generation, worker.config.Service.Port, worker.generation))
+    worker.close()
+
+
+def test_shared_config():
+    cfg_orm = _make_orm()
+    coordinator = cfg_orm.share()
+    worker = ConfigWorker(coordinator.name)
+    try:
+        cfg = worker.config
+        assert cfg == cfg_orm.config
+        assert worker.generation == cfg_orm.generation == 1
+
+        # Unchanged generations aren't deserialized again.
+        #
+        assert worker.config is cfg
+
+        cfg_orm.sources[0].filepath.write_text(json.replace("8080", "9090"))
+        cfg_orm.reload_config()
+        assert worker.config.Service.Port == 9090
+        assert worker.generation == 2
+    finally:
+        worker.close()
+        coordinator.close()
+
+    # Closing the coordinator stops publishing, loads go on.
+    #
+    assert coordinator.closed
+    cfg_orm.sources[0].filepath.write_text(json.replace("8080", "7070"))
+    assert cfg_orm.reload_config() == cfg_orm.sources
+    assert cfg_orm.config.Service.Port == 7070
+    assert cfg_orm.generation == 3
+    with pytest.raises(ConfigORMError):
+        coordinator.publish(3, ConfigTest, {})
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="fork is not available"
+)
+def test_shared_config_worker_process():
+    cfg_orm = _make_orm()
+    coordinator = cfg_orm.share()
+    try:
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        process = context.Process(target=_read_port, args=(coordinator.name, queue))
+        process.start()
+        assert queue.get(timeout=10) == (0, 8080, 1)
+        process.join()
+
+        # The worker detached without removing the segment.
+        #
+        assert ConfigWorker(coordinator.name).config.Service.Port == 8080
+    finally:
+        coordinator.close()
+
+
+def test_shared_config_lazy():
+    cfg_orm = _make_orm(lazy=True)
+    coordinator = cfg_orm.share()
+    worker = ConfigWorker(coordinator.name)
+    try:
+        assert isinstance(worker.config, LazyConfig)
+        assert worker.config.Service.Port == 8080
+    finally:
+        worker.close()
+        coordinator.close()
+
+
+def test_shared_config_errors():
+    with pytest.raises(ConfigORMError):
+        _make_orm().share(size=64)
+
+    coordinator = ConfigCoordinator(size=1024)
+    try:
+        assert ConfigWorker(coordinator.name).config is None
+    finally:
+        coordinator.close()
+
+    with pytest.raises(FileNotFoundError):
+        ConfigWorker(coordinator.name)
+
+
+def test_shared_config_too_large():
+    cfg_orm = _make_orm()
+    coordinator = cfg_orm.share(size=4096)
+    worker = ConfigWorker(coordinator.name)
+    try:
+        config_file = cfg_orm.sources[0].filepath
+        config_file.write_text(json.replace("localhost", "x" * 8192))
+
+        # A configuration which doesn't fit isn't made current, and is
+        # loaded again on the next reload.
+        #
+        for _ in range(2):
+            with pytest.raises(ConfigORMError):
+                cfg_orm.reload_config()
+            assert worker.config.Service.Host == cfg_orm.config.Service.Host == "localhost"
+            assert worker.generation == cfg_orm.generation == 1
+
+        config_file.write_text(json.replace("localhost", "example.org"))
+        assert cfg_orm.reload_config() == cfg_orm.sources
+        assert worker.config.Service.Host == "example.org"
+        assert worker.generation == cfg_orm.generation == 2
+    finally:
+        worker.close()
+        coordinator.close()
@@ -1,13 +1,26 @@
+import configparser
+import mmap
 import os
 from pathlib import Path
 from logging import getLogger
+from typing import List
 from py_configorm.sources.dotenv_source import DOTENVSource
 from py_configorm.sources.toml_source import TOMLSource
 from py_configorm.sources.json_source import JSONSource
 from py_configorm.sources.yaml_source import YAMLSource
 from py_configorm.sources.env_source import ENVSource
+from py_configorm.sources.ini_source import INISource
 import tempfile
 
+import pytest
+import yaml as _yaml
+from pydantic import BaseModel
+
+from py_configorm.core import ConfigSchema
+from py_configorm.exception import ConfigORMError
+from py_configorm.merge import DELETED
+from py_configorm.sources import base
+
 toml = """
     [Service]
     Host = "localhost"
@@ -52,6 +65,40 @@ def test_toml_source_load():
     assert config["Service"]["Port"] == 8080
 
 
+@pytest.mark.parametrize("reader", ["tomllib", "toml"])
+@pytest.mark.parametrize("writer", ["toml"])
+def test_toml_source_backends(tmp_path, reader, writer):
+    if base.find_spec(reader) is None:
+        pytest.skip(f"{reader} is not installed")
+
+    config_file = tmp_path / "config.toml"
+    config_file.write_text(toml)
+
+    source = TOMLSource(filepath=config_file, readonly=False, reader=reader, writer=writer)
+    assert (source.reader, source.writer) == (reader, writer)
+
+    config = source.load()
+    config["Service"]["Port"] = 4000
+    config["Service"]["Proxy"] = None
+    source.save(config)
+
+    assert source.load() == {"Service": {"Host": "localhost", "Port": 4000}}
+
+
+def test_toml_source_backend_fallback(tmp_path, monkeypatch):
+    installed = {"toml"}
+    monkeypatch.setattr(base, "find_spec", lambda name: name in installed or None)
+
+    source = TOMLSource(filepath=tmp_path / "config.toml")
+    assert (source.reader, source.writer) == ("toml", "toml")
+
+    with pytest.raises(ConfigORMError, match="not installed"):
+        TOMLSource(filepath=tmp_path / "config.toml", reader="tomllib")
+
+    with pytest.raises(ConfigORMError, match="Unknown TOML reader"):
+        TOMLSource(filepath=tmp_path / "config.toml", reader="json")
+
+
 def test_json_source_load(tmp_path):
     config_file = Path(os.path.join(tempfile.mkdtemp(), "config.json"))
     config_file.write_text(json)
@@ -66,6 +113,28 @@ def test_json_source_load(tmp_path):
     assert config["Service"]["Port"] == 8080
 
 
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_json_source_backend(tmp_path, monkeypatch, backend):
+    if backend == "orjson" and base.find_spec("orjson") is None:
+        pytest.skip("orjson is not installed")
+
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json)
+
+    source = JSONSource(filepath=config_file, readonly=False, backend=backend)
+    config = source.load()
+    config["Service"]["Port"] = 4000
+    config["Map"] = {1: "a"}
+    source.save(config)
+
+    assert source.load() == {"Service": {"Host": "localhost", "Port": 4000}, "Map": {"1": "a"}}
+
+    monkeypatch.setattr(base, "find_spec", lambda name: name == "json" or None)
+    assert JSONSource(filepath=config_file).backend == "json"
+    with pytest.raises(ConfigORMError, match="not installed"):
+        JSONSource(filepath=config_file, backend="orjson")
+
+
 def test_yaml_source_load(tmp_path):
     config_file = Path(os.path.join(tempfile.mkdtemp(), "config.yaml"))
     config_file.write_text(yaml)
@@ -80,6 +149,80 @@ def test_yaml_source_load(tmp_path):
     assert config["Service"]["Port"] == 8080
 
 
+@pytest.mark.parametrize("backend", ["libyaml", "python"])
+def test_yaml_source_backends(tmp_path, backend):
+    if backend == "libyaml" and not _yaml.__with_libyaml__:
+        pytest.skip("PyYAML is not built with libyaml")
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml)
+
+    source = YAMLSource(filepath=config_file, readonly=False, backend=backend)
+    config = source.load()
+    config["Service"]["Port"] = 4000
+    source.save(config)
+
+    assert source.backend == backend
+    assert source.load() == {"Service": {"Host": "localhost", "Port": 4000}}
+
+    with pytest.raises(ConfigORMError, match="Unknown YAML backend"):
+        YAMLSource(filepath=config_file, backend="ruamel")
+
+
+def test_yaml_source_multi_document(tmp_path):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "Service:\n  Host: localhost\n  Port: 8080\n"
+        "---\nService:\n  Port: 9090\n"
+        "---\n"
+        "---\nDebug: true\n"
+    )
+
+    assert YAMLSource(filepath=config_file, multi_document=True).load() == {
+        "Service": {"Host": "localhost", "Port": 9090},
+        "Debug": True,
+    }
+
+
+@pytest.mark.parametrize(
+    "cls, content",
+    [(TOMLSource, toml), (JSONSource, json), (YAMLSource, yaml), (DOTENVSource, dotenv)],
+)
+def test_file_source_mmap(tmp_path, cls, content):
+    config_file = tmp_path / "config"
+    config_file.write_text(content)
+
+    source = cls(filepath=config_file)
+    expected = source.load()
+
+    source.mmap_threshold = 1
+    with source._raw() as raw:
+        assert isinstance(raw, mmap.mmap)
+    assert raw.closed
+    assert source.load() == expected
+
+
+@pytest.mark.parametrize("backend", ["libyaml", "python"])
+def test_yaml_source_load_selected(tmp_path, backend):
+    if backend == "libyaml" and not _yaml.__with_libyaml__:
+        pytest.skip("PyYAML is not built with libyaml")
+
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "Defaults: &defaults {Timeout: 5, Retries: [1, 2]}\n"
+        "Service:\n  Host: localhost\n  Port: 8080\n  Unused: {a: [1, {b: 2}]}\n"
+        "Unused:\n  a: {b: [1, 2, 3], c: &c {d: 1}}\n"
+        "Client:\n  <<: *defaults\n  Extra: *c\n"
+    )
+
+    source = YAMLSource(filepath=config_file, backend=backend)
+    selection = {"Service": {"Host": None, "Port": None}, "Client": None}
+    assert source.load_selected(selection) == {
+        "Service": {"Host": "localhost", "Port": 8080},
+        "Client": {"Timeout": 5, "Retries": [1, 2], "Extra": {"d": 1}},
+    }
+
+
 def test_env_source_load(monkeypatch):
     monkeypatch.setenv("MYAPP_SERVICE__HOST", "localhost")
     monkeypatch.setenv("MYAPP_SERVICE__PORT", "8080")
@@ -92,6 +235,35 @@ def test_env_source_load(monkeypatch):
     assert config["SERVICE"]["PORT"] == "8080"
 
 
+def test_env_source_nesting(monkeypatch):
+    monkeypatch.setenv("MYAPP_SERVICE__LIMITS__CPU", "2")
+    monkeypatch.setenv("MYAPP_SERVICE", "ignored")
+    monkeypatch.setenv("MYAPP_DEBUG", "true")
+
+    source = ENVSource(prefix="MYAPP_", readonly=False)
+    config = source.load()
+    assert config == {"SERVICE": {"LIMITS": {"CPU": "2"}}, "DEBUG": "true"}
+
+    # Loads are served from a cache, but changing what was loaded doesn't
+    # change what later loads return.
+    #
+    config["SERVICE"]["LIMITS"]["CPU"] = "4"
+    assert source.load() == {"SERVICE": {"LIMITS": {"CPU": "2"}}, "DEBUG": "true"}
+
+    # Removed by monkeypatch once the test ends.
+    #
+    for name in ("MYAPP_SERVICE__LIMITS__MEM", "MYAPP_SERVICE__HOST"):
+        monkeypatch.setenv(name, "")
+    assert source.load()["SERVICE"]["HOST"] == ""
+
+    source.save({"SERVICE": {"LIMITS": {"MEM": 512}, "HOST": "localhost"}})
+    assert os.environ["MYAPP_SERVICE__LIMITS__MEM"] == "512"
+    assert source.load() == {
+        "SERVICE": {"LIMITS": {"CPU": "2", "MEM": "512"}, "HOST": "localhost"},
+        "DEBUG": "true",
+    }
+
+
 def test_dotenv_source_load(tmp_path):
     config_file = Path(os.path.join(tempfile.mkdtemp(), "config.env"))
     config_file.write_text(dotenv)
@@ -102,3 +274,176 @@ def test_dotenv_source_load(tmp_path):
     assert isinstance(config, dict)
     assert config["SERVICE"]["HOST"] == "localhost"
     assert config["SERVICE"]["PORT"] == "8080"
+
+
+def test_dotenv_source_nesting(tmp_path):
+    config_file = tmp_path / "config.env"
+    config_file.write_text(
+        "# Service\n"
+        "OTHER=other\n"
+        "export CFGORM_SERVICE__HOST='localhost'  # kept\n"
+        "CFGORM_SERVICE__LIMITS__CPU=2\n"
+        "CFGORM_DEBUG=true\n"
+        'CFGORM_NAME="${OTHER}-${CFGORM_DEBUG}"\n'
+    )
+
+    source = DOTENVSource(filepath=config_file, readonly=False)
+    assert source.load() == {
+        "SERVICE": {"HOST": "localhost", "LIMITS": {"CPU": "2"}},
+        "DEBUG": "true",
+        "NAME": "other-true",
+    }
+
+    source.save({"SERVICE": {"HOST": "localhost", "LIMITS": {"CPU": "4", "MEM": "a b"}}})
+    source.save_changes({}, {("DEBUG",): DELETED})
+    assert config_file.read_text() == (
+        "# Service\n"
+        "OTHER=other\n"
+        "export CFGORM_SERVICE__HOST='localhost'  # kept\n"
+        "CFGORM_SERVICE__LIMITS__CPU=4\n"
+        'CFGORM_NAME="${OTHER}-${CFGORM_DEBUG}"\n'
+        'CFGORM_SERVICE__LIMITS__MEM="a b"\n'
+    )
+    assert source.load()["SERVICE"]["LIMITS"] == {"CPU": "4", "MEM": "a b"}
+
+
+def test_dotenv_source_invalid_lines(tmp_path, caplog):
+    config_file = tmp_path / "config.env"
+    config_file.write_text(
+        "CFGORM_HOST='localhost\n"
+        "export CFGORM_PORT = \"8080\"  # in place\r\n"
+        "\n"
+        "  CFGORM_DEBUG=yes # removed\n"
+    )
+
+    source = DOTENVSource(filepath=config_file, readonly=False)
+    assert source.load() == {"PORT": "8080", "DEBUG": "yes"}
+    assert "could not parse statement starting at line 1" in caplog.text
+
+    source.save({"PORT": "9090"})
+    source.save_changes({}, {("DEBUG",): DELETED})
+    assert config_file.read_bytes().decode() == (
+        "CFGORM_HOST='localhost\n"
+        "export CFGORM_PORT=9090  # in place\r\n"
+        "\n"
+    )
+
+
+ini = """; shared
+[DEFAULT]
+region = eu
+
+[Service]
+Host = localhost
+port = 8080
+hosts = a, b
+url = http://%(host)s:%(port)s
+
+# Other services
+[Other]
+this line is not an option
+"""
+
+
+class IniServiceTest(BaseModel):
+    Host: str
+    port: int
+    hosts: List[str]
+
+
+class IniSchemaTest(ConfigSchema):
+    Service: IniServiceTest
+
+
+def test_ini_source_load_selected(tmp_path):
+    config_file = tmp_path / "config.ini"
+    config_file.write_text(ini)
+
+    with pytest.raises(configparser.ParsingError):
+        INISource(filepath=config_file).load()
+
+    source = INISource(filepath=config_file, schema=IniSchemaTest)
+    assert source.load_selected({"Service": {"Host": None}}) == {
+        "Service": {
+            "region": "eu",
+            "Host": "localhost",
+            "port": "8080",
+            "hosts": ["a", "b"],
+            "url": "http://localhost:8080",
+        }
+    }
+
+
+def test_ini_source_save(tmp_path):
+    config_file = tmp_path / "config.ini"
+    config_file.write_text(ini.replace("this line is not an option", "name = other"))
+
+    source = INISource(filepath=config_file, readonly=False)
+    config = source.load()
+    config["Service"]["port"] = "9090"
+    config["New"] = {"enabled": True, "ratio": "50%"}
+    source.save(config)
+
+    assert config_file.read_text() == (
+        "; shared\n"
+        "[DEFAULT]\n"
+        "region = eu\n"
+        "\n"
+        "[Service]\n"
+        "Host = localhost\n"
+        "port = 9090\n"
+        "hosts = a, b\n"
+        "url = http://%(host)s:%(port)s\n"
+        "\n"
+        "# Other services\n"
+        "[Other]\n"
+        "name = other\n"
+        "\n"
+        "[New]\n"
+        "enabled = true\n"
+        "ratio = 50%%\n"
+        "\n"
+    )
+
+    del config["New"]
+    source.save_changes(config, {("New",): DELETED})
+    assert "New" not in source.load()
+    assert source.load()["Service"]["url"] == "http://localhost:9090"
+
+
+def test_ini_source_save_schema(tmp_path):
+    config_file = tmp_path / "config.ini"
+    config_file.write_text(
+        "[Service]\n"
+        "Host = localhost  \n"
+        "Port: 8080\n"
+        "Hosts = a, b\n"
+        "Obsolete = yes\n"
+        "    continued\n"
+        "; end of service\n"
+    )
+
+    source = INISource(filepath=config_file, readonly=False, schema=IniSchemaTest)
+    config = source.load()
+    assert config["Service"]["hosts"] == ["a", "b"]
+
+    # Only the changed options are rewritten, the others keep their text
+    # even if encoding their decoded value would give another one.
+    #
+    config["Service"]["port"] = 9090
+    del config["Service"]["obsolete"]
+    config["Service"]["Debug"] = True
+    source.save_changes(config, {("Service", "port"): 9090})
+
+    assert config_file.read_text() == (
+        "[Service]\n"
+        "Host = localhost  \n"
+        "Port: 9090\n"
+        "Hosts = a, b\n"
+        "Debug = true\n"
+        "; end of service\n"
+    )
+
+    text = config_file.read_text()
+    source.save(source.load())
+    assert config_file.read_text() == text
@@ -0,0 +1,106 @@
+import os
+from pathlib import Path
+import tempfile
+import threading
+
+from pydantic import BaseModel, Field
+import pytest
+from py_configorm.core import ConfigORM, ConfigSchema
+from py_configorm.sources.json_source import JSONSource
+from py_configorm.sources.yaml_source import YAMLSource
+from py_configorm.watcher import ConfigWatcher
+
+json = """
+    {
+        "Service": {
+            "Host": "localhost",
+            "Port": 8080
+        }
+    }
+    """
+
+yaml = """
+    Service:
+        Port: 18080
+    """
+
+
+class ServiceConfigTest(BaseModel):
+    Host: str = Field(..., description="Host running the service")
+    Port: int = Field(..., description="Port bound to the service")
+
+
+class ConfigTest(ConfigSchema):
+    Service: ServiceConfigTest = Field(..., description="Service configuration")
+
+
+def _replace(path: Path, text: str):
+    # Write a new file and rename it over the old one, like most editors.
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+@pytest.fixture
+def cfg_orm():
+    config_dir = Path(tempfile.mkdtemp())
+    config_file_json = config_dir / "config.json"
+    config_file_json.write_text(json)
+    config_file_yaml = config_dir / "config.yaml"
+    config_file_yaml.write_text(yaml)
+
+    cfg_orm = ConfigORM(
+        schema=ConfigTest,
+        sources=[JSONSource(filepath=config_file_json), YAMLSource(filepath=config_file_yaml)],
+    )
+    cfg_orm.load()
+    return cfg_orm
+
+
+@pytest.mark.parametrize("backend", ["inotify", "poll"])
+def test_watcher_reload(cfg_orm, backend):
+    reloaded = threading.Event()
+    sources = []
+
+    def on_reload(sources_):
+        sources.extend(sources_)
+        reloaded.set()
+
+    watcher = ConfigWatcher(
+        cfg_orm, debounce=0.05, poll_interval=0.05, backend=backend, on_reload=on_reload
+    )
+    with watcher:
+        assert watcher.backend == backend
+
+        _replace(cfg_orm.sources[1].filepath, yaml.replace("18080", "28080"))
+        _replace(cfg_orm.sources[1].filepath, yaml.replace("18080", "38080"))
+
+        assert reloaded.wait(5)
+
+    assert not watcher.running
+    assert sources == [cfg_orm.sources[1]]
+    assert cfg_orm.config.Service.Port == 38080
+
+
+@pytest.mark.parametrize("backend", ["inotify", "poll"])
+def test_watcher_keeps_last_good_config(cfg_orm, backend):
+    failed = threading.Event()
+    errors = []
+
+    def on_error(error):
+        errors.append(error)
+        failed.set()
+
+    config = cfg_orm.config
+    # Watchers returned by `watch()` are already running.
+    #
+    with cfg_orm.watch(
+        debounce=0.05, poll_interval=0.05, backend=backend, on_error=on_error
+    ) as watcher:
+        _replace(cfg_orm.sources[1].filepath, yaml.replace("18080", "not-a-port"))
+        assert failed.wait(5)
+
+    assert not watcher.running
+    assert len(errors) == 1
+    assert cfg_orm.config is config
+    assert cfg_orm.config.Service.Port == 18080
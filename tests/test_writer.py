@@ -0,0 +1,111 @@
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import time
+
+from pydantic import BaseModel, Field
+import pytest
+from py_configorm.core import ConfigORM, ConfigSchema
+from py_configorm.exception import ConfigORMSourceError
+from py_configorm.sources.json_source import JSONSource
+
+json = """
+    {
+        "Service": {
+            "Host": "localhost",
+            "Port": 8080
+        }
+    }
+    """
+
+
+class ServiceConfigTest(BaseModel):
+    Host: str = Field(..., description="Host running the service")
+    Port: int = Field(..., description="Port bound to the service")
+
+
+class ConfigTest(ConfigSchema):
+    Service: ServiceConfigTest = Field(..., description="Service configuration")
+
+
+def _make_orm(window: float):
+    config_file = Path(os.path.join(tempfile.mkdtemp(), "config.json"))
+    config_file.write_text(json)
+    source = JSONSource(filepath=config_file, readonly=False)
+    return ConfigORM(schema=ConfigTest, sources=[source], write_behind=window), source
+
+
+def test_write_behind_coalesces_saves():
+    cfg_orm, source = _make_orm(window=10)
+    cfg = cfg_orm.load()
+
+    for port in range(1000, 2000):
+        cfg.Service.Port = port
+        cfg_orm.save()
+
+    assert source.load()["Service"]["Port"] == 8080
+    assert cfg_orm.flush(timeout=5)
+    assert cfg_orm._writer.writes == 1
+    assert source.load()["Service"]["Port"] == 1999
+    assert cfg_orm.dirty_paths() == []
+
+    cfg_orm.close()
+    with pytest.raises(RuntimeError):
+        cfg_orm.save()
+
+
+def test_write_behind_window():
+    cfg_orm, source = _make_orm(window=0.05)
+    cfg = cfg_orm.load()
+
+    cfg.Service.Port = 9090
+    cfg_orm.save()
+
+    deadline = time.monotonic() + 5
+    while cfg_orm._writer.writes == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert source.load()["Service"]["Port"] == 9090
+    cfg_orm.close()
+
+
+def test_write_behind_errors():
+    cfg_orm, source = _make_orm(window=10)
+    cfg = cfg_orm.load()
+
+    cfg.Service.Port = 9090
+    shutil.rmtree(source.filepath.parent)
+    cfg_orm.save()
+
+    with pytest.raises(ConfigORMSourceError):
+        cfg_orm.flush()
+    assert cfg_orm.dirty_paths() == ["Service.Port"]
+
+    os.makedirs(source.filepath.parent)
+    cfg_orm.save()
+    cfg_orm.close()
+    assert source.load()["Service"]["Port"] == 9090
+
+
+def test_write_behind_reload():
+    cfg_orm, source = _make_orm(window=10)
+    cfg = cfg_orm.load()
+
+    cfg.Service.Port = 9090
+    cfg_orm.save()
+
+    # The file changes and is reloaded before the save is written, the
+    # save only writes what it changed.
+    #
+    source.filepath.write_text(json.replace("localhost", "external"))
+    cfg_orm.reload_config()
+    assert cfg_orm.config.Service.Host == "external"
+
+    assert cfg_orm.flush(timeout=5)
+    assert source.load()["Service"] == {"Host": "external", "Port": 9090}
+
+    cfg_orm.reload_config()
+    assert cfg_orm.config.Service.Port == 9090
+    assert cfg_orm.dirty_paths() == []
+    cfg_orm.close()